@@ -0,0 +1,115 @@
+"""Benchmark emulator message dispatch in messages per second.
+
+Compares the uncached per-message route lookup (walking the MRO and sorting
+all routes for every message) against the cached per-class dispatch tables,
+trying all routes in order (linear) or candidates by literal prefix (prefix).
+
+$ python benchmarks/emulator_dispatch.py
+"""
+
+import time
+from functools import partial
+
+from comet.emulator.emulator import (
+    Context,
+    Emulator,
+    PrefixRouteTable,
+    RouteTable,
+    get_routes,
+    make_response,
+)
+from comet.emulator.hephy.environbox import EnvironBoxEmulator
+from comet.emulator.keithley.k2400 import K2400Emulator
+
+K2400_MESSAGES: list[str] = [
+    "*IDN?",
+    "*OPC?",
+    ":SYST:ERR:NEXT?",
+    ":SOUR:FUNC:MODE VOLT",
+    ":SOUR:VOLT:LEV 1.000000E+01",
+    ":SOUR:VOLT:LEV?",
+    ":SENS:CURR:PROT:LEV 1.000E-06",
+    ":OUTP:STAT ON",
+    ":FORM:ELEM CURR",
+    ":READ?",
+]
+
+ENVIRONBOX_MESSAGES: list[str] = [
+    "*IDN?",
+    "GET:PC_DATA ?",
+    "GET:TEMP ?",
+    "GET:HUM ?",
+    "SET:MICROSCOPE_LIGHT ON",
+    "GET:MICROSCOPE_LIGHT ?",
+    "SET:PROBCARD_LIGHT OFF",
+    "GET:PROBCARD_LIGHT ?",
+    "GET:RELAY_STATUS ?",
+    "GET:VERSION ?",
+]
+
+
+def uncached_call(emulator: Emulator, message: str):
+    """Reference implementation of the former per-message route lookup."""
+    for route in get_routes(type(emulator)):
+        args = route.match(message)
+        if args is not None:
+            response = route(emulator, *args)
+            if response is not None:
+                if isinstance(response, (list, tuple)):
+                    return [make_response(res) for res in response]
+                return make_response(response)
+            return response
+    return None
+
+
+def table_call(emulator: Emulator, table: RouteTable, message: str):
+    match = table.match(message)
+    if match is not None:
+        route, args = match
+        response = route(emulator, *args)
+        if response is not None:
+            if isinstance(response, (list, tuple)):
+                return [make_response(res) for res in response]
+            return make_response(response)
+        return response
+    return None
+
+
+def messages_per_second(handler, messages: list[str], repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for message in messages:
+            handler(message)
+    return (repeat * len(messages)) / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    repeat = 2000
+    for cls, messages in (
+        (K2400Emulator, K2400_MESSAGES),
+        (EnvironBoxEmulator, ENVIRONBOX_MESSAGES),
+    ):
+        emulator = cls(Context())
+        routes = get_routes(cls)
+        handlers = {
+            "uncached": partial(uncached_call, emulator),
+            "linear": partial(table_call, emulator, RouteTable(routes)),
+            "prefix": partial(table_call, emulator, PrefixRouteTable(routes)),
+        }
+        results = {
+            name: messages_per_second(handler, messages, repeat)
+            for name, handler in handlers.items()
+        }
+        baseline = results["uncached"]
+        print(
+            f"{cls.__name__:<24}",
+            *(
+                f"{name}: {rate:>8.0f} msg/s ({rate / baseline:.1f}x)"
+                for name, rate in results.items()
+            ),
+            sep="  ",
+        )
+
+
+if __name__ == "__main__":
+    main()
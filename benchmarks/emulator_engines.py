@@ -0,0 +1,52 @@
+"""Benchmark route matching engines on every emulator in comet.emulator.
+
+Messages are derived from the literal prefixes of each emulator's routes, only
+route matching is timed (no route methods are called).
+
+$ python benchmarks/emulator_engines.py
+"""
+
+import time
+
+from comet.emulator.emulator import (
+    RouteTable,
+    get_routes,
+    iter_emulator_classes,
+    literal_prefixes,
+    route_engines,
+)
+
+
+def sample_messages(routes) -> list[str]:
+    messages: list[str] = []
+    for route in routes:
+        for prefix in literal_prefixes(route.pattern)[:1]:
+            messages.append(prefix + (" 1" if not prefix.endswith("?") else ""))
+    return messages
+
+
+def matches_per_second(table: RouteTable, messages: list[str], repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for message in messages:
+            table.match(message)
+    return (repeat * len(messages)) / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    repeat = 200
+    print(f"{'emulator':<20}", *(f"{name:>12}" for name in route_engines), "msg/s")
+    for cls in iter_emulator_classes():
+        routes = get_routes(cls)
+        if not routes:
+            continue
+        messages = sample_messages(routes)
+        results = [
+            matches_per_second(engine(routes), messages, repeat)
+            for engine in route_engines.values()
+        ]
+        print(f"{cls.__name__:<20}", *(f"{rate:>12.0f}" for rate in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark driver calls per second against in-process emulator resources.
+
+$ python benchmarks/emulator_resource.py
+"""
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from comet.driver.keithley import K2410
+from comet.driver.rohde_schwarz import RTP164
+from comet.emulator import open_emulator
+
+
+def calls_per_second(call: Callable[[], object], repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return repeat / (time.perf_counter() - t0)
+
+
+def set_voltage_level(smu: K2410) -> None:
+    smu.voltage_level = 1.0
+
+
+def main() -> None:
+    smu = K2410(open_emulator("urn:comet:model:keithley:2410"))
+    scope = RTP164(open_emulator("urn:comet:model:rohde_schwarz:rtp164"))
+    res = scope.resource
+    benchmarks: dict[str, tuple[Callable[[], object], int]] = {
+        "K2410.identify()": (smu.identify, 20000),
+        "K2410.voltage_level = ...": (lambda: set_voltage_level(smu), 20000),
+        "K2410.voltage_level": (lambda: smu.voltage_level, 20000),
+        "K2410.measure_current()": (smu.measure_current, 20000),
+        "RTP164 waveform (list)": (
+            lambda: res.query_binary_values(":CHAN1:DATA?"),
+            2000,
+        ),
+        "RTP164 waveform (ndarray)": (
+            lambda: res.query_binary_values(":CHAN1:DATA?", container=np.ndarray),
+            2000,
+        ),
+    }
+    for name, (call, repeat) in benchmarks.items():
+        print(f"{name:<28} {calls_per_second(call, repeat):>10.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark travel time saved by planned scan paths on wafer maps.
+
+Generates synthetic 1000-point wafer maps (dies on a circular wafer with
+several contact positions per die) and compares the travel time visiting
+positions in file order (random die order) and in row by row raster order
+against nearest neighbour and 2-opt planned paths.
+
+$ python benchmarks/pathplan.py
+"""
+
+import time
+
+import numpy as np
+
+from comet.pathplan import path_travel_time, plan_path
+
+WAFER_RADIUS: float = 75000.0  # um
+VELOCITIES: tuple[float, float] = (20000.0, 20000.0)  # um/s
+
+
+def wafer_map(rng: np.random.Generator, count: int = 1000) -> np.ndarray:
+    """Return contact positions of dies inside the wafer, in random order
+    of dies as found in hand edited position files."""
+    # Slightly more dies than required, contacts are cut to count
+    pitch = WAFER_RADIUS * np.sqrt(np.pi / (count / 4)) * 0.9
+    axis = np.arange(-WAFER_RADIUS, WAFER_RADIUS, pitch) + pitch / 2
+    x, y = np.meshgrid(axis, axis)
+    dies = np.column_stack([x.ravel(), y.ravel()])
+    dies = dies[np.hypot(dies[:, 0], dies[:, 1]) < WAFER_RADIUS - pitch / 2]
+    rng.shuffle(dies)
+    offsets = np.array([[0.0, 0.0], [0.4, 0.0], [0.4, 0.4], [0.0, 0.4]]) * pitch
+    points = (dies[:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+    return points[:count]
+
+
+def main() -> None:
+    rng = np.random.default_rng(2024)
+    for _ in range(3):
+        positions = wafer_map(rng)
+        start = [0.0, 0.0]
+        file_order = path_travel_time(positions, None, VELOCITIES, start)
+        raster = np.lexsort((positions[:, 0], positions[:, 1]))
+        raster_order = path_travel_time(positions, raster, VELOCITIES, start)
+        t0 = time.perf_counter()
+        nearest = plan_path(positions, VELOCITIES, start, optimize=False)
+        t1 = time.perf_counter()
+        planned = plan_path(positions, VELOCITIES, start)
+        t2 = time.perf_counter()
+        nearest_time = path_travel_time(positions, nearest, VELOCITIES, start)
+        planned_time = path_travel_time(positions, planned, VELOCITIES, start)
+        print(
+            f"{len(positions)} points  file order: {file_order:>5.1f} s"
+            f"  raster: {raster_order:>5.1f} s"
+            f"  nearest: {nearest_time:>6.1f} s ({(t1 - t0) * 1e3:.0f} ms)"
+            f"  2-opt: {planned_time:>6.1f} s ({(t2 - t1) * 1e3:.0f} ms)"
+            f"  saved: {1 - planned_time / file_order:.1%}"
+            f" / {1 - planned_time / raster_order:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
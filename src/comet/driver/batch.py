@@ -0,0 +1,133 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .generic.instrument import InstrumentError
+from .sync import WriteSyncMixin
+
+__all__ = ["Batch", "BatchMixin", "join_scpi_messages", "join_tsp_messages"]
+
+MAX_DRAINED_ERRORS: int = 100
+
+
+def join_scpi_messages(messages: list[str]) -> list[str]:
+    """Join SCPI messages into a single message, subsequent commands are
+    prefixed with a colon to start from the root node.
+
+    >>> join_scpi_messages([":SOUR:FUNC VOLT", "*CLS", "OUTP ON"])
+    [':SOUR:FUNC VOLT;*CLS;:OUTP ON']
+    """
+    if not messages:
+        return []
+    parts = [messages[0]]
+    for message in messages[1:]:
+        if message.startswith((":", "*")):
+            parts.append(message)
+        else:
+            parts.append(f":{message}")
+    return [";".join(parts)]
+
+
+def join_tsp_messages(messages: list[str]) -> list[str]:
+    """Join TSP statements into chunks separated by `;`, common commands
+    (e.g. `*RST`) can not be part of a chunk and are kept as separate messages.
+
+    >>> join_tsp_messages(["*RST", "smua.source.func = 1", "beeper.enable = 0"])
+    ['*RST', 'smua.source.func = 1; beeper.enable = 0']
+    """
+    result: list[str] = []
+    chunk: list[str] = []
+    for message in messages:
+        if message.startswith("*"):
+            if chunk:
+                result.append("; ".join(chunk))
+                chunk.clear()
+            result.append(message)
+        else:
+            chunk.append(message)
+    if chunk:
+        result.append("; ".join(chunk))
+    return result
+
+
+class Batch:
+    """Resource proxy collecting writes to be sent combined.
+
+    Any other resource access sends collected writes first to preserve
+    the order of messages.
+    """
+
+    def __init__(self, resource: Any, join: Callable[[list[str]], list[str]]) -> None:
+        self.resource = resource
+        self.join = join
+        self.messages: list[str] = []
+        self.errors: list[InstrumentError] = []
+
+    def __getattr__(self, name: str) -> Any:
+        self.flush()
+        return getattr(self.resource, name)
+
+    def write(self, message: str, *args, **kwargs) -> int:
+        self.messages.append(message)
+        return len(message)
+
+    def flush(self) -> None:
+        """Send collected writes."""
+        messages = self.join(self.messages)
+        self.messages.clear()
+        for message in messages:
+            self.resource.write(message)
+
+
+class BatchMixin(WriteSyncMixin):
+    """Mixin for drivers combining writes into single messages."""
+
+    def join_messages(self, messages: list[str]) -> list[str]:
+        """Return messages to be sent for a list of batched writes."""
+        return join_scpi_messages(messages)
+
+    @contextmanager
+    def batch(self) -> Iterator[Batch]:
+        """Context collecting writes to be sent as a single message followed
+        by a single operation complete query. Errors are drained at the end of
+        the block using `next_error` and collected in attribute `errors`.
+
+        >>> with smu.batch() as batch:
+        ...     smu.function = smu.FUNCTION_VOLTAGE
+        ...     smu.voltage_range = 200.0
+        ...     smu.current_compliance = 1e-6
+        >>> batch.errors
+        []
+        """
+        if isinstance(self.resource, Batch):
+            yield self.resource  # nested batch
+            return
+        resource = self.resource
+        batch = Batch(resource, self.join_messages)
+        self.resource = batch
+        try:
+            with self.deferred_sync():
+                yield batch
+                batch.flush()
+        except BaseException:
+            # Settings recorded for discarded writes are no longer valid
+            invalidate = getattr(self, "invalidate", None)
+            if invalidate is not None:
+                invalidate()
+            raise
+        finally:
+            self.resource = resource
+        batch.errors.extend(self.drain_errors())
+
+    def drain_errors(self) -> list[InstrumentError]:
+        """Return all errors from the instrument's error queue."""
+        errors: list[InstrumentError] = []
+        next_error = getattr(self, "next_error", None)
+        if next_error is None:
+            return errors
+        for _ in range(MAX_DRAINED_ERRORS):
+            error = next_error()
+            if error is None:
+                break
+            errors.append(error)
+        return errors
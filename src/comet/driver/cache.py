@@ -0,0 +1,106 @@
+import functools
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+__all__ = ["StateCache", "StateCacheMixin", "cached_getter", "cached_setter"]
+
+T = TypeVar("T")
+
+_missing = object()
+
+
+class StateCache:
+    """Write-through cache of instrument settings.
+
+    Settings written or read are recorded by key. Setters skip writing values
+    already applied, in trusted mode getters answer from cache without
+    querying the instrument.
+    """
+
+    def __init__(self, trusted: bool = False, enabled: bool = True) -> None:
+        self.trusted: bool = trusted
+        self.enabled: bool = enabled
+        self.values: dict[str, Any] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.values
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def is_current(self, key: str, value: Any) -> bool:
+        """Return True if value is known to be applied for key."""
+        return self.enabled and self.values.get(key, _missing) == value
+
+    def update(self, key: str, value: Any) -> None:
+        if self.enabled:
+            self.values[key] = value
+
+    def invalidate(self, *keys: str) -> None:
+        """Invalidate cached values for keys, or all values if no keys given."""
+        if keys:
+            for key in keys:
+                self.values.pop(key, None)
+        else:
+            self.values.clear()
+
+
+class StateCacheMixin:
+    """Mixin for drivers caching instrument settings.
+
+    Settings changed by other means than the driver's properties (e.g. raw
+    writes or front panel operation) require a call to `invalidate`.
+    """
+
+    @property
+    def state_cache(self) -> StateCache:
+        state_cache = self.__dict__.get("_state_cache")
+        if state_cache is None:
+            state_cache = StateCache()
+            self.__dict__["_state_cache"] = state_cache
+        return state_cache
+
+    @state_cache.setter
+    def state_cache(self, state_cache: StateCache) -> None:
+        self.__dict__["_state_cache"] = state_cache
+
+    def invalidate(self, *keys: str) -> None:
+        """Invalidate cached settings for keys, or all settings if no keys
+        given.
+
+        >>> smu.invalidate("voltage_range")
+        """
+        self.state_cache.invalidate(*keys)
+
+
+def cached_getter(method: Callable[[Any], T]) -> Callable[[Any], T]:
+    """Decorator for property getters recording the returned value, in
+    trusted mode a cached value is returned without calling the getter."""
+    key = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: StateCacheMixin) -> T:
+        state_cache = self.state_cache
+        if state_cache.trusted and state_cache.enabled and key in state_cache:
+            return state_cache.get(key)
+        value = method(self)
+        state_cache.update(key, value)
+        return value
+
+    return wrapper
+
+
+def cached_setter(method: Callable[[Any, T], None]) -> Callable[[Any, T], None]:
+    """Decorator for property setters skipping values already applied."""
+    key = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: StateCacheMixin, value: T) -> None:
+        state_cache = self.state_cache
+        if state_cache.is_current(key, value):
+            return
+        state_cache.invalidate(key)
+        method(self, value)
+        state_cache.update(key, value)
+
+    return wrapper
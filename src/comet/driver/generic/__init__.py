@@ -15,10 +15,11 @@ from .motion_controller import (
 )
 from .oscilloscope import Oscilloscope, OscilloscopeChannel
 from .source_meter_unit import SourceMeterUnit
-from .switching_matrix import SwitchingMatrix
+from .switching_matrix import ChannelSet, SwitchingMatrix
 
 __all__ = [
     "BeeperMixin",
+    "ChannelSet",
     "DigitalMultiMeter",
     "Electrometer",
     "ErrorQueueMixin",
@@ -1,13 +1,55 @@
+import math
+import time
 from abc import abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
 from ..driver import Driver
 from .instrument import Instrument
 
-__all__ = ["MotionController", "MotionControllerAxis"]
+__all__ = ["MotionController", "MotionControllerAxis", "wait_until_idle"]
 
 Position = Iterable[float]
 
+MIN_POLL_INTERVAL: float = 0.01
+MAX_POLL_INTERVAL: float = 0.5
+POLL_BACKOFF: float = 1.5
+
+
+def wait_until_idle(
+    is_moving: Callable[[], bool],
+    timeout: float | None = None,
+    expected: float = 0.0,
+    min_interval: float = MIN_POLL_INTERVAL,
+    max_interval: float = MAX_POLL_INTERVAL,
+) -> int:
+    """Poll `is_moving` until it returns False, returns the number of polls.
+
+    Before the `expected` duration of the movement has elapsed polls halve
+    the remaining time, so polling is fast near the expected arrival. After
+    that the poll interval backs off from `min_interval` to `max_interval`.
+    Raises `TimeoutError` if still moving after `timeout` seconds.
+    """
+    start = time.monotonic()
+    interval = min_interval
+    polls = 0
+    while True:
+        polls += 1
+        if not is_moving():
+            return polls
+        elapsed = time.monotonic() - start
+        if timeout is not None and elapsed >= timeout:
+            raise TimeoutError(f"Movement not complete after {timeout:.3f} s")
+        remaining = expected - elapsed
+        if remaining > min_interval:
+            delay = remaining / 2
+        else:
+            delay = interval
+            interval = min(interval * POLL_BACKOFF, max_interval)
+        delay = max(delay, min_interval)
+        if timeout is not None:
+            delay = min(delay, max(timeout - elapsed, 0))
+        time.sleep(delay)
+
 
 class MotionControllerAxis(Driver):
     def __init__(self, resource, index: int) -> None:
@@ -38,6 +80,19 @@ class MotionControllerAxis(Driver):
     @abstractmethod
     def is_moving(self) -> bool: ...
 
+    def wait_until_idle(
+        self,
+        timeout: float | None = None,
+        expected: float = 0.0,
+        min_interval: float = MIN_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> int:
+        """Wait until axis movement is complete, returns the number of polls.
+        See function `wait_until_idle` for details."""
+        return wait_until_idle(
+            lambda: self.is_moving, timeout, expected, min_interval, max_interval
+        )
+
 
 class MotionController(Instrument):
     @abstractmethod
@@ -80,3 +135,46 @@ class MotionController(Instrument):
     @joystick_enabled.setter
     @abstractmethod
     def joystick_enabled(self, value: bool) -> None: ...
+
+    def wait_until_idle(
+        self,
+        timeout: float | None = None,
+        expected: float = 0.0,
+        min_interval: float = MIN_POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+    ) -> int:
+        """Wait until movement is complete, returns the number of polls.
+
+        Polling is fast near the `expected` duration of the movement in
+        seconds and backs off afterwards, raises `TimeoutError` if still
+        moving after `timeout` seconds.
+
+        >>> mc.move_absolute([10.0, 20.0, 0.0])
+        >>> mc.wait_until_idle(timeout=60.0)
+        """
+        return wait_until_idle(
+            lambda: self.is_moving, timeout, expected, min_interval, max_interval
+        )
+
+    def move_absolute_and_wait(
+        self,
+        position: Position,
+        timeout: float | None = None,
+        velocity: float | None = None,
+    ) -> int:
+        """Move to absolute position and wait until movement is complete,
+        returns the number of polls.
+
+        With `velocity` (in position units per second) the duration of the
+        movement is estimated from the distance to the current position.
+
+        >>> mc.move_absolute_and_wait([10.0, 20.0, 0.0], timeout=60.0, velocity=5.0)
+        """
+        position = list(position)
+        expected = 0.0
+        if velocity:
+            current = self.position
+            distance = math.hypot(*(b - a for a, b in zip(current, position)))
+            expected = distance / velocity
+        self.move_absolute(position)
+        return self.wait_until_idle(timeout, expected)
@@ -1,5 +1,8 @@
+import time
 from abc import abstractmethod
 
+import numpy as np
+
 from .instrument import Instrument
 
 __all__ = ["SourceMeterUnit"]
@@ -95,3 +98,23 @@ class SourceMeterUnit(Instrument):
 
     @abstractmethod
     def measure_current(self) -> float: ...
+
+    def measure_current_many(
+        self, count: int, interval: float | None = None
+    ) -> np.ndarray:
+        """Return `count` current readings taken `interval` seconds apart.
+
+        This software fallback calls `measure_current` repeatedly, drivers
+        override it using the instrument's reading buffer.
+        """
+        if count < 1:
+            raise ValueError(f"Invalid reading count: {count!r}")
+        readings = np.empty(count, dtype=np.float64)
+        t0 = time.monotonic()
+        for index in range(count):
+            if interval and index:
+                delay = t0 + index * interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            readings[index] = self.measure_current()
+        return readings
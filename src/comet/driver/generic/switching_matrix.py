@@ -1,9 +1,91 @@
+import functools
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import ClassVar
 
 from .instrument import Instrument
 
-__all__ = ["SwitchingMatrix"]
+__all__ = ["ChannelSet", "SwitchingMatrix"]
+
+
+@functools.cache
+def _channel_indices(channels: tuple[str, ...]) -> dict[str, int]:
+    return {channel: index for index, channel in enumerate(channels)}
+
+
+class ChannelSet:
+    """Immutable set of switching matrix channels, stored as bitset over a
+    tuple of available channels.
+
+    >>> channels = ChannelSet.from_channels(("A1", "A2", "B1"), ["B1", "A1"])
+    >>> list(channels)
+    ['A1', 'B1']
+    >>> list(channels - ChannelSet.from_channels(("A1", "A2", "B1"), ["A1"]))
+    ['B1']
+    """
+
+    __slots__ = ("channels", "mask")
+
+    def __init__(self, channels: tuple[str, ...], mask: int = 0) -> None:
+        self.channels: tuple[str, ...] = channels
+        self.mask: int = mask
+
+    @classmethod
+    def from_channels(
+        cls, channels: tuple[str, ...], selected: Iterable[str]
+    ) -> "ChannelSet":
+        indices = _channel_indices(channels)
+        mask = 0
+        for channel in selected:
+            index = indices.get(channel)
+            if index is None:
+                raise ValueError(f"Invalid channel: {channel!r}")
+            mask |= 1 << index
+        return cls(channels, mask)
+
+    def _combine(self, other: "ChannelSet", mask: int) -> "ChannelSet":
+        if other.channels != self.channels:
+            raise ValueError("Channel sets of different switching matrices")
+        return type(self)(self.channels, mask)
+
+    def __or__(self, other: "ChannelSet") -> "ChannelSet":
+        return self._combine(other, self.mask | other.mask)
+
+    def __and__(self, other: "ChannelSet") -> "ChannelSet":
+        return self._combine(other, self.mask & other.mask)
+
+    def __sub__(self, other: "ChannelSet") -> "ChannelSet":
+        return self._combine(other, self.mask & ~other.mask)
+
+    def __iter__(self) -> Iterator[str]:
+        mask = self.mask
+        while mask:
+            bit = mask & -mask
+            yield self.channels[bit.bit_length() - 1]
+            mask ^= bit
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return bool(self.mask)
+
+    def __contains__(self, channel: object) -> bool:
+        if not isinstance(channel, str):
+            return False
+        index = _channel_indices(self.channels).get(channel)
+        return index is not None and bool(self.mask >> index & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChannelSet):
+            return NotImplemented
+        return self.channels == other.channels and self.mask == other.mask
+
+    def __hash__(self) -> int:
+        return hash((self.channels, self.mask))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
 
 
 class SwitchingMatrix(Instrument):
@@ -21,3 +103,38 @@ class SwitchingMatrix(Instrument):
 
     @abstractmethod
     def open_all_channels(self) -> None: ...
+
+    @property
+    def closed_channel_set(self) -> ChannelSet:
+        return ChannelSet.from_channels(type(self).CHANNELS, self.closed_channels)
+
+    def apply_channels(self, channels: Iterable[str]) -> None:
+        """Close channels and open all other channels, switching only relays
+        changing their state.
+
+        >>> matrix.apply_channels(["1A01", "1B02"])
+
+        Channels not listed in `CHANNELS` fall back to comparing the
+        channel names of `closed_channels`.
+        """
+        channels = list(channels)
+        try:
+            target = ChannelSet.from_channels(type(self).CHANNELS, channels)
+            closed = self.closed_channel_set
+        except ValueError:
+            closed_channels = set(self.closed_channels)
+            opening = sorted(closed_channels.difference(channels))
+            closing = sorted(set(channels).difference(closed_channels))
+        else:
+            opening, closing = list(closed - target), list(target - closed)
+        if opening or closing:
+            self.switch_channels(opening, closing)
+
+    def switch_channels(
+        self, open_channels: list[str], close_channels: list[str]
+    ) -> None:
+        """Open and close channels, channels to be opened are opened first."""
+        if open_channels:
+            self.open_channels(open_channels)
+        if close_channels:
+            self.close_channels(close_channels)
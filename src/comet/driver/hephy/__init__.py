@@ -1,6 +1,6 @@
 from .brandbox import BrandBox
 from .corvuscontroller import CorvusController
-from .environbox import EnvironBox
+from .environbox import EnvironBox, EnvironBoxSampler
 from .pilascontroller import PilasController
 from .shuntbox import ShuntBox
 
@@ -8,6 +8,7 @@ __all__ = [
     "BrandBox",
     "CorvusController",
     "EnvironBox",
+    "EnvironBoxSampler",
     "PilasController",
     "ShuntBox",
 ]
@@ -1,9 +1,16 @@
+import logging
 import re
-from typing import Any
+import threading
+import time
+from typing import Any, NamedTuple, Self
+
+import numpy as np
 
 from comet.driver.generic import Instrument, InstrumentError
 
-__all__ = ["EnvironBox"]
+__all__ = ["EnvironBox", "EnvironBoxSampler", "PCData"]
+
+logger = logging.getLogger(__name__)
 
 ERROR_MESSAGES: dict[int, str] = {
     1: "RTC not running",
@@ -31,62 +38,122 @@ def parse_error(response: str) -> InstrumentError | None:
     return None
 
 
-def parse_pc_data(response: str) -> dict[str, Any]:
+class PCData(NamedTuple):
+    """Snapshot of all values returned by `GET:PC_DATA ?`."""
+
+    sensor_count: int
+    box_humidity: float
+    box_temperature: float
+    box_dewpoint: float
+    pid_status: bool
+    pid_setpoint: float
+    pid_input: float
+    pid_output: float
+    pid_kp_1: float
+    pid_ki_1: float
+    pid_kd_1: float
+    pid_min: float
+    pid_max: float
+    pid_control_mode: int
+    pid_kp_2: float
+    pid_ki_2: float
+    pid_kd_2: float
+    parameter_set: int
+    parameter_threshold: float
+    hum_flow_dir: int
+    pid_threshold: float
+    vac_valve_current: float
+    vac_valve_count: int
+    power_microscope_ctrl: bool
+    power_box_light: bool
+    power_probecard_light: bool
+    power_laser_sensor: bool
+    power_probecard_camera: bool
+    power_microscope_camera: bool
+    power_microscope_light: bool
+    box_light: bool
+    box_door: bool
+    safety_alert: bool
+    stepper_motor_control: bool
+    air_flow_sensor: bool
+    vac_flow_sensor: bool
+    test_led: bool
+    discharge_time: float
+    box_lux: float
+    pt100_1: float
+    pt100_2: float
+    pid_sample_time: float
+    pid_prop_mode: int
+    pt100_1_enabled: bool
+    pt100_2_enabled: bool
+
+
+def parse_pc_snapshot(response: str) -> PCData:
     values = response.split(",")
     relay_status = int(values[23])
-    return {
-        "sensor_count": int(values[0]),
-        "box_humidity": float(values[1]),
-        "box_temperature": float(values[2]),
-        "box_dewpoint": float(values[3]),
-        "pid_status": bool(int(values[4])),
-        "pid_setpoint": float(values[5]),
-        "pid_input": float(values[6]),
-        "pid_output": float(values[7]),
-        "pid_kp_1": float(values[8]),
-        "pid_ki_1": float(values[9]),
-        "pid_kd_1": float(values[10]),
-        "pid_min": float(values[11]),
-        "pid_max": float(values[12]),
-        "pid_control_mode": int(values[13]),
-        "pid_kp_2": float(values[14]),
-        "pid_ki_2": float(values[15]),
-        "pid_kd_2": float(values[16]),
-        "parameter_set": int(values[17]),
-        "parameter_threshold": float(values[18]),
-        "hum_flow_dir": int(values[19]),
-        "pid_threshold": float(values[20]),
-        "vac_valve_current": float(values[21]),
-        "vac_valve_count": int(values[22]),
-        "power_microscope_ctrl": test_bit(relay_status, 0),
-        "power_box_light": test_bit(relay_status, 1),
-        "power_probecard_light": test_bit(relay_status, 2),
-        "power_laser_sensor": test_bit(relay_status, 3),
-        "power_probecard_camera": test_bit(relay_status, 4),
-        "power_microscope_camera": test_bit(relay_status, 5),
-        "power_microscope_light": test_bit(relay_status, 6),
-        "box_light": bool(int(values[24])),
-        "box_door": bool(int(values[25])),
-        "safety_alert": bool(int(values[26])),
-        "stepper_motor_control": bool(int(values[27])),
-        "air_flow_sensor": bool(int(values[28])),
-        "vac_flow_sensor": bool(int(values[29])),
-        "test_led": bool(int(values[30])),
-        "discharge_time": float(values[31]),
-        "box_lux": float(values[32]),
-        "pt100_1": float(values[33]),
-        "pt100_2": float(values[34]),
-        "pid_sample_time": float(values[35]),
-        "pid_prop_mode": int(values[36]),
-        "pt100_1_enabled": bool(int(values[37])),
-        "pt100_2_enabled": bool(int(values[38])),
-    }
+    return PCData(
+        sensor_count=int(values[0]),
+        box_humidity=float(values[1]),
+        box_temperature=float(values[2]),
+        box_dewpoint=float(values[3]),
+        pid_status=bool(int(values[4])),
+        pid_setpoint=float(values[5]),
+        pid_input=float(values[6]),
+        pid_output=float(values[7]),
+        pid_kp_1=float(values[8]),
+        pid_ki_1=float(values[9]),
+        pid_kd_1=float(values[10]),
+        pid_min=float(values[11]),
+        pid_max=float(values[12]),
+        pid_control_mode=int(values[13]),
+        pid_kp_2=float(values[14]),
+        pid_ki_2=float(values[15]),
+        pid_kd_2=float(values[16]),
+        parameter_set=int(values[17]),
+        parameter_threshold=float(values[18]),
+        hum_flow_dir=int(values[19]),
+        pid_threshold=float(values[20]),
+        vac_valve_current=float(values[21]),
+        vac_valve_count=int(values[22]),
+        power_microscope_ctrl=test_bit(relay_status, 0),
+        power_box_light=test_bit(relay_status, 1),
+        power_probecard_light=test_bit(relay_status, 2),
+        power_laser_sensor=test_bit(relay_status, 3),
+        power_probecard_camera=test_bit(relay_status, 4),
+        power_microscope_camera=test_bit(relay_status, 5),
+        power_microscope_light=test_bit(relay_status, 6),
+        box_light=bool(int(values[24])),
+        box_door=bool(int(values[25])),
+        safety_alert=bool(int(values[26])),
+        stepper_motor_control=bool(int(values[27])),
+        air_flow_sensor=bool(int(values[28])),
+        vac_flow_sensor=bool(int(values[29])),
+        test_led=bool(int(values[30])),
+        discharge_time=float(values[31]),
+        box_lux=float(values[32]),
+        pt100_1=float(values[33]),
+        pt100_2=float(values[34]),
+        pid_sample_time=float(values[35]),
+        pid_prop_mode=int(values[36]),
+        pt100_1_enabled=bool(int(values[37])),
+        pt100_2_enabled=bool(int(values[38])),
+    )
+
+
+def parse_pc_data(response: str) -> dict[str, Any]:
+    return parse_pc_snapshot(response)._asdict()
 
 
 class EnvironBox(Instrument):
     def __init__(self, resource) -> None:
         super().__init__(resource)
         self._error_queue: list[InstrumentError] = []
+        self._pc_data: PCData | None = None
+        self._pc_data_timestamp: float = 0.0
+        # Maximum age in seconds of PC_DATA snapshots shared by getters
+        self.pc_data_max_age: float = 0.0
+        # Serializes access to the resource, shared with EnvironBoxSampler
+        self.lock = threading.RLock()
 
     def identify(self) -> str:
         return self.query("*IDN?")
@@ -117,6 +184,8 @@ class EnvironBox(Instrument):
     PID_CONTROL_ON: bool = True
 
     def get_pid_control(self) -> bool:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().pid_status
         return bool(int(self.query("GET:CTRL ?")))
 
     def set_pid_control(self, state: bool) -> None:
@@ -127,7 +196,7 @@ class EnvironBox(Instrument):
     PID_CONTROL_MODE_DEW: str = "DEW"
 
     def get_pid_control_mode(self) -> str:
-        value = self.get_data()["pid_control_mode"]
+        value = self.get_pc_data().pid_control_mode
         return {1: self.PID_CONTROL_MODE_HUM, 2: self.PID_CONTROL_MODE_DEW}[value]
 
     def set_pid_control_mode(self, mode: str) -> None:
@@ -150,30 +219,44 @@ class EnvironBox(Instrument):
         self.write(f"SET:PID_DOOR_STOP {value}")
 
     def get_box_humidity(self) -> float:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().box_humidity
         return float(self.query("GET:HUM ?"))
 
     def get_box_temperature(self) -> float:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().box_temperature
         return float(self.query("GET:TEMP ?"))
 
     def get_box_lux(self) -> float:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().box_lux
         return float(self.query("GET:LUX ?"))
 
     BOX_DOOR_CLOSED: bool = False
     BOX_DOOR_OPEN: bool = True
 
     def get_box_door_state(self) -> bool:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().box_door
         return bool(float(self.query("GET:DOOR ?")))
 
     def get_chuck_temperature(self) -> float:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().pt100_1
         return float(self.query("GET:PT100_1 ?"))
 
     def get_chuck_block_temperature(self) -> float:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().pt100_2
         return float(self.query("GET:PT100_2 ?"))
 
     BOX_LIGHT_OFF: bool = False
     BOX_LIGHT_ON: bool = True
 
     def get_box_light(self) -> bool:
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().box_light
         value = self.query("GET:LIGHT ?")
         return {"0": self.BOX_LIGHT_OFF, "1": self.BOX_LIGHT_ON}[value]
 
@@ -185,7 +268,7 @@ class EnvironBox(Instrument):
     MICROSCOPE_LIGHT_ON: bool = True
 
     def get_microscope_light(self) -> bool:
-        value = self.get_data()["power_microscope_light"]
+        value = self.get_pc_data().power_microscope_light
         return {False: self.BOX_LIGHT_OFF, True: self.BOX_LIGHT_ON}[value]
 
     def set_microscope_light(self, state: bool) -> None:
@@ -196,7 +279,7 @@ class EnvironBox(Instrument):
     PROBECARD_LIGHT_ON: bool = True
 
     def get_probecard_light(self) -> bool:
-        value = self.get_data()["power_probecard_light"]
+        value = self.get_pc_data().power_probecard_light
         return {False: self.BOX_LIGHT_OFF, True: self.BOX_LIGHT_ON}[value]
 
     def set_probecard_light(self, state: bool) -> None:
@@ -208,6 +291,8 @@ class EnvironBox(Instrument):
 
     def get_test_led(self) -> bool:
         """Get state of test LED."""
+        if self.pc_data_max_age > 0:
+            return self.get_pc_data().test_led
         value = self.query("GET:TEST_LED ?")
         return {"0": self.TEST_LED_OFF, "1": self.TEST_LED_ON}[value]
 
@@ -233,7 +318,29 @@ class EnvironBox(Instrument):
 
     def get_data(self) -> dict[str, Any]:
         """Return dictionary of PC_DATA."""
-        return parse_pc_data(self.query("GET:PC_DATA ?"))
+        return self.get_pc_data()._asdict()
+
+    def get_pc_data(self, max_age: float | None = None) -> PCData:
+        """Return PC_DATA snapshot, a snapshot not older than `max_age`
+        seconds (default is `pc_data_max_age`) is returned without querying.
+
+        >>> box.pc_data_max_age = 1.0
+        >>> box.get_box_humidity(), box.get_box_temperature()  # single query
+        """
+        if max_age is None:
+            max_age = self.pc_data_max_age
+        with self.lock:
+            now = time.monotonic()
+            if self._pc_data is not None and now - self._pc_data_timestamp < max_age:
+                return self._pc_data
+            pc_data = parse_pc_snapshot(self.query("GET:PC_DATA ?"))
+            self._pc_data = pc_data
+            self._pc_data_timestamp = now
+            return pc_data
+
+    def invalidate(self) -> None:
+        """Discard the current PC_DATA snapshot."""
+        self._pc_data = None
 
     def get_uptime(self) -> float:
         """Return Arduino uptime in seconds."""
@@ -247,15 +354,141 @@ class EnvironBox(Instrument):
     # Helper
 
     def query(self, message: str) -> str:
-        response = self.resource.query(message).strip()
-        error = parse_error(response)
-        if error:
-            self._error_queue.append(error)
-            return ""
-        return response
+        with self.lock:
+            response = self.resource.query(message).strip()
+            error = parse_error(response)
+            if error:
+                self._error_queue.append(error)
+                return ""
+            return response
 
     def write(self, message: str) -> None:
-        response = self.query(message)
-        error = parse_error(response)
-        if error:
-            self._error_queue.append(error)
+        with self.lock:
+            self.invalidate()
+            response = self.query(message)
+            error = parse_error(response)
+            if error:
+                self._error_queue.append(error)
+
+
+class EnvironBoxSampler:
+    """Thread reading PC_DATA of an EnvironBox once per period, storing
+    timestamped samples in a ring buffer of fixed size.
+
+    Consumers read the latest samples using `latest` instead of querying the
+    instrument, columns are listed in `COLUMNS`. Reads are serialized with
+    other commands using the box's `lock`, hold it to run a sequence of
+    commands without samples in between.
+
+    >>> with EnvironBoxSampler(box, period=1.0, size=3600) as sampler:
+    ...     samples = sampler.latest(60)
+    ...     humidity = samples[:, sampler.column("box_humidity")]
+    """
+
+    FIELDS: tuple[str, ...] = (
+        "box_humidity",
+        "box_temperature",
+        "box_dewpoint",
+        "pt100_1",
+        "pt100_2",
+        "box_lux",
+    )
+    COLUMNS: tuple[str, ...] = ("timestamp", *FIELDS)
+
+    def __init__(self, box: EnvironBox, period: float = 1.0, size: int = 3600) -> None:
+        if period <= 0:
+            raise ValueError(f"Invalid sample period: {period!r}")
+        if size < 1:
+            raise ValueError(f"Invalid ring buffer size: {size!r}")
+        self.box: EnvironBox = box
+        self.period: float = period
+        self.size: int = size
+        self.pc_data: PCData | None = None
+        self.error: Exception | None = None
+        # Samples are appended to a buffer of three windows, the latest window
+        # is moved to the start once it is full. Any window of latest samples
+        # is a contiguous slice not overwritten for at least `size` samples.
+        self._buffer: np.ndarray = np.full((3 * size, len(self.COLUMNS)), np.nan)
+        self._end: int = 0
+        self._count: int = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def count(self) -> int:
+        """Total number of samples taken."""
+        return self._count
+
+    def column(self, name: str) -> int:
+        """Return column index of a sample field."""
+        return self.COLUMNS.index(name)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def sample(self) -> None:
+        """Read PC_DATA and append a sample to the ring buffer."""
+        pc_data = self.box.get_pc_data(max_age=0)
+        row = [time.time(), *(getattr(pc_data, field) for field in self.FIELDS)]
+        with self._lock:
+            end = self._end
+            if end == len(self._buffer):
+                self._buffer[: self.size] = self._buffer[end - self.size : end]
+                end = self.size
+            self._buffer[end] = row
+            self._end = end + 1
+            self._count += 1
+            self.pc_data = pc_data
+
+    def latest(self, count: int | None = None) -> np.ndarray:
+        """Return read-only view of the latest `count` samples, oldest first.
+
+        The view shares memory with the sample buffer and stays valid for
+        `size` sample periods, copy samples to keep them longer.
+        """
+        with self._lock:
+            available = min(self._count, self.size)
+            if count is None or count > available:
+                count = available
+            end = self._end
+            view = self._buffer[end - count : end]
+        view.flags.writeable = False
+        return view
+
+    def _run(self) -> None:
+        next_time = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.sample()
+                self.error = None
+            except Exception as exc:
+                logger.exception("EnvironBox sampling failed")
+                self.error = exc
+            next_time += self.period
+            delay = next_time - time.monotonic()
+            if delay < 0:
+                # Skip periods missed by slow reads
+                next_time -= delay
+                delay = 0
+            self._stop_event.wait(delay)
@@ -7,6 +7,8 @@ from comet.driver.generic.motion_controller import (
     Position,
 )
 
+from .venus import query_venus_commands
+
 __all__ = ["CorvusTT"]
 
 ERROR_MESSAGES: dict[int, str] = {
@@ -70,6 +72,10 @@ class CorvusAxis(MotionControllerAxis):
 class CorvusTT(MotionController):
     AXIS_IDS: Final = (1, 2, 3)
 
+    def __init__(self, resource) -> None:
+        super().__init__(resource)
+        self._axes: dict[int, CorvusAxis] = {}
+
     def identify(self) -> str:
         return self.resource.query("identify").strip()
 
@@ -84,7 +90,9 @@ class CorvusTT(MotionController):
     def __getitem__(self, index: int) -> CorvusAxis:
         if index not in self.AXIS_IDS:
             raise IndexError(f"invalid axis index {index}; valid: {self.AXIS_IDS}")
-        return CorvusAxis(self.resource, index)
+        if index not in self._axes:
+            self._axes[index] = CorvusAxis(self.resource, index)
+        return self._axes[index]
 
     def calibrate(self) -> None:
         self.resource.write("cal")
@@ -92,10 +100,17 @@ class CorvusTT(MotionController):
     def range_measure(self) -> None:
         self.resource.write("rm")
 
+    @property
+    def calibration_states(self) -> list[int]:
+        """Return calibration states (`getcaldone`) of all axes using a
+        single command line."""
+        commands = [f"{index:d} getcaldone" for index in self.AXIS_IDS]
+        return [int(result) for result in query_venus_commands(self.resource, commands)]
+
     @property
     def is_calibrated(self) -> bool:
         """Return True if all active axes are calibrated and range measured."""
-        return all(self[axis].is_calibrated for axis in self.AXIS_IDS)
+        return all(state == 0x3 for state in self.calibration_states)
 
     def move_absolute(self, position: Position) -> None:
         values = " ".join([format(value, ".3f") for value in position])
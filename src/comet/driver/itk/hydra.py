@@ -7,6 +7,8 @@ from comet.driver.generic.motion_controller import (
     Position,
 )
 
+from .venus import query_venus_commands, write_venus_commands
+
 __all__ = ["Hydra"]
 
 ERROR_MESSAGES: dict[int, str] = {
@@ -67,6 +69,10 @@ class HydraAxis(MotionControllerAxis):
 class Hydra(MotionController):
     AXES: Final[list[int]] = [1, 2]
 
+    def __init__(self, resource) -> None:
+        super().__init__(resource)
+        self._axes: dict[int, HydraAxis] = {}
+
     def identify(self) -> str:
         return self.resource.query("identify").strip()
 
@@ -81,15 +87,25 @@ class Hydra(MotionController):
     def __getitem__(self, index: int) -> HydraAxis:
         if index not in type(self).AXES:
             raise IndexError(index)
-        return HydraAxis(self.resource, index)
+        if index not in self._axes:
+            self._axes[index] = HydraAxis(self.resource, index)
+        return self._axes[index]
 
     def calibrate(self) -> None:
-        for index in type(self).AXES:
-            self.resource.write(f"{index:d} ncal")
+        write_venus_commands(
+            self.resource, [f"{index:d} ncal" for index in type(self).AXES]
+        )
 
     def range_measure(self) -> None:
-        for index in type(self).AXES:
-            self.resource.write(f"{index:d} nrm")
+        write_venus_commands(
+            self.resource, [f"{index:d} nrm" for index in type(self).AXES]
+        )
+
+    @property
+    def axis_states(self) -> list[int]:
+        """Return status (`nst`) of all axes using a single command line."""
+        commands = [f"{index:d} nst" for index in type(self).AXES]
+        return [int(result) for result in query_venus_commands(self.resource, commands)]
 
     @property
     def is_calibrated(self) -> bool:
@@ -106,8 +122,9 @@ class Hydra(MotionController):
         self.resource.write(f"{values[0]} {values[1]} r")
 
     def abort(self) -> None:
-        for index in type(self).AXES:
-            self.resource.write(f"{index:d} nabort")
+        write_venus_commands(
+            self.resource, [f"{index:d} nabort" for index in type(self).AXES]
+        )
 
     def force_abort(self) -> None:
         self.resource.write(chr(0x03))  # Ctrl+C
@@ -124,14 +141,14 @@ class Hydra(MotionController):
 
     @property
     def joystick_enabled(self) -> bool:
-        results = []
-        for index in type(self).AXES:
-            result = self.resource.query(f"{index:d} getmanctrl")
-            results.append(int(result))
-        return any(results)
+        commands = [f"{index:d} getmanctrl" for index in type(self).AXES]
+        results = query_venus_commands(self.resource, commands)
+        return any(int(result) for result in results)
 
     @joystick_enabled.setter
     def joystick_enabled(self, value: bool) -> None:
         states = 0xF if value else 0x0
-        for index in type(self).AXES:
-            self.resource.write(f"{states:d} {index:d} setmanctrl")
+        write_venus_commands(
+            self.resource,
+            [f"{states:d} {index:d} setmanctrl" for index in type(self).AXES],
+        )
@@ -0,0 +1,31 @@
+"""Venus command language helpers for ITK motion controllers."""
+
+from collections.abc import Iterable, Sequence
+
+__all__ = ["join_venus_commands", "query_venus_commands", "write_venus_commands"]
+
+
+def join_venus_commands(commands: Iterable[str]) -> str:
+    """Join Venus commands into a single command line, executed by the
+    controller's stack interpreter in order.
+
+    >>> join_venus_commands(["1 ncal", "2 ncal"])
+    '1 ncal 2 ncal'
+    """
+    return " ".join(commands)
+
+
+def write_venus_commands(resource, commands: Iterable[str]) -> None:
+    """Write commands as a single command line."""
+    resource.write(join_venus_commands(commands))
+
+
+def query_venus_commands(resource, commands: Sequence[str]) -> list[str]:
+    """Write query commands as a single command line and return one response
+    line for every command.
+
+    >>> query_venus_commands(resource, ["1 getcaldone", "2 getcaldone"])
+    ['3', '3']
+    """
+    resource.write(join_venus_commands(commands))
+    return [resource.read().strip() for _ in commands]
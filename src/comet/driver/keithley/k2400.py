@@ -1,7 +1,16 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+
+from comet.driver.batch import BatchMixin
+from comet.driver.cache import StateCacheMixin, cached_getter, cached_setter
 from comet.driver.generic import BeeperMixin, InstrumentError, RouteTerminalMixin
 from comet.driver.generic.source_meter_unit import SourceMeterUnit
+from comet.driver.sync import extended_timeout
 
-__all__ = ["K2400"]
+__all__ = ["K2400", "DataFormatMixin"]
 
 
 def parse_error(response: str) -> tuple[int, str]:
@@ -9,25 +18,131 @@ def parse_error(response: str) -> tuple[int, str]:
     return int(code), message.strip('"')
 
 
-class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
+def readings_duration(
+    count: int, interval: float, nplc: float, line_frequency: float = 50.0
+) -> float:
+    """Return estimated duration in seconds of `count` readings taken
+    `interval` seconds apart with an integration time of `nplc` power line
+    cycles. Integration time is doubled to account for auto zero readings.
+
+    >>> readings_duration(1000, 0.0, 1.0)
+    40.0
+    """
+    return count * (interval + 2 * nplc / line_frequency)
+
+
+def format_list_chunks(levels: Iterable[float], size: int) -> Iterator[str]:
+    """Return source list levels formatted in chunks of `size` values.
+
+    >>> list(format_list_chunks([1.0, 2.0, 3.0], 2))
+    ['1.000000E+00,2.000000E+00', '3.000000E+00']
+    """
+    values = [format(level, "E") for level in levels]
+    for index in range(0, len(values), size):
+        yield ",".join(values[index : index + size])
+
+
+class DataFormatMixin(StateCacheMixin, ABC):
+    """Mixin for Keithley SCPI drivers transferring bulk readings either as
+    ASCII or as binary IEEE-754 single precision values.
+
+    >>> smu.data_format = smu.DATA_FORMAT_REAL32
+    >>> smu.byte_order = smu.BYTE_ORDER_LITTLE
+    """
+
+    DATA_FORMAT_ASCII: str = "ascii"
+    DATA_FORMAT_REAL32: str = "real32"
+
+    BYTE_ORDER_BIG: str = "big"
+    BYTE_ORDER_LITTLE: str = "little"
+
+    # Instrument specific name of the single precision data format.
+    REAL32_DATA_FORMAT: str = "REAL,32"
+
+    data_format: str = DATA_FORMAT_ASCII
+    byte_order: str = BYTE_ORDER_BIG
+
+    resource: Any
+
+    @abstractmethod
+    def write(self, message: str) -> None: ...
+
+    @abstractmethod
+    def query(self, message: str) -> str: ...
+
+    def _ensure_data_format(self, data_format: str) -> None:
+        # Instruments default to ASCII, which can be assumed unless binary
+        # transfers were ever selected for this driver
+        if "data_format" in vars(self):
+            current = self.state_cache.get("data_format")
+        else:
+            current = self.state_cache.get("data_format", self.DATA_FORMAT_ASCII)
+        if current != data_format:
+            value = {
+                self.DATA_FORMAT_ASCII: "ASC",
+                self.DATA_FORMAT_REAL32: self.REAL32_DATA_FORMAT,
+            }[data_format]
+            self.write(f":FORM:DATA {value}")
+            self.state_cache.update("data_format", data_format)
+        if data_format == self.DATA_FORMAT_REAL32:
+            byte_order = self.byte_order
+            if not self.state_cache.is_current("byte_order", byte_order):
+                value = {self.BYTE_ORDER_BIG: "NORM", self.BYTE_ORDER_LITTLE: "SWAP"}[
+                    byte_order
+                ]
+                self.write(f":FORM:BORD {value}")
+                self.state_cache.update("byte_order", byte_order)
+
+    def _query_readings(self, message: str) -> np.ndarray:
+        """Return readings of a bulk query in the selected data format."""
+        self._ensure_data_format(self.data_format)
+        if self.data_format == self.DATA_FORMAT_REAL32:
+            readings = self.resource.query_binary_values(
+                message,
+                datatype="f",
+                is_big_endian=self.byte_order == self.BYTE_ORDER_BIG,
+                container=np.ndarray,
+            )
+            return np.asarray(readings, dtype=np.float64)
+        readings = self.query(message)
+        if not readings:
+            return np.empty(0, dtype=np.float64)
+        return np.asarray(readings.split(","), dtype=np.float64)
+
+
+class K2400(
+    DataFormatMixin,
+    BatchMixin,
+    BeeperMixin,
+    RouteTerminalMixin,
+    SourceMeterUnit,
+):
     """Driver for Keithley 2400 source meter unit."""
 
+    TRACE_BUFFER_SIZE: int = 2500
+    TRIGGER_DELAY_MAX: float = 999.9999
+    SOURCE_LIST_CHUNK_SIZE: int = 100
+
     def identify(self) -> str:
         return self.query("*IDN?")
 
     def reset(self) -> None:
         self.write("*RST")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
+        self.invalidate()
 
     # Beeper
 
     @property
+    @cached_getter
     def beeper(self) -> bool:
         return bool(int(self.query(":SYST:BEEP:STAT?")))
 
     @beeper.setter
+    @cached_setter
     def beeper(self, value: bool) -> None:
         self.write(f":SYST:BEEP:STAT {value:d}")
 
@@ -42,6 +157,7 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
     # Route terminal
 
     @property
+    @cached_getter
     def route_terminal(self) -> str:
         value = self.query(":ROUT:TERM?")
         return {
@@ -50,6 +166,7 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
         }[value]
 
     @route_terminal.setter
+    @cached_setter
     def route_terminal(self, route_terminal: str) -> None:
         value = {
             self.ROUTE_TERMINAL_FRONT: "FRON",
@@ -76,6 +193,7 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
         self.write(f":OUTP:STAT {value}")
 
     @property
+    @cached_getter
     def function(self) -> str:
         value = self.query(":SOUR:FUNC:MODE?")
         return {
@@ -84,6 +202,7 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
         }[value]
 
     @function.setter
+    @cached_setter
     def function(self, function: str) -> None:
         function_mode = {
             self.FUNCTION_VOLTAGE: "VOLT",
@@ -107,18 +226,22 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
         self.write(f":SOUR:VOLT:LEV {level:E}")
 
     @property
+    @cached_getter
     def voltage_range(self) -> float:
         return float(self.query(":SOUR:VOLT:RANG?"))
 
     @voltage_range.setter
+    @cached_setter
     def voltage_range(self, level: float) -> None:
         self.write(f":SOUR:VOLT:RANG {level:E}")
 
     @property
+    @cached_getter
     def voltage_compliance(self) -> float:
         return float(self.query(":SENS:VOLT:PROT:LEV?"))
 
     @voltage_compliance.setter
+    @cached_setter
     def voltage_compliance(self, level: float) -> None:
         self.write(f":SENS:VOLT:PROT:LEV {level:.3E}")
 
@@ -137,18 +260,22 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
         self.write(f":SOUR:CURR:LEV {level:E}")
 
     @property
+    @cached_getter
     def current_range(self) -> float:
         return float(self.query(":SOUR:CURR:RANG?"))
 
     @current_range.setter
+    @cached_setter
     def current_range(self, level: float) -> None:
         self.write(f":SOUR:CURR:RANG {level:E}")
 
     @property
+    @cached_getter
     def current_compliance(self) -> float:
         return float(self.query(":SENS:CURR:PROT:LEV?"))
 
     @current_compliance.setter
+    @cached_setter
     def current_compliance(self, level: float) -> None:
         self.write(f":SENS:CURR:PROT:LEV {level:.3E}")
 
@@ -163,18 +290,105 @@ class K2400(BeeperMixin, RouteTerminalMixin, SourceMeterUnit):
     # Measurements
 
     def measure_voltage(self) -> float:
-        self.write(":FORM:ELEM VOLT")
+        self._ensure_format_elements("VOLT")
+        self._ensure_data_format(self.DATA_FORMAT_ASCII)
         return float(self.query(":READ?"))
 
     def measure_current(self) -> float:
-        self.write(":FORM:ELEM CURR")
+        self._ensure_format_elements("CURR")
+        self._ensure_data_format(self.DATA_FORMAT_ASCII)
         return float(self.query(":READ?"))
 
+    def measure_current_many(
+        self, count: int, interval: float | None = None
+    ) -> np.ndarray:
+        """Return `count` current readings stored in the trace buffer, with
+        `interval` used as trigger delay between readings. Intervals above
+        the instrument's trigger delay limit use the software fallback."""
+        if not 1 <= count <= type(self).TRACE_BUFFER_SIZE:
+            raise ValueError(f"Invalid reading count: {count!r}")
+        if interval is not None and interval > type(self).TRIGGER_DELAY_MAX:
+            return super().measure_current_many(count, interval)
+        self._ensure_format_elements("CURR")
+        duration = readings_duration(count, interval or 0.0, self._sense_nplc())
+        trigger_delay = float(self.query(":TRIG:DEL?"))
+        with self.deferred_sync():
+            self.write(":TRAC:CLE")
+            self.write(f":TRAC:POIN {count:d}")
+            self.write(":TRAC:FEED SENS")
+            self.write(":TRAC:FEED:CONT NEXT")
+            self.write(f":TRIG:COUN {count:d}")
+            self.write(f":TRIG:DEL {interval or 0:E}")
+            self.write(":INIT")
+            self.sync(duration)  # wait for readings
+        readings = self._query_readings(":TRAC:DATA?")
+        with self.deferred_sync():
+            self.write(":TRAC:FEED:CONT NEV")
+            self.write(":TRIG:COUN 1")
+            self.write(f":TRIG:DEL {trigger_delay:E}")
+        return readings
+
+    def sweep_voltage(
+        self,
+        levels: Iterable[float],
+        delay: float = 0.0,
+        compliance_abort: bool = True,
+    ) -> np.ndarray:
+        """Run a hardware timed voltage list sweep and return the current
+        readings of all sweep points.
+
+        Levels are uploaded as source list, the sweep is triggered by a
+        single `:READ?`. With `compliance_abort` the sweep stops early if
+        compliance is reached, returning fewer readings than levels.
+
+        >>> smu.sweep_voltage(LinearRange(0, -100, 5), delay=0.1)
+        array([...])
+        """
+        levels = np.asarray(list(levels), dtype=np.float64)
+        if not 1 <= len(levels) <= type(self).TRACE_BUFFER_SIZE:
+            raise ValueError(f"Invalid number of sweep points: {len(levels)!r}")
+        self.function = self.FUNCTION_VOLTAGE
+        self._ensure_format_elements("CURR")
+        duration = readings_duration(len(levels), delay, self._sense_nplc())
+        chunk_size = type(self).SOURCE_LIST_CHUNK_SIZE
+        with self.deferred_sync():
+            self.write(":SOUR:VOLT:MODE LIST")
+            for index, chunk in enumerate(format_list_chunks(levels, chunk_size)):
+                if index:
+                    self.write(f":SOUR:LIST:VOLT:APP {chunk}")
+                else:
+                    self.write(f":SOUR:LIST:VOLT {chunk}")
+            self.write(f":SOUR:DEL {delay:E}")
+            self.write(f":SOUR:SWE:CAB {'EARL' if compliance_abort else 'NEV'}")
+            self.write(f":TRIG:COUN {len(levels):d}")
+        with extended_timeout(self.resource, duration):
+            readings = self._query_readings(":READ?")
+        with self.deferred_sync():
+            self.write(":SOUR:VOLT:MODE FIX")
+            self.write(":SOUR:SWE:CAB NEV")
+            self.write(":TRIG:COUN 1")
+        return readings
+
+    def measure_voltage_current(self) -> tuple[float, float]:
+        """Return voltage and current of a single reading."""
+        self._ensure_format_elements("VOLT,CURR")
+        self._ensure_data_format(self.DATA_FORMAT_ASCII)
+        voltage, current = self.query(":READ?").split(",")[:2]
+        return float(voltage), float(current)
+
     # Helper
 
+    def _sense_nplc(self) -> float:
+        return float(self.query(":SENS:CURR:NPLC?"))
+
     def query(self, message: str) -> str:
         return self.resource.query(message).strip()
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.resource.query("*OPC?")
+        self.sync_write()
+
+    def _ensure_format_elements(self, elements: str) -> None:
+        if not self.state_cache.is_current("format_elements", elements):
+            self.write(f":FORM:ELEM {elements}")
+            self.state_cache.update("format_elements", elements)
@@ -1,20 +1,36 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from comet.driver.batch import BatchMixin
+from comet.driver.cache import cached_getter, cached_setter
 from comet.driver.generic import InstrumentError, RouteTerminalMixin
 from comet.driver.generic.source_meter_unit import SourceMeterUnit
 
-from .k2400 import parse_error
+from .k2400 import (
+    DataFormatMixin,
+    format_list_chunks,
+    parse_error,
+    readings_duration,
+)
 
 __all__ = ["K2470"]
 
 
-class K2470(RouteTerminalMixin, SourceMeterUnit):
+class K2470(DataFormatMixin, BatchMixin, RouteTerminalMixin, SourceMeterUnit):
+    REAL32_DATA_FORMAT: str = "SREAL"
+    SOURCE_LIST_CHUNK_SIZE: int = 100
+
     def identify(self) -> str:
         return self.query("*IDN?")
 
     def reset(self) -> None:
         self.write("*RST")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
+        self.invalidate()
 
     # Error queue
 
@@ -27,6 +43,7 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
     # Route terminal
 
     @property
+    @cached_getter
     def route_terminal(self) -> str:
         value = self.query(":ROUT:TERM?")
         return {
@@ -35,6 +52,7 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
         }[value]
 
     @route_terminal.setter
+    @cached_setter
     def route_terminal(self, route_terminal: str) -> None:
         value = {
             self.ROUTE_TERMINAL_FRONT: "FRON",
@@ -61,6 +79,7 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
         self.write(f":OUTP:STAT {value}")
 
     @property
+    @cached_getter
     def function(self) -> str:
         value = self.query(":SOUR:FUNC:MODE?")
         return {
@@ -69,6 +88,7 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
         }[value]
 
     @function.setter
+    @cached_setter
     def function(self, function: str) -> None:
         function_mode = {
             self.FUNCTION_VOLTAGE: "VOLT",
@@ -92,18 +112,22 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
         self.write(f":SOUR:VOLT:LEV {level:E}")
 
     @property
+    @cached_getter
     def voltage_range(self) -> float:
         return float(self.query(":SOUR:VOLT:RANG?"))
 
     @voltage_range.setter
+    @cached_setter
     def voltage_range(self, level: float) -> None:
         self.write(f":SOUR:VOLT:RANG {level:E}")
 
     @property
+    @cached_getter
     def voltage_compliance(self) -> float:
         return float(self.query(":SOUR:CURR:VLIM:LEV?"))
 
     @voltage_compliance.setter
+    @cached_setter
     def voltage_compliance(self, level: float) -> None:
         self.write(f":SOUR:CURR:VLIM:LEV {level:.3E}")
 
@@ -122,18 +146,22 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
         self.write(f":SOUR:CURR:LEV {level:E}")
 
     @property
+    @cached_getter
     def current_range(self) -> float:
         return float(self.query(":SOUR:CURR:RANG?"))
 
     @current_range.setter
+    @cached_setter
     def current_range(self, level: float) -> None:
         self.write(f":SOUR:CURR:RANG {level:E}")
 
     @property
+    @cached_getter
     def current_compliance(self) -> float:
         return float(self.query(":SOUR:VOLT:ILIM:LEV?"))
 
     @current_compliance.setter
+    @cached_setter
     def current_compliance(self, level: float) -> None:
         self.write(f":SOUR:VOLT:ILIM:LEV {level:.3E}")
 
@@ -150,16 +178,80 @@ class K2470(RouteTerminalMixin, SourceMeterUnit):
     # Measurements
 
     def measure_voltage(self) -> float:
+        self._ensure_data_format(self.DATA_FORMAT_ASCII)
+        self.invalidate("function")  # switches the sense function
         return float(self.query(":MEAS:VOLT?"))
 
     def measure_current(self) -> float:
+        self._ensure_data_format(self.DATA_FORMAT_ASCII)
+        self.invalidate("function")  # switches the sense function
         return float(self.query(":MEAS:CURR?"))
 
+    def measure_current_many(
+        self, count: int, interval: float | None = None
+    ) -> np.ndarray:
+        """Return `count` current readings stored in reading buffer
+        `defbuffer1` using the simple loop trigger model, with `interval` as
+        delay between readings."""
+        if count < 1:
+            raise ValueError(f"Invalid reading count: {count!r}")
+        duration = readings_duration(count, interval or 0.0, self._sense_nplc())
+        with self.deferred_sync():
+            self.write(":SENS:FUNC 'CURR'")
+            self.invalidate("function")
+            self.write(':TRAC:CLE "defbuffer1"')
+            self.write(
+                f':TRIG:LOAD "SimpleLoop", {count:d}, {interval or 0:E}, "defbuffer1"'
+            )
+            self.write(":INIT")
+            self.sync(duration)  # wait for readings
+        return self._query_readings(f':TRAC:DATA? 1, {count:d}, "defbuffer1", READ')
+
+    def sweep_voltage(
+        self,
+        levels: Iterable[float],
+        delay: float = 0.0,
+        compliance_abort: bool = True,
+    ) -> np.ndarray:
+        """Run a hardware timed voltage list sweep and return the current
+        readings of all sweep points.
+
+        Levels are uploaded as source list and swept into reading buffer
+        `defbuffer1`. With `compliance_abort` the sweep stops early if the
+        source limit is reached, returning fewer readings than levels.
+        """
+        levels = np.asarray(list(levels), dtype=np.float64)
+        if not len(levels):
+            raise ValueError("Sweep requires at least one level")
+        self.function = self.FUNCTION_VOLTAGE
+        duration = readings_duration(len(levels), delay, self._sense_nplc())
+        chunk_size = type(self).SOURCE_LIST_CHUNK_SIZE
+        fail_abort = "ON" if compliance_abort else "OFF"
+        with self.deferred_sync():
+            self.write(':TRAC:CLE "defbuffer1"')
+            for index, chunk in enumerate(format_list_chunks(levels, chunk_size)):
+                if index:
+                    self.write(f":SOUR:LIST:VOLT:APP {chunk}")
+                else:
+                    self.write(f":SOUR:LIST:VOLT {chunk}")
+            self.write(
+                f':SOUR:SWE:VOLT:LIST 1, {delay:E}, 1, {fail_abort}, OFF, "defbuffer1"'
+            )
+            self.write(":INIT")
+            self.sync(duration)  # wait for sweep to complete
+        count = int(self.query(':TRAC:ACT? "defbuffer1"'))
+        if not count:
+            return np.empty(0, dtype=np.float64)
+        return self._query_readings(f':TRAC:DATA? 1, {count:d}, "defbuffer1", READ')
+
     # Helper
 
+    def _sense_nplc(self) -> float:
+        return float(self.query(":SENS:CURR:NPLC?"))
+
     def query(self, message: str) -> str:
         return self.resource.query(message).strip()
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
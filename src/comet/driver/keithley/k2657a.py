@@ -1,26 +1,45 @@
+import re
+from collections.abc import Iterable
+
+import numpy as np
+
+from comet.driver.batch import Batch, BatchMixin, join_tsp_messages
+from comet.driver.cache import StateCacheMixin, cached_getter, cached_setter
 from comet.driver.generic import BeeperMixin, InstrumentError
 from comet.driver.generic.source_meter_unit import SourceMeterUnit
+from comet.driver.sync import extended_timeout
+
+from .k2400 import format_list_chunks, readings_duration
 
 __all__ = ["K2657A"]
 
+SCRIPT_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class K2657A(StateCacheMixin, BatchMixin, BeeperMixin, SourceMeterUnit):
+    RAMP_SCRIPT_NAME: str = "comet_ramp"
+    SCRIPT_TABLE_CHUNK_SIZE: int = 100
 
-class K2657A(BeeperMixin, SourceMeterUnit):
     def identify(self) -> str:
         return self.query("*IDN?")
 
     def reset(self) -> None:
         self.write("*RST")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
+        self.invalidate()
 
     # Beeper
 
     @property
+    @cached_getter
     def beeper(self) -> bool:
         return bool(float(self.tsp_print("beeper.enable")))
 
     @beeper.setter
+    @cached_setter
     def beeper(self, value: bool) -> None:
         self.tsp_assign("beeper.enable", format(value, "d"))
 
@@ -51,6 +70,7 @@ class K2657A(BeeperMixin, SourceMeterUnit):
         self.tsp_assign("smua.source.output", format(value, "d"))
 
     @property
+    @cached_getter
     def function(self) -> str:
         value = int(float(self.tsp_print("smua.source.func")))
         return {
@@ -59,6 +79,7 @@ class K2657A(BeeperMixin, SourceMeterUnit):
         }[value]
 
     @function.setter
+    @cached_setter
     def function(self, function: str) -> None:
         value = {
             self.FUNCTION_VOLTAGE: 1,
@@ -77,18 +98,22 @@ class K2657A(BeeperMixin, SourceMeterUnit):
         self.tsp_assign("smua.source.levelv", format(level, "E"))
 
     @property
+    @cached_getter
     def voltage_range(self) -> float:
         return float(self.tsp_print("smua.source.rangev"))
 
     @voltage_range.setter
+    @cached_setter
     def voltage_range(self, level: float) -> None:
         self.tsp_assign("smua.source.rangev", format(level, "E"))
 
     @property
+    @cached_getter
     def voltage_compliance(self) -> float:
         return float(self.tsp_print("smua.source.limitv"))
 
     @voltage_compliance.setter
+    @cached_setter
     def voltage_compliance(self, level: float) -> None:
         self.tsp_assign("smua.source.limitv", format(level, "E"))
 
@@ -103,18 +128,22 @@ class K2657A(BeeperMixin, SourceMeterUnit):
         self.tsp_assign("smua.source.leveli", format(level, "E"))
 
     @property
+    @cached_getter
     def current_range(self) -> float:
         return float(self.tsp_print("smua.source.rangei"))
 
     @current_range.setter
+    @cached_setter
     def current_range(self, level: float) -> None:
         self.tsp_assign("smua.source.rangei", format(level, "E"))
 
     @property
+    @cached_getter
     def current_compliance(self) -> float:
         return float(self.tsp_print("smua.source.limiti"))
 
     @current_compliance.setter
+    @cached_setter
     def current_compliance(self, level: float) -> None:
         self.tsp_assign("smua.source.limiti", format(level, "E"))
 
@@ -133,14 +162,107 @@ class K2657A(BeeperMixin, SourceMeterUnit):
     def measure_current(self) -> float:
         return float(self.tsp_print("smua.measure.i()"))
 
+    def measure_current_many(
+        self, count: int, interval: float | None = None
+    ) -> np.ndarray:
+        """Return `count` current readings stored in `smua.nvbuffer1`, with
+        `interval` as measure interval. Intervals above the instrument's
+        limit of 1 s use the software fallback."""
+        if count < 1:
+            raise ValueError(f"Invalid reading count: {count!r}")
+        if interval is not None and interval > 1.0:
+            return super().measure_current_many(count, interval)
+        duration = readings_duration(count, interval or 0.0, self._measure_nplc())
+        with self.deferred_sync():
+            self.write("smua.nvbuffer1.clear()")
+            self.tsp_assign("smua.measure.count", format(count, "d"))
+            self.tsp_assign("smua.measure.interval", format(interval or 0, "E"))
+            self.write("smua.measure.i(smua.nvbuffer1)")
+            self.sync(duration)  # wait for readings
+        readings = self.read_buffer("smua.nvbuffer1")
+        with self.deferred_sync():
+            self.tsp_assign("smua.measure.count", "1")
+        return readings
+
+    def ramp_measure_current(
+        self, levels: Iterable[float], delay: float = 0.0
+    ) -> np.ndarray:
+        """Ramp voltage source through levels using an on-instrument script,
+        measuring current into `smua.nvbuffer1` after `delay` seconds at
+        every level. Returns all current readings. While the script runs the
+        resource timeout is extended by the estimated ramp duration.
+
+        Levels are uploaded as Lua table iterated by a `for` loop, in lines
+        of `SCRIPT_TABLE_CHUNK_SIZE` values.
+        """
+        levels = list(levels)
+        chunk_size = type(self).SCRIPT_TABLE_CHUNK_SIZE
+        lines = ["smua.nvbuffer1.clear()", "smua.measure.count = 1", "local levels = {"]
+        lines.extend(f"{chunk}," for chunk in format_list_chunks(levels, chunk_size))
+        lines.extend(["}", "for i = 1, #levels do", "smua.source.levelv = levels[i]"])
+        if delay:
+            lines.append(f"delay({delay:E})")
+        lines.extend(["smua.measure.i(smua.nvbuffer1)", "end"])
+        self.function = self.FUNCTION_VOLTAGE
+        duration = readings_duration(len(levels), delay, self._measure_nplc())
+        self.load_script(type(self).RAMP_SCRIPT_NAME, "\n".join(lines))
+        with extended_timeout(self.resource, duration):
+            self.run_script(type(self).RAMP_SCRIPT_NAME)
+            return self.read_buffer("smua.nvbuffer1")
+
+    # Scripts
+
+    def load_script(self, name: str, source: str) -> None:
+        """Load named TSP script, replacing an existing script of same name.
+
+        >>> smu.load_script("hello", 'print("Hello!")')
+        >>> smu.run_script("hello")
+        """
+        if not SCRIPT_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid script name: {name!r}")
+        batched = isinstance(self.resource, Batch)
+        if batched:
+            raise RuntimeError("Scripts can not be loaded inside batch blocks")
+        with self.deferred_sync():
+            self.write(f"loadscript {name}")
+            for line in source.splitlines():
+                if line.strip():
+                    self.write(line)
+            self.write("endscript")
+
+    def run_script(self, name: str) -> None:
+        """Run named TSP script previously loaded."""
+        if not SCRIPT_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid script name: {name!r}")
+        self.write(f"{name}()")
+
+    def delete_script(self, name: str) -> None:
+        """Delete named TSP script."""
+        if not SCRIPT_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid script name: {name!r}")
+        self.write(f'script.delete("{name}")')
+
+    def read_buffer(self, buffer: str = "smua.nvbuffer1") -> np.ndarray:
+        """Return all readings of a reading buffer using `printbuffer`."""
+        readings = self.query(f"printbuffer(1, {buffer}.n, {buffer}.readings)")
+        if not readings:
+            return np.empty(0, dtype=np.float64)
+        return np.asarray(readings.split(","), dtype=np.float64)
+
     # Helper
 
+    def _measure_nplc(self) -> float:
+        return float(self.tsp_print("smua.measure.nplc"))
+
     def query(self, message: str) -> str:
         return self.resource.query(message).strip()
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
+
+    def join_messages(self, messages: list[str]) -> list[str]:
+        return join_tsp_messages(messages)
 
     def tsp_print(self, expression: str) -> str:
         return self.query(f"print({expression})")
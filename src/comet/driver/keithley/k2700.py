@@ -1,3 +1,4 @@
+from comet.driver.cache import StateCacheMixin, cached_getter, cached_setter
 from comet.driver.generic import BeeperMixin, InstrumentError
 from comet.driver.generic.dmm import DigitalMultiMeter
 
@@ -9,34 +10,31 @@ def parse_error(response: str) -> tuple[int, str]:
     return int(code), message.strip('"')
 
 
-class K2700(BeeperMixin, DigitalMultiMeter):
+class K2700(StateCacheMixin, BeeperMixin, DigitalMultiMeter):
     """Driver for Keithley 2700 digital multimeter."""
 
-    def __init__(self, resource) -> None:
-        super().__init__(resource)
-        self._sense_function: str | None = None
-        self._format_elements: str | None = None
-
     def identify(self) -> str:
         return self._query("*IDN?")
 
     def reset(self) -> None:
         self._write("*RST")
         self._query("*OPC?")
-        self._sense_function = None
-        self._format_elements = None
+        self.invalidate()
 
     def clear(self) -> None:
         self._write("*CLS")
         self._query("*OPC?")
+        self.invalidate()
 
     # Beeper
 
     @property
+    @cached_getter
     def beeper(self) -> bool:
         return bool(int(self._query(":SYST:BEEP:STAT?")))
 
     @beeper.setter
+    @cached_setter
     def beeper(self, value: bool) -> None:
         self._write(f":SYST:BEEP:STAT {value:d}")
         self._query("*OPC?")
@@ -70,11 +68,11 @@ class K2700(BeeperMixin, DigitalMultiMeter):
         self.resource.write(message)
 
     def _ensure_sense_function(self, function: str) -> None:
-        if self._sense_function != function:
+        if not self.state_cache.is_current("sense_function", function):
             self._write(f":SENS:FUNC '{function}'")
-            self._sense_function = function
+            self.state_cache.update("sense_function", function)
 
     def _ensure_format_elements(self, elements: str) -> None:
-        if self._format_elements != elements:
+        if not self.state_cache.is_current("format_elements", elements):
             self._write(f":FORM:ELEM {elements}")
-            self._format_elements = elements
+            self.state_cache.update("format_elements", elements)
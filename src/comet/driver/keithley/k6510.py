@@ -1,5 +1,6 @@
 import warnings
 
+from comet.driver.cache import StateCacheMixin
 from comet.driver.generic import InstrumentError, RouteTerminalMixin
 from comet.driver.generic.dmm import DigitalMultiMeter
 
@@ -11,17 +12,19 @@ def parse_error(response: str) -> tuple[int, str]:
     return int(code), message.strip('"')
 
 
-class K6510(RouteTerminalMixin, DigitalMultiMeter):
+class K6510(StateCacheMixin, RouteTerminalMixin, DigitalMultiMeter):
     def identify(self) -> str:
         return self.query("*IDN?")
 
     def reset(self) -> None:
         self.write("*RST")
         self.query("*OPC?")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
         self.query("*OPC?")
+        self.invalidate()
 
     # Error queue
 
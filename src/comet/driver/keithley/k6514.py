@@ -1,3 +1,4 @@
+from comet.driver.batch import BatchMixin
 from comet.driver.generic import InstrumentError
 from comet.driver.generic.electrometer import Electrometer
 
@@ -9,7 +10,7 @@ def parse_error(response: str) -> tuple[int, str]:
     return int(code), message.strip('"')
 
 
-class K6514(Electrometer):
+class K6514(BatchMixin, Electrometer):
     def identify(self) -> str:
         return self.query("*IDN?")
 
@@ -60,4 +61,4 @@ class K6514(Electrometer):
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
@@ -1,3 +1,4 @@
+from comet.driver.batch import BatchMixin
 from comet.driver.generic import InstrumentError
 from comet.driver.generic.electrometer import Electrometer
 
@@ -9,7 +10,7 @@ def parse_error(response: str):
     return int(code), message.strip('"')
 
 
-class K6517B(Electrometer):
+class K6517B(BatchMixin, Electrometer):
     def identify(self) -> str:
         return self.query("*IDN?")
 
@@ -48,4 +49,4 @@ class K6517B(Electrometer):
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
@@ -1,5 +1,7 @@
+from comet.driver.batch import BatchMixin, join_tsp_messages
+from comet.driver.cache import StateCacheMixin, cached_getter, cached_setter
 from comet.driver.generic import InstrumentError
-from comet.driver.generic.switching_matrix import SwitchingMatrix
+from comet.driver.generic.switching_matrix import ChannelSet, SwitchingMatrix
 from comet.utils import combine_matrix
 
 __all__ = ["K707B"]
@@ -13,12 +15,12 @@ def join_channels(channels: list[str]) -> str:
     return ",".join([format(channel).strip() for channel in channels])
 
 
-class K707B(SwitchingMatrix):
+class K707B(StateCacheMixin, BatchMixin, SwitchingMatrix):
     CHANNELS = tuple(
         combine_matrix(
-            "1234",
-            "ABCDEFG",
-            combine_matrix("0", "123456789") + combine_matrix("1", "12"),
+            "123456",
+            "ABCDEFGH",
+            combine_matrix("0", "123456789") + combine_matrix("1", "012"),
         )
     )
 
@@ -27,17 +29,21 @@ class K707B(SwitchingMatrix):
 
     def reset(self) -> None:
         self.write("*RST")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
+        self.invalidate()
 
     # Beeper
 
     @property
+    @cached_getter
     def beeper(self) -> bool:
         return bool(float(self.tsp_print("beeper.enable")))
 
     @beeper.setter
+    @cached_setter
     def beeper(self, value: bool) -> None:
         self.tsp_assign("beeper.enable", format(value, "d"))
 
@@ -58,16 +64,45 @@ class K707B(SwitchingMatrix):
             return []
         return sorted(split_channels(channels))
 
+    @property
+    @cached_getter
+    def closed_channel_set(self) -> ChannelSet:
+        return ChannelSet.from_channels(type(self).CHANNELS, self.closed_channels)
+
     def close_channels(self, channels: list[str]) -> None:
-        channel_list = join_channels(channels)
-        self.write(f'channel.close("{channel_list}")')
+        self.switch_channels([], channels)
 
     def open_channels(self, channels: list[str]) -> None:
-        channel_list = join_channels(channels)
-        self.write(f'channel.open("{channel_list}")')
+        self.switch_channels(channels, [])
 
     def open_all_channels(self) -> None:
+        self.invalidate("closed_channel_set")
         self.write('channel.open("allslots")')
+        self.state_cache.update("closed_channel_set", ChannelSet(type(self).CHANNELS))
+
+    def switch_channels(
+        self, open_channels: list[str], close_channels: list[str]
+    ) -> None:
+        """Open and close channels using a single message."""
+        statements = []
+        if open_channels:
+            statements.append(f'channel.open("{join_channels(open_channels)}")')
+        if close_channels:
+            statements.append(f'channel.close("{join_channels(close_channels)}")')
+        if not statements:
+            return
+        closed = self.state_cache.get("closed_channel_set")
+        if closed is not None:
+            channels = type(self).CHANNELS
+            try:
+                closed = closed - ChannelSet.from_channels(channels, open_channels)
+                closed = closed | ChannelSet.from_channels(channels, close_channels)
+            except ValueError:
+                closed = None  # channels not in CHANNELS, read back on next access
+        self.invalidate("closed_channel_set")
+        self.write("; ".join(statements))
+        if closed is not None:
+            self.state_cache.update("closed_channel_set", closed)
 
     # Helper
 
@@ -76,7 +111,10 @@ class K707B(SwitchingMatrix):
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
+
+    def join_messages(self, messages: list[str]) -> list[str]:
+        return join_tsp_messages(messages)
 
     def tsp_print(self, expression: str) -> str:
         return self.query(f"print({expression})")
@@ -1,10 +1,12 @@
+from comet.driver.batch import BatchMixin
+from comet.driver.cache import StateCacheMixin, cached_getter, cached_setter
 from comet.driver.generic import InstrumentError
 from comet.driver.generic.lcr_meter import LCRMeter
 
 __all__ = ["E4980A"]
 
 
-class E4980A(LCRMeter):
+class E4980A(StateCacheMixin, BatchMixin, LCRMeter):
     FUNCTION_CPD: str = "CPD"
     FUNCTION_CPQ: str = "CPQ"
     FUNCTION_CPG: str = "CPG"
@@ -35,17 +37,21 @@ class E4980A(LCRMeter):
 
     def reset(self) -> None:
         self.write("*RST")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
+        self.invalidate()
 
     # Beeper
 
     @property
+    @cached_getter
     def beeper(self) -> bool:
         return bool(int(self.query(":SYST:BEEP:STAT?")))
 
     @beeper.setter
+    @cached_setter
     def beeper(self, value: bool) -> None:
         self.write(f":SYST:BEEP:STAT {value:d}")
 
@@ -60,10 +66,12 @@ class E4980A(LCRMeter):
     # LCR Meter
 
     @property
+    @cached_getter
     def function(self) -> str:
         return self.query(":FUNC:IMP:TYPE?")
 
     @function.setter
+    @cached_setter
     def function(self, function: str) -> None:
         self.write(f":FUNC:IMP:TYPE {function}")
 
@@ -108,4 +116,4 @@ class E4980A(LCRMeter):
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
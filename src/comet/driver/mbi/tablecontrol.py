@@ -1,5 +1,8 @@
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from typing import Final
 
+from comet.driver.cache import StateCacheMixin
 from comet.driver.generic import InstrumentError
 from comet.driver.generic.motion_controller import (
     MotionController,
@@ -20,6 +23,12 @@ def parse_error(response: str) -> tuple[int, str]:
 
 
 class TableControlAxis(MotionControllerAxis):
+    def __init__(
+        self, resource, index: int, table: "TableControl | None" = None
+    ) -> None:
+        super().__init__(resource, index)
+        self.table: TableControl | None = table
+
     def calibrate(self) -> None: ...  # Not Implemented
 
     def range_measure(self) -> None: ...  # Not Implemented
@@ -31,6 +40,9 @@ class TableControlAxis(MotionControllerAxis):
         return int(result[self.index - 1]) == 3
 
     def move_absolute(self, value: float) -> None:
+        if self.table is not None:
+            self.table.move_axes({self.index: value})
+            return
         x, y, z = [float(token) for token in split_tokens(self.resource.query("POS?"))]
         if self.index == 1:
             x = value
@@ -41,6 +53,9 @@ class TableControlAxis(MotionControllerAxis):
         self.resource.write(f"MOVE:ABS {x:.6f},{y:.6f},{z:.6f}")
 
     def move_relative(self, value: float) -> None:
+        if self.table is not None:
+            self.table.move_axes_relative({self.index: value})
+            return
         x, y, z = 0.0, 0.0, 0.0
         if self.index == 1:
             x = value
@@ -60,9 +75,23 @@ class TableControlAxis(MotionControllerAxis):
         return self.resource.query("MOVE?").strip() == "1"
 
 
-class TableControl(MotionController):
+class TableControl(StateCacheMixin, MotionController):
+    """MBI table control motion controller.
+
+    The target position of the last move is cached, so single axis moves do
+    not query the current position. As the controller may reject or clamp
+    moves, the cache is invalidated on errors read by `next_error()`, as well
+    as on abort and joystick use. Call `invalidate()` if the table was moved
+    by other means.
+    """
+
     AXIS_IDS: Final = (1, 2, 3)
 
+    def __init__(self, resource) -> None:
+        super().__init__(resource)
+        self._axes: dict[int, TableControlAxis] = {}
+        self._queued_moves: dict[int, float] | None = None
+
     def identify(self) -> str:
         return self.resource.query("*IDN?").strip()
 
@@ -75,13 +104,16 @@ class TableControl(MotionController):
         response = self.resource.query("SYS:ERR?").strip()
         code, message = parse_error(response)
         if code:
+            self.invalidate("position")  # target may have been rejected
             return InstrumentError(code, message)
         return None
 
     def __getitem__(self, index: int) -> TableControlAxis:
         if index not in self.AXIS_IDS:
             raise IndexError(f"invalid axis index {index}; valid: {self.AXIS_IDS}")
-        return TableControlAxis(self.resource, index)
+        if index not in self._axes:
+            self._axes[index] = TableControlAxis(self.resource, index, self)
+        return self._axes[index]
 
     def calibrate(self) -> None: ...  # Not Implemented
 
@@ -93,23 +125,101 @@ class TableControl(MotionController):
         return self.resource.query("CAL?").strip() == "3,3,3"
 
     def move_absolute(self, position: Position) -> None:
-        x, y, z = position
+        x, y, z = map(float, position)
         self.resource.write(f"MOVE:ABS {x:.6f},{y:.6f},{z:.6f}")
+        self.state_cache.update("position", (x, y, z))
 
     def move_relative(self, position: Position) -> None:
-        x, y, z = position
+        x, y, z = map(float, position)
         self.resource.write(f"MOVE:REL {x:.6f},{y:.6f},{z:.6f}")
+        target = self.state_cache.get("position")
+        if target is not None:
+            tx, ty, tz = target
+            self.state_cache.update("position", (tx + x, ty + y, tz + z))
+
+    def move_axes(self, values: Mapping[int, float]) -> None:
+        """Move axes by index to absolute positions using a single
+        `MOVE:ABS`, other axes keep their target position.
+
+        >>> table.move_axes({1: 10.0, 3: 2.5})
+        """
+        self._check_axes(values)
+        if self._queued_moves is not None:
+            self._queued_moves.update(values)
+            return
+        position = list(self.target_position)
+        for index, value in values.items():
+            position[index - 1] = value
+        self.move_absolute(position)
+
+    def move_axes_relative(self, values: Mapping[int, float]) -> None:
+        """Move axes by index relative to their target position."""
+        self._check_axes(values)
+        if self._queued_moves is not None:
+            target = self.target_position
+            moves = self._queued_moves
+            self.move_axes(
+                {
+                    index: moves.get(index, target[index - 1]) + value
+                    for index, value in values.items()
+                }
+            )
+            return
+        position = [0.0, 0.0, 0.0]
+        for index, value in values.items():
+            position[index - 1] = value
+        self.move_relative(position)
+
+    def _check_axes(self, indices: Iterable[int]) -> None:
+        for index in indices:
+            if index not in self.AXIS_IDS:
+                raise IndexError(f"invalid axis index {index}; valid: {self.AXIS_IDS}")
+
+    @contextmanager
+    def queue_moves(self) -> Iterator[None]:
+        """Context queueing axis moves, sent as a single `MOVE:ABS` at the
+        end of the block. Queued moves are discarded if the block raises.
+
+        >>> with table.queue_moves():
+        ...     table[1].move_absolute(10.0)
+        ...     table[2].move_absolute(20.0)
+        """
+        if self._queued_moves is not None:
+            yield
+            return
+        self._queued_moves = {}
+        try:
+            yield
+            moves = self._queued_moves
+        finally:
+            self._queued_moves = None
+        if moves:
+            self.move_axes(moves)
+
+    @property
+    def target_position(self) -> tuple[float, float, float]:
+        """Return target position of last move, queries the current position
+        if no move is cached."""
+        target = self.state_cache.get("position")
+        if target is None:
+            target = self.position
+        return target
 
     def abort(self) -> None:
         self.resource.write("MOVE:ABORT")
+        self.invalidate("position")
 
     def force_abort(self) -> None:
         self.resource.write("MOVE:ABORT")
+        self.invalidate("position")
 
     @property
-    def position(self) -> Position:
+    def position(self) -> tuple[float, float, float]:
         x, y, z = split_tokens(self.resource.query("POS?"))
-        return float(x), float(y), float(z)
+        position = float(x), float(y), float(z)
+        if "position" not in self.state_cache:
+            self.state_cache.update("position", position)
+        return position
 
     @property
     def is_moving(self) -> bool:
@@ -120,4 +230,8 @@ class TableControl(MotionController):
         return False  # Not Implemented
 
     @joystick_enabled.setter
-    def joystick_enabled(self, value: bool) -> None: ...  # Not Implemented
+    def joystick_enabled(self, value: bool) -> None:
+        # Joystick control is not implemented, enabling it only invalidates
+        # the cached target position
+        if value:
+            self.invalidate("position")
@@ -1,14 +1,19 @@
 from collections.abc import Iterator
 
+from comet.driver.batch import BatchMixin, join_scpi_messages
 from comet.driver.generic import InstrumentError
 from comet.driver.generic.power_supply import PowerSupply, PowerSupplyChannel
 
 __all__ = ["NGE100", "NGE100Channel"]
 
 
-class NGE100Channel(PowerSupplyChannel):
+class NGE100Channel(BatchMixin, PowerSupplyChannel):
     """Single channel of the NGE100 power supply"""
 
+    def __init__(self, resource, channel: int, supply: "NGE100 | None" = None) -> None:
+        super().__init__(resource, channel)
+        self.supply: NGE100 | None = supply
+
     @property
     def enabled(self) -> bool:
         value = int(self.query("OUTPut?"))
@@ -54,25 +59,43 @@ class NGE100Channel(PowerSupplyChannel):
 
     # Helper
     def query(self, message: str) -> str:
-        self.resource.write(f"INSTrument {self.channel + 1}")
+        self.select()
         return self.resource.query(message).strip()
 
     def write(self, message: str) -> None:
-        self.resource.write(f"INSTrument {self.channel + 1}")
+        self.select()
         self.resource.write(message)
-        self.resource.query("*OPC?")
+        self.sync_write()
+
+    def select(self) -> None:
+        """Select channel unless already selected by the power supply."""
+        supply = self.supply
+        if supply is not None and supply.selected_channel == self.channel:
+            return
+        self.resource.write(f"INSTrument {self.channel + 1}")
+        if supply is not None:
+            supply.selected_channel = self.channel
+
+    def invalidate(self) -> None:
+        if self.supply is not None:
+            self.supply.invalidate()
 
 
-class NGE100(PowerSupply):
+class NGE100(BatchMixin, PowerSupply):
     """Rohde & Schwarz NGE100 power supply featuring multiple channels"""
 
     N_CHANNELS: int = 3
 
+    def __init__(self, resource) -> None:
+        super().__init__(resource)
+        self.selected_channel: int | None = None
+
     def identify(self) -> str:
         return self.query("*IDN?")
 
     def reset(self) -> None:
         self.write("*RST")
+        self.invalidate()
 
     def clear(self) -> None:
         self.write("*CLS")
@@ -83,27 +106,55 @@ class NGE100(PowerSupply):
             return InstrumentError(int(code), message.strip("'"))
         return None
 
+    def measure_all(self) -> list[tuple[float, float, float]]:
+        """Return voltage, current and power readings of all channels using
+        a single compound query.
+
+        >>> for voltage, current, power in nge.measure_all():
+        ...     print(voltage, current, power)
+        """
+        messages = []
+        for channel in range(type(self).N_CHANNELS):
+            messages.extend(
+                [
+                    f"INSTrument {channel + 1}",
+                    "MEASure:SCALar:VOLTage:DC?",
+                    "MEASure:SCALar:CURRent:DC?",
+                    "MEASure:SCALar:POWer?",
+                ]
+            )
+        (message,) = join_scpi_messages(messages)
+        self.selected_channel = None
+        values = [float(value) for value in self.query(message).split(";")]
+        self.selected_channel = type(self).N_CHANNELS - 1
+        return [
+            (values[index], values[index + 1], values[index + 2])
+            for index in range(0, len(values), 3)
+        ]
+
+    def invalidate(self) -> None:
+        """Forget the selected channel, required if channels were selected
+        by other means than the driver's channels."""
+        self.selected_channel = None
+
     def query(self, message: str) -> str:
         return self.resource.query(message).strip()
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
 
     def __getitem__(self, channel: int) -> NGE100Channel:
         if not isinstance(channel, int):
             raise TypeError("Channel index must be an integer")
         if channel not in range(type(self).N_CHANNELS):
             raise IndexError("Channel index out of range")
-        return NGE100Channel(self.resource, channel)
+        channel_ = NGE100Channel(self.resource, channel, self)
+        channel_.write_sync = self.write_sync
+        return channel_
 
     def __iter__(self) -> Iterator[NGE100Channel]:
-        return iter(
-            [
-                NGE100Channel(self.resource, channel)
-                for channel in range(type(self).N_CHANNELS)
-            ]
-        )
+        return iter([self[channel] for channel in range(type(self).N_CHANNELS)])
 
     def __len__(self) -> int:
         return type(self).N_CHANNELS
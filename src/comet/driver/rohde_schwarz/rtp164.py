@@ -1,13 +1,27 @@
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 import numpy as np
 
+from comet.driver.cache import StateCacheMixin
 from comet.driver.generic import InstrumentError
 from comet.driver.generic.oscilloscope import Oscilloscope, OscilloscopeChannel
 
 __all__ = ["RTP164", "RTP164Channel"]
 
 
+def read_waveform_header(resource, channel: int) -> tuple[float, float, int]:
+    """Return start time, stop time and record length of channel waveform."""
+    head = resource.query(f":CHAN{channel + 1}:DATA:HEAD?").strip()
+    xmin, xmax, pts, *_ = [float(x) for x in head.split(",")]
+    return xmin, xmax, int(pts)
+
+
+def read_time_axis(resource, channel: int) -> np.ndarray:
+    """Return time axis of channel from its waveform header."""
+    xmin, xmax, pts = read_waveform_header(resource, channel)
+    return np.linspace(xmin, xmax, pts, endpoint=True)
+
+
 class RTP164Channel(OscilloscopeChannel):
     """Single channel of the RTP164 oscilloscope"""
 
@@ -22,11 +36,7 @@ class RTP164Channel(OscilloscopeChannel):
         self.resource.write(f":CHAN{self.channel + 1}:STAT {value}")
 
     def time_axis(self) -> list[float]:
-        source = f"CHAN{self.channel + 1}"
-        head = self.resource.query(f":{source}:DATA:HEAD?").strip()
-        xmin, xmax, pts, *_ = [float(x) for x in head.split(",")]
-        t = np.linspace(xmin, xmax, int(pts), endpoint=True)
-        return t.tolist()
+        return read_time_axis(self.resource, self.channel).tolist()
 
     def acquire_waveform(self) -> list[float]:
         self.resource.write("SING")
@@ -39,7 +49,7 @@ class RTP164Channel(OscilloscopeChannel):
         return values
 
 
-class RTP164(Oscilloscope):
+class RTP164(StateCacheMixin, Oscilloscope):
     """Rohde & Schwarz RTP164 oscilloscope with 4 channels"""
 
     N_CHANNELS: int = 4
@@ -53,6 +63,7 @@ class RTP164(Oscilloscope):
     def clear(self) -> None:
         self.resource.write("*CLS")
         self.resource.query("*OPC?")
+        self.invalidate()
 
     def next_error(self) -> InstrumentError | None:
         code, message = self.resource.query("SYST:ERR?").split(",")
@@ -69,6 +80,73 @@ class RTP164(Oscilloscope):
         self.resource.write("EXP:WAV:INCX OFF")
         self.resource.write("ACQ:COUN 1")
         self.resource.query("*OPC?")
+        self.invalidate()
+
+    def time_axis(self) -> np.ndarray:
+        """Return cached time axis of waveforms, read from the waveform
+        header of the first channel if not cached.
+
+        The cache is refreshed by `acquire()` whenever record length, sample
+        interval or position change, call `invalidate()` after changing the
+        time base without acquiring.
+        """
+        time_axis = self.state_cache.get("time_axis")
+        if time_axis is None:
+            time_axis = self._update_time_axis(read_waveform_header(self.resource, 0))
+        return time_axis
+
+    def acquire(self, channels: Iterable[int] | None = None) -> np.ndarray:
+        """Acquire waveforms of channels using a single trigger, returns a
+        float32 array of shape (n_channels, n_points).
+
+        Without `channels` all enabled channels are acquired.
+
+        >>> waveforms = scope.acquire(channels=[0, 2])
+        >>> t = scope.time_axis()
+        """
+        if channels is None:
+            channels = [channel.channel for channel in self if channel.enabled]
+        else:
+            channels = [self[channel].channel for channel in channels]
+        if not channels:
+            raise ValueError("No channels to acquire")
+
+        self.resource.write("SING")
+        self.resource.query("*OPC?")
+
+        header = read_waveform_header(self.resource, channels[0])
+        if not self.state_cache.is_current("waveform_header", header):
+            self._update_time_axis(header)
+
+        record_length = header[2]
+        waveforms = np.empty((len(channels), record_length), dtype=np.float32)
+        for row, channel in enumerate(channels):
+            values = self._query_waveform(channel)
+            if len(values) != record_length:
+                raise ValueError(
+                    f"Waveform length mismatch of channel {channel}: "
+                    f"{len(values)} != {record_length}"
+                )
+            waveforms[row] = values
+        return waveforms
+
+    def _update_time_axis(self, header: tuple[float, float, int]) -> np.ndarray:
+        # Start and stop time together with record length determine sample
+        # interval and position, so the header is used as cache key.
+        xmin, xmax, pts = header
+        time_axis = np.linspace(xmin, xmax, pts, endpoint=True)
+        time_axis.flags.writeable = False
+        self.state_cache.update("waveform_header", header)
+        self.state_cache.update("time_axis", time_axis)
+        return time_axis
+
+    def _query_waveform(self, channel: int) -> np.ndarray:
+        return self.resource.query_binary_values(
+            f":CHAN{channel + 1}:DATA?",
+            datatype="f",
+            is_big_endian=False,
+            container=np.ndarray,
+        )
 
     def __getitem__(self, channel: int) -> RTP164Channel:
         if not isinstance(channel, int):
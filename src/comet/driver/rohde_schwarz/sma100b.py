@@ -1,3 +1,4 @@
+from comet.driver.batch import BatchMixin
 from comet.driver.generic import Instrument, InstrumentError
 
 __all__ = ["SMA100B"]
@@ -8,7 +9,7 @@ def parse_error(response: str):
     return int(code), message.strip('"')
 
 
-class SMA100B(Instrument):
+class SMA100B(BatchMixin, Instrument):
     """Class for controlling Rohde&Schwarz SMA100B signal generator"""
 
     OUTPUT_ON: bool = True
@@ -108,4 +109,4 @@ class SMA100B(Instrument):
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
@@ -0,0 +1,142 @@
+import math
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+__all__ = ["WriteSync", "WriteSyncMixin", "extended_timeout"]
+
+
+@contextmanager
+def extended_timeout(resource: Any, duration: float | None) -> Iterator[None]:
+    """Context extending the timeout of a VISA resource (in milliseconds) by
+    `duration` seconds, restoring the previous timeout when leaving.
+
+    Resources without finite timeout are left untouched.
+    """
+    timeout = getattr(resource, "timeout", None)
+    if (
+        not duration
+        or isinstance(timeout, bool)
+        or not isinstance(timeout, (int, float))
+        or math.isinf(timeout)
+    ):
+        yield
+        return
+    resource.timeout = timeout + duration * 1e3
+    try:
+        yield
+    finally:
+        resource.timeout = timeout
+
+
+class WriteSync:
+    """Write synchronisation policy and state of a driver.
+
+    Policies:
+        always: wait for operation complete after every write (default),
+        never: never wait for operation complete,
+        batch: wait only when leaving a deferred sync block,
+        N (int): wait after every N-th write.
+
+    Inside deferred sync blocks writes are not synchronised, except policy
+    never all pending writes are synchronised once when leaving the block.
+    """
+
+    ALWAYS: str = "always"
+    NEVER: str = "never"
+    BATCH: str = "batch"
+
+    def __init__(self, policy: str | int = ALWAYS) -> None:
+        self.policy = policy
+        self.pending: int = 0
+        self.depth: int = 0
+
+    @property
+    def policy(self) -> str | int:
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: str | int) -> None:
+        if not self.is_valid_policy(policy):
+            raise ValueError(f"Invalid write sync policy: {policy!r}")
+        self._policy: str | int = policy
+
+    @classmethod
+    def is_valid_policy(cls, policy: Any) -> bool:
+        if isinstance(policy, bool):
+            return False
+        if isinstance(policy, int):
+            return policy > 0
+        return policy in (cls.ALWAYS, cls.NEVER, cls.BATCH)
+
+    def count_write(self) -> bool:
+        """Register a write, returns True if the write must be synchronised."""
+        self.pending += 1
+        if self.depth:
+            return False
+        if self.policy == self.ALWAYS:
+            return True
+        if isinstance(self.policy, int):
+            return self.pending >= self.policy
+        return False
+
+    def reset(self) -> None:
+        """Reset pending writes after synchronisation."""
+        self.pending = 0
+
+
+class WriteSyncMixin:
+    """Mixin for drivers waiting for operation complete (`*OPC?`) after
+    writes according to a write synchronisation policy."""
+
+    resource: Any
+
+    @property
+    def write_sync(self) -> WriteSync:
+        write_sync = self.__dict__.get("_write_sync")
+        if write_sync is None:
+            write_sync = WriteSync()
+            self.__dict__["_write_sync"] = write_sync
+        return write_sync
+
+    @write_sync.setter
+    def write_sync(self, write_sync: WriteSync) -> None:
+        self.__dict__["_write_sync"] = write_sync
+
+    def sync(self, duration: float | None = None) -> None:
+        """Wait for all pending operations to complete.
+
+        For long running operations the expected `duration` in seconds
+        extends the resource timeout while waiting.
+
+        >>> smu.sync(duration=count * interval)
+        """
+        with extended_timeout(self.resource, duration):
+            self.resource.query("*OPC?")
+        self.write_sync.reset()
+
+    def sync_write(self) -> None:
+        """Synchronise a write according to the write sync policy."""
+        if self.write_sync.count_write():
+            self.sync()
+
+    @contextmanager
+    def deferred_sync(self) -> Iterator[None]:
+        """Context deferring write synchronisation to the end of the block.
+
+        >>> with smu.deferred_sync():
+        ...     smu.function = smu.FUNCTION_VOLTAGE
+        ...     smu.voltage_range = 200.0
+        """
+        write_sync = self.write_sync
+        write_sync.depth += 1
+        try:
+            yield
+        finally:
+            write_sync.depth -= 1
+        if (
+            not write_sync.depth
+            and write_sync.pending
+            and write_sync.policy != WriteSync.NEVER
+        ):
+            self.sync()
@@ -1,3 +1,4 @@
+from comet.driver.batch import BatchMixin
 from comet.driver.generic import Instrument, InstrumentError
 
 __all__ = ["PM100"]
@@ -8,7 +9,7 @@ def parse_error(response: str) -> tuple[int, str]:
     return int(code), message.strip('"')
 
 
-class PM100(Instrument):
+class PM100(BatchMixin, Instrument):
     """Class for controlling Thorlabs PM100 USB power meters"""
 
     WAVELENGTH_UV: int = 370
@@ -84,4 +85,4 @@ class PM100(Instrument):
 
     def write(self, message: str) -> None:
         self.resource.write(message)
-        self.query("*OPC?")
+        self.sync_write()
@@ -3,13 +3,15 @@ from __future__ import annotations
 import importlib
 import inspect
 import logging
+import pkgutil
 import re
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from ..utils import parse_model_urn
-from .response import Response, make_response
+from .response import Response, TextResponse, make_response
 
 __all__ = ["Emulator", "Context", "emulator_cls_factory", "message"]
 
@@ -17,6 +19,9 @@ logger = logging.getLogger(__name__)
 
 emulator_registry: dict[str, type[Emulator]] = {}
 
+# Dispatch tables do not keep emulator classes created at runtime alive.
+route_tables: weakref.WeakKeyDictionary[type, RouteTable] = weakref.WeakKeyDictionary()
+
 
 def emulator_cls_factory(model_urn: str) -> type[Emulator]:
     """Returns emulator class from model specified by URN."""
@@ -48,6 +53,17 @@ def emulator_cls_factory(model_urn: str) -> type[Emulator]:
     return emulator_registry[key]
 
 
+def iter_emulator_classes() -> Iterator[type[Emulator]]:
+    """Import all modules of the comet.emulator package and yield the
+    emulator classes defined in them."""
+    package = importlib.import_module(__package__ or "comet.emulator")
+    for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+        module = importlib.import_module(module_info.name)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, Emulator) and cls.__module__ == module.__name__:
+                yield cls
+
+
 def normalize_route(pattern: str) -> str:
     """Remove a leading ^ only if it's at the very start of the regex (and not escaped)."""
     if pattern.startswith("^") and not pattern.startswith(r"\^"):
@@ -73,6 +89,29 @@ class Route:
         return m.groups() if m else None
 
 
+def split_message(message: str, separator: str) -> list[str]:
+    """Split compound message by separator, ignoring separators in quoted
+    strings. Empty messages are dropped.
+
+    >>> split_message(":SYST:BEEP 0;:DISP:TEXT 'A;B'", ";")
+    [':SYST:BEEP 0', ":DISP:TEXT 'A;B'"]
+    """
+    messages: list[str] = []
+    quote: str | None = None
+    start = 0
+    for index, char in enumerate(message):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif message.startswith(separator, index):
+            messages.append(message[start:index])
+            start = index + len(separator)
+    messages.append(message[start:])
+    return [part.strip() for part in messages if part.strip()]
+
+
 def get_routes(cls: type) -> list[Route]:
     """Return routes with subclass overrides by regex pattern."""
     by_pattern: dict[tuple[str, int], Route] = {}
@@ -91,6 +130,338 @@ def get_routes(cls: type) -> list[Route]:
     return routes
 
 
+class RouteTable:
+    """Precompiled dispatch table of an emulator class."""
+
+    __slots__ = ["routes"]
+
+    def __init__(self, routes: list[Route]) -> None:
+        self.routes: tuple[Route, ...] = tuple(routes)
+
+    def match(self, message: str) -> tuple[Route, tuple[str, ...]] | None:
+        """Return first matching route and its captured arguments."""
+        for route in self.routes:
+            m = route.pattern.match(message)
+            if m is not None:
+                return route, m.groups()
+        return None
+
+
+MAX_LITERAL_PREFIXES: int = 64
+
+_QUANTIFIER_PATTERN = re.compile(r"\{(\d*)(,(\d*))?\}")
+
+_ESCAPES: dict[str, str] = {"n": "\n", "r": "\r", "t": "\t", "f": "\f", "v": "\v"}
+
+
+class _UnsupportedPattern(Exception): ...
+
+
+class _PrefixScanner:
+    """Scanner deriving literal prefixes from regex source. Raises
+    `_UnsupportedPattern` for syntax it does not understand."""
+
+    def __init__(self, source: str) -> None:
+        self.source: str = source
+        self.pos: int = 0
+
+    def peek(self) -> str:
+        return self.source[self.pos : self.pos + 1]
+
+    def take(self) -> str:
+        char = self.peek()
+        if not char:
+            raise _UnsupportedPattern("unexpected end of pattern")
+        self.pos += 1
+        return char
+
+    def scan(self) -> list[str]:
+        prefixes, _ = self.alternation()
+        if self.pos != len(self.source):
+            raise _UnsupportedPattern("unbalanced parenthesis")
+        return prefixes
+
+    def alternation(self) -> tuple[list[str], bool]:
+        """Return prefixes of branches and whether all were fully consumed."""
+        prefixes, complete = self.sequence()
+        while self.peek() == "|":
+            self.pos += 1
+            branch_prefixes, branch_complete = self.sequence()
+            prefixes = list(dict.fromkeys([*prefixes, *branch_prefixes]))
+            complete = complete and branch_complete
+        return prefixes, complete
+
+    def sequence(self) -> tuple[list[str], bool]:
+        prefixes: list[str] = [""]
+        complete = True
+        while self.peek() not in ("", "|", ")"):
+            alternatives, atom_complete = self.atom()
+            min_count, max_count = self.quantifier()
+            if not complete:
+                continue  # only consume remaining items
+            if alternatives is None or min_count > 1:
+                complete = False
+                continue
+            if max_count != 1:
+                atom_complete = False
+            if min_count == 0:
+                if max_count != 1:
+                    complete = False
+                    continue
+                alternatives = ["", *alternatives]
+            combined = list(
+                dict.fromkeys(p + a for p in prefixes for a in alternatives)
+            )
+            if len(combined) > MAX_LITERAL_PREFIXES:
+                complete = False
+                continue
+            prefixes = combined
+            complete = atom_complete
+        return prefixes, complete
+
+    def atom(self) -> tuple[list[str] | None, bool]:
+        """Return literal alternatives of next item (None if not literal)
+        and whether the item was fully consumed."""
+        char = self.take()
+        if char == "(":
+            return self.group()
+        if char == "[":
+            return self.character_set(), True
+        if char == "\\":
+            escaped = self.take()
+            if escaped.isalnum():
+                if escaped in _ESCAPES:
+                    return [_ESCAPES[escaped]], True
+                return None, True
+            return [escaped], True
+        if char in ".^$":
+            return None, True
+        if char in "*+?":
+            raise _UnsupportedPattern("nothing to repeat")
+        return [char], True
+
+    def group(self) -> tuple[list[str] | None, bool]:
+        literal = True
+        if self.source.startswith("?:", self.pos):
+            self.pos += 2
+        elif self.source.startswith("?P<", self.pos):
+            end = self.source.find(">", self.pos)
+            if end < 0:
+                raise _UnsupportedPattern("invalid group name")
+            self.pos = end + 1
+        elif self.source.startswith(("?=", "?!"), self.pos):
+            self.pos += 2
+            literal = False
+        elif self.source.startswith(("?<=", "?<!"), self.pos):
+            self.pos += 3
+            literal = False
+        elif self.peek() == "?":
+            raise _UnsupportedPattern("unsupported group")
+        prefixes, complete = self.alternation()
+        if self.take() != ")":
+            raise _UnsupportedPattern("missing parenthesis")
+        if not literal:
+            return None, True
+        return prefixes, complete
+
+    def character_set(self) -> list[str] | None:
+        chars: list[str] = []
+        literal = True
+        if self.peek() == "^":
+            self.pos += 1
+            literal = False
+        first = True
+        while True:
+            char = self.take()
+            if char == "]" and not first:
+                break
+            first = False
+            if char == "[":
+                raise _UnsupportedPattern("nested set")
+            if char == "\\":
+                char = self.take()
+                if char.isalnum():
+                    literal = False
+            if self.peek() == "-" and self.source[self.pos + 1 : self.pos + 2] != "]":
+                self.pos += 1
+                if self.take() == "\\":
+                    self.take()
+                literal = False
+            chars.append(char)
+        if not literal:
+            return None
+        return list(dict.fromkeys(chars))
+
+    def quantifier(self) -> tuple[int, int | None]:
+        """Return minimum and maximum count (None if unbounded) of next
+        quantifier, (1, 1) if there is none."""
+        char = self.peek()
+        if char == "*":
+            counts: tuple[int, int | None] = (0, None)
+        elif char == "+":
+            counts = (1, None)
+        elif char == "?":
+            counts = (0, 1)
+        elif char == "{":
+            match = _QUANTIFIER_PATTERN.match(self.source, self.pos)
+            if not match:
+                return 1, 1  # literal brace
+            min_text, max_text = match.group(1), match.group(3)
+            min_count = int(min_text) if min_text else 0
+            if match.group(2) is None:
+                max_count: int | None = min_count
+            else:
+                max_count = int(max_text) if max_text else None
+            self.pos = match.end() - 1
+            counts = (min_count, max_count)
+        else:
+            return 1, 1
+        self.pos += 1
+        if self.peek() in ("?", "+"):
+            self.pos += 1  # lazy or possessive
+        return counts
+
+
+def literal_prefixes(pattern: re.Pattern) -> list[str]:
+    r"""Return literal prefixes, every message matched by pattern starts with
+    one of them.
+
+    >>> literal_prefixes(re.compile(r":?SYST:ERR\?$"))
+    ['SYST:ERR?', ':SYST:ERR?']
+    """
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE) or isinstance(
+        pattern.pattern, bytes
+    ):
+        return [""]
+    try:
+        return _PrefixScanner(pattern.pattern).scan()
+    except _UnsupportedPattern:
+        return [""]
+
+
+class _PrefixNode:
+    __slots__ = ["candidates", "children", "indices"]
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.indices: set[int] = set()
+        self.candidates: tuple[Route, ...] = ()
+
+
+class PrefixRouteTable(RouteTable):
+    """Dispatch table indexing routes by their literal prefixes.
+
+    Routes are stored in a character trie by the literal prefixes of their
+    patterns. Only routes whose prefix is a prefix of a message are tried, in
+    the same order as the linear route table.
+    """
+
+    __slots__ = ["root"]
+
+    def __init__(self, routes: list[Route]) -> None:
+        super().__init__(routes)
+        self.root: _PrefixNode = _PrefixNode()
+        for index, route in enumerate(self.routes):
+            for prefix in literal_prefixes(route.pattern):
+                node = self.root
+                for char in prefix:
+                    node = node.children.setdefault(char, _PrefixNode())
+                node.indices.add(index)
+        self._assign_candidates(self.root, set())
+
+    def _assign_candidates(self, node: _PrefixNode, indices: set[int]) -> None:
+        indices = indices | node.indices
+        node.candidates = tuple(self.routes[index] for index in sorted(indices))
+        for child in node.children.values():
+            self._assign_candidates(child, indices)
+
+    def match(self, message: str) -> tuple[Route, tuple[str, ...]] | None:
+        node = self.root
+        for char in message:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+        for route in node.candidates:
+            m = route.pattern.match(message)
+            if m is not None:
+                return route, m.groups()
+        return None
+
+
+class CombinedRouteTable(RouteTable):
+    """Dispatch table compiling all routes into a single alternation regex.
+
+    Every route pattern is wrapped in a named group, alternatives are tried
+    left to right so the first matching route in order wins. Falls back to
+    linear matching if patterns can not be combined (e.g. backreferences).
+    """
+
+    __slots__ = ["pattern", "slices"]
+
+    def __init__(self, routes: list[Route]) -> None:
+        super().__init__(routes)
+        self.pattern: re.Pattern | None = None
+        self.slices: dict[int, tuple[Route, int, int]] = {}
+        if any(re.search(r"\\[1-9]|\(\?P=", route.route) for route in self.routes):
+            return
+        parts: list[str] = []
+        index = 0
+        for n, route in enumerate(self.routes):
+            parts.append(f"(?P<route{n}>{route.route})")
+            index += 1
+            self.slices[index] = route, index, index + route.pattern.groups
+            index += route.pattern.groups
+        try:
+            self.pattern = re.compile("|".join(parts) or "(?!)")
+        except re.error as exc:
+            logger.debug("unable to combine routes: %s", exc)
+            self.slices.clear()
+
+    def match(self, message: str) -> tuple[Route, tuple[str, ...]] | None:
+        if self.pattern is None:
+            return super().match(message)
+        m = self.pattern.match(message)
+        if m is None:
+            return None
+        route, start, end = self.slices[m.lastindex or 0]
+        return route, m.groups()[start:end]
+
+
+route_engines: dict[str, type[RouteTable]] = {
+    "linear": RouteTable,
+    "prefix": PrefixRouteTable,
+    "combined": CombinedRouteTable,
+}
+
+default_route_engine: str = "prefix"
+
+
+def set_default_route_engine(name: str) -> None:
+    """Select route matching engine for all emulator classes not setting
+    attribute `route_engine`."""
+    global default_route_engine
+    if name not in route_engines:
+        raise ValueError(f"Invalid route engine: {name!r}")
+    default_route_engine = name
+    invalidate_route_tables()
+
+
+def get_route_table(cls: type) -> RouteTable:
+    """Return cached dispatch table for emulator class, build it on first use."""
+    table = route_tables.get(cls)
+    if table is None:
+        engine = getattr(cls, "route_engine", None) or default_route_engine
+        table = route_engines[engine](get_routes(cls))
+        route_tables[cls] = table
+    return table
+
+
+def invalidate_route_tables() -> None:
+    """Discard all cached dispatch tables."""
+    route_tables.clear()
+
+
 def message(route: str) -> Callable[[Callable[..., Any]], Route]:
     """Decorator to register a regex route for an emulator method."""
 
@@ -105,19 +476,74 @@ class Context:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-class Emulator:
+class EmulatorType(type):
+    """Metaclass invalidating cached dispatch tables if routes or the route
+    engine are changed."""
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if (
+            name == "route_engine"
+            or isinstance(value, Route)
+            or isinstance(cls.__dict__.get(name), Route)
+        ):
+            invalidate_route_tables()
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        if name == "route_engine" or isinstance(cls.__dict__.get(name), Route):
+            invalidate_route_tables()
+        super().__delattr__(name)
+
+
+class Emulator(metaclass=EmulatorType):
+    # Route matching engine, one of `route_engines`, None for default engine.
+    route_engine: str | None = None
+
+    # Separator of compound messages (e.g. ";" for SCPI), None to disable.
+    message_separator: str | None = None
+
     def __init__(self, context: Context) -> None:
         self.context = context
 
     def __call__(self, message: str) -> Response | list[Response] | None:
+        if self.message_separator and self.message_separator in message:
+            messages = split_message(message, self.message_separator)
+            if len(messages) > 1:
+                return self.handle_compound_message(messages)
+        return self.handle_message(message)
+
+    def handle_compound_message(
+        self, messages: list[str]
+    ) -> Response | list[Response] | None:
+        """Handle messages of a compound message in order, text responses are
+        joined into a single response."""
+        responses: list[Response] = []
+        for message in messages:
+            response = self.handle_message(message.lstrip(":"))
+            if isinstance(response, list):
+                responses.extend(response)
+            elif response is not None:
+                responses.append(response)
+        if not responses:
+            return None
+        if len(responses) > 1 and all(
+            isinstance(response, TextResponse) for response in responses
+        ):
+            separator = self.message_separator or ""
+            return TextResponse(separator.join(map(str, responses)))
+        if len(responses) == 1:
+            return responses[0]
+        return responses
+
+    def handle_message(self, message: str) -> Response | list[Response] | None:
         logger.debug("handle message: %s", message)
-        for route in get_routes(type(self)):
-            args = route.match(message)
-            if args is not None:
-                response = route(self, *args)
-                if response is not None:
-                    if isinstance(response, (list, tuple)):
-                        return [make_response(res) for res in response]
-                    return make_response(response)
-                return response
+        match = get_route_table(type(self)).match(message)
+        if match is not None:
+            route, args = match
+            response = route(self, *args)
+            if response is not None:
+                if isinstance(response, (list, tuple)):
+                    return [make_response(res) for res in response]
+                return make_response(response)
+            return response
         return None
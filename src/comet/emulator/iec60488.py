@@ -8,6 +8,8 @@ __all__ = ["IEC60488Emulator"]
 class IEC60488Emulator(Emulator):
     IDENTITY: str = "Generic IEC60488 Instrument (Emulator)"
 
+    message_separator: str | None = ";"
+
     @message(r"\*IDN\?$")
     def get_idn(self):
         return self.context.options.get("identity", self.IDENTITY)
@@ -4,7 +4,9 @@ import random
 import time
 from dataclasses import astuple, dataclass
 
-from comet.emulator import Context, Emulator, message, run
+from comet.emulator import Context, message, run
+
+from .venus import VenusEmulator
 
 __all__ = ["CorvusTTEmulator"]
 
@@ -19,7 +21,7 @@ class TableLimits:
     c2: float
 
 
-class CorvusTTEmulator(Emulator):
+class CorvusTTEmulator(VenusEmulator):
     """Corvus TT (Venus-1) emulator."""
 
     def __init__(self, context: Context) -> None:
@@ -2,12 +2,14 @@
 
 import random
 
-from comet.emulator import Context, Emulator, message, run
+from comet.emulator import Context, message, run
+
+from .venus import VenusEmulator
 
 __all__ = ["HydraEmulator"]
 
 
-class HydraEmulator(Emulator):
+class HydraEmulator(VenusEmulator):
     """Hydra (Venus-3) emulator."""
 
     def __init__(self, context: Context) -> None:
@@ -29,6 +31,7 @@ class HydraEmulator(Emulator):
 
         self.axes_moving: int = 0
         self.manual_move: int = 0
+        self.manual_control: dict[str, int] = {"1": 0, "2": 0}
 
         self.cpu_temperature: float = float(options.get("cpu_temperature", 40.0))
 
@@ -106,6 +109,18 @@ class HydraEmulator(Emulator):
         elif axis == "2":
             self.y_pos = pos
 
+    @message(r"(1|2)\s+(?:nabort|nab)$")
+    def set_nabort(self, axis) -> None:
+        self.axes_moving = 0
+
+    @message(r"(1|2)\s+getmanctrl$")
+    def get_manctrl(self, axis) -> int:
+        return self.manual_control[axis]
+
+    @message(r"(\d+)\s+(1|2)\s+setmanctrl$")
+    def set_manctrl(self, value, axis) -> None:
+        self.manual_control[axis] = int(value)
+
     @message(r"(1|2)\s+(?:ncalibrate|ncal)$")
     def set_ncalibrate(self, axis) -> None:
         self.calibrate[axis] = 0x1
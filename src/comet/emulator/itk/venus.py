@@ -0,0 +1,51 @@
+"""Venus command language emulator base."""
+
+import re
+
+from comet.emulator import Emulator
+from comet.emulator.response import Response
+
+__all__ = ["VenusEmulator", "split_venus_message"]
+
+NUMBER_PATTERN = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?$")
+
+
+def split_venus_message(message: str) -> list[str]:
+    """Split Venus command line into commands, every command consists of its
+    numeric parameters followed by the command name.
+
+    >>> split_venus_message("1 getcaldone 2.5 0 0 move st")
+    ['1 getcaldone', '2.5 0 0 move', 'st']
+    """
+    commands: list[str] = []
+    tokens: list[str] = []
+    for token in message.split():
+        tokens.append(token)
+        if not NUMBER_PATTERN.match(token):
+            commands.append(" ".join(tokens))
+            tokens.clear()
+    if tokens:
+        commands.append(" ".join(tokens))
+    return commands
+
+
+class VenusEmulator(Emulator):
+    """Emulator executing all commands of a Venus command line in order,
+    responses of every command are returned as separate lines."""
+
+    def __call__(self, message: str) -> Response | list[Response] | None:
+        commands = split_venus_message(message)
+        if len(commands) < 2:
+            return self.handle_message(message)
+        responses: list[Response] = []
+        for command in commands:
+            response = self.handle_message(command)
+            if isinstance(response, list):
+                responses.extend(response)
+            elif response is not None:
+                responses.append(response)
+        if not responses:
+            return None
+        if len(responses) == 1:
+            return responses[0]
+        return responses
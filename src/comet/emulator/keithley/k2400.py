@@ -1,7 +1,8 @@
+import math
 import random
 from typing import ClassVar
 
-from comet.emulator import Context, IEC60488Emulator, message, run
+from comet.emulator import BinaryResponse, Context, IEC60488Emulator, message, run
 from comet.emulator.utils import Error
 
 
@@ -38,6 +39,17 @@ class K2400Emulator(IEC60488Emulator):
         self.sense_nplc: float = 1.0
         self.format_elements = FormatElements()
         self.format_elements.update(["VOLT", "CURR", "RES", "TIME", "STAT"])
+        self.format_data: str = "ASC"
+        self.format_byte_order: str = "NORM"
+        self.trigger_count: int = 1
+        self.trigger_delay: float = 0.0
+        self.trace_points: int = 100
+        self.trace_feed_control: str = "NEV"
+        self.trace_buffer: list[list[float]] = []
+        self.source_voltage_mode: str = "FIX"
+        self.source_list_voltage: list[float] = []
+        self.source_delay: float = 0.0
+        self.source_sweep_cabort: str = "NEV"
 
         self.volt_min = float(options.get("volt.min", 0))
         self.volt_max = float(options.get("volt.max", 10))
@@ -65,6 +77,17 @@ class K2400Emulator(IEC60488Emulator):
         self.sense_nplc = 1.0
         self.format_elements.clear()
         self.format_elements.update(["VOLT", "CURR", "RES", "TIME", "STAT"])
+        self.format_data = "ASC"
+        self.format_byte_order = "NORM"
+        self.trigger_count = 1
+        self.trigger_delay = 0.0
+        self.trace_points = 100
+        self.trace_feed_control = "NEV"
+        self.trace_buffer.clear()
+        self.source_voltage_mode = "FIX"
+        self.source_list_voltage.clear()
+        self.source_delay = 0.0
+        self.source_sweep_cabort = "NEV"
 
     @message(r"\*CLS$")
     def set_cls(self) -> None:
@@ -153,6 +176,54 @@ class K2400Emulator(IEC60488Emulator):
         except ValueError:
             self.error_queue.append(Error(101, "malformed command"))
 
+    # Source list sweep
+
+    @message(r":?SOUR:VOLT:MODE\?$")
+    def get_source_voltage_mode(self) -> str:
+        return self.source_voltage_mode
+
+    @message(r":?SOUR:VOLT:MODE\s+(FIX|LIST|SWE)$")
+    def set_source_voltage_mode(self, mode: str) -> None:
+        self.source_voltage_mode = mode
+
+    @message(r":?SOUR:LIST:VOLT\s+(.+)$")
+    def set_source_list_voltage(self, levels: str) -> None:
+        self.source_list_voltage.clear()
+        self._append_source_list_voltage(levels)
+
+    @message(r":?SOUR:LIST:VOLT:APP\s+(.+)$")
+    def set_source_list_voltage_append(self, levels: str) -> None:
+        self._append_source_list_voltage(levels)
+
+    def _append_source_list_voltage(self, levels: str) -> None:
+        try:
+            self.source_list_voltage.extend(float(level) for level in levels.split(","))
+        except ValueError:
+            self.error_queue.append(Error(-102, "Syntax error"))
+
+    @message(r":?SOUR:LIST:VOLT:POIN\?$")
+    def get_source_list_voltage_points(self) -> str:
+        return format(len(self.source_list_voltage), "d")
+
+    @message(r":?SOUR:DEL\?$")
+    def get_source_delay(self) -> str:
+        return format(self.source_delay, "E")
+
+    @message(r":?SOUR:DEL\s+(.+)$")
+    def set_source_delay(self, delay: str) -> None:
+        try:
+            self.source_delay = float(delay)
+        except ValueError:
+            self.error_queue.append(Error(-102, "Syntax error"))
+
+    @message(r":?SOUR:SWE:CAB\?$")
+    def get_source_sweep_cabort(self) -> str:
+        return self.source_sweep_cabort
+
+    @message(r":?SOUR:SWE:CAB\s+(NEV|EARL|LATE)$")
+    def set_source_sweep_cabort(self, cabort: str) -> None:
+        self.source_sweep_cabort = cabort
+
     # Source range levels
 
     @message(r":?SOUR:(VOLT|CURR):RANG\?$")
@@ -313,25 +384,90 @@ class K2400Emulator(IEC60488Emulator):
         self.format_elements.clear()
         self.format_elements.update(elements)
 
+    @message(r":?FORM(?::DATA)?\?$")
+    def get_format_data(self) -> str:
+        return self.format_data
+
+    @message(r":?FORM(?::DATA)?\s+(ASC(?:ii)?|REAL,\s*32|SRE(?:AL)?)$")
+    def set_format_data(self, data: str) -> None:
+        self.format_data = "ASC" if data.startswith("ASC") else "REAL,32"
+
+    @message(r":?FORM:BORD\?$")
+    def get_format_byte_order(self) -> str:
+        return self.format_byte_order
+
+    @message(r":?FORM:BORD\s+(NORM(?:al)?|SWAP(?:ped)?)$")
+    def set_format_byte_order(self, byte_order: str) -> None:
+        self.format_byte_order = byte_order[:4]
+
+    # Trigger
+
+    @message(r":?TRIG:COUN\?$")
+    def get_trigger_count(self) -> str:
+        return format(self.trigger_count, "d")
+
+    @message(r":?TRIG:COUN\s+(\d+)$")
+    def set_trigger_count(self, count: str) -> None:
+        self.trigger_count = int(count)
+
+    @message(r":?TRIG:DEL\?$")
+    def get_trigger_delay(self) -> str:
+        return format(self.trigger_delay, "E")
+
+    @message(r":?TRIG:DEL\s+(.+)$")
+    def set_trigger_delay(self, delay: str) -> None:
+        try:
+            self.trigger_delay = float(delay)
+        except ValueError:
+            self.error_queue.append(Error(-102, "Syntax error"))
+
+    # Trace
+
+    @message(r":?TRAC:CLE$")
+    def set_trace_clear(self) -> None:
+        self.trace_buffer.clear()
+
+    @message(r":?TRAC:POIN\?$")
+    def get_trace_points(self) -> str:
+        return format(self.trace_points, "d")
+
+    @message(r":?TRAC:POIN\s+(\d+)$")
+    def set_trace_points(self, points: str) -> None:
+        self.trace_points = int(points)
+
+    @message(r":?TRAC:FEED\s+(SENS|CALC|NONE)$")
+    def set_trace_feed(self, feed: str) -> None: ...
+
+    @message(r":?TRAC:FEED:CONT\?$")
+    def get_trace_feed_control(self) -> str:
+        return self.trace_feed_control
+
+    @message(r":?TRAC:FEED:CONT\s+(NEXT|NEV)$")
+    def set_trace_feed_control(self, control: str) -> None:
+        self.trace_feed_control = control
+
+    @message(r":?TRAC:DATA\?$")
+    def get_trace_data(self) -> str | BinaryResponse:
+        return self._format_readings(self.trace_buffer)
+
     # Measure
 
     @message(r":?INIT(?:iate)?$")
-    def set_initiate(self) -> None: ...
+    def set_initiate(self) -> None:
+        readings = [self._read_elements() for _ in range(self.trigger_count)]
+        if self.trace_feed_control == "NEXT":
+            free = self.trace_points - len(self.trace_buffer)
+            self.trace_buffer.extend(readings[:free])
+            if len(self.trace_buffer) >= self.trace_points:
+                self.trace_feed_control = "NEV"
 
     @message(r":?READ\?$")
-    def get_read(self) -> str:
-        result = []
-        if "VOLT" in self.format_elements._values:
-            result.append(format(random.uniform(self.volt_min, self.volt_max), "E"))
-        if "CURR" in self.format_elements._values:
-            result.append(format(random.uniform(self.curr_min, self.curr_max), "E"))
-        if "RES" in self.format_elements._values:
-            result.append(format(float("nan")))
-        if "TIME" in self.format_elements._values:
-            result.append(format(float("nan")))
-        if "STAT" in self.format_elements._values:
-            result.append(format(0))
-        return ",".join(result)
+    def get_read(self) -> str | BinaryResponse:
+        if self.source_voltage_mode == "LIST":
+            readings = self._sweep_list_voltage()
+        else:
+            readings = [self._read_elements() for _ in range(self.trigger_count)]
+        return self._format_readings(readings)
 
     @message(r":?FETC[H]?\?$")
     def get_fetch(self) -> str:
@@ -341,6 +477,48 @@ class K2400Emulator(IEC60488Emulator):
     def unknown_message(self) -> None:
         self.error_queue.append(Error(101, "malformed command"))
 
+    def _sweep_list_voltage(self) -> list[list[float]]:
+        readings = []
+        levels = self.source_list_voltage or [self.source_level["VOLT"]]
+        for index in range(self.trigger_count):
+            level = levels[index % len(levels)]
+            self.source_level["VOLT"] = level
+            current = random.uniform(self.curr_min, self.curr_max)
+            compliance = abs(current) >= self.sense_current_protection_level
+            if compliance:
+                current = math.copysign(self.sense_current_protection_level, current)
+            readings.append(self._read_elements(level, current))
+            if compliance and self.source_sweep_cabort != "NEV":
+                break
+        return readings
+
+    def _read_elements(
+        self, voltage: float | None = None, current: float | None = None
+    ) -> list[float]:
+        if voltage is None:
+            voltage = random.uniform(self.volt_min, self.volt_max)
+        if current is None:
+            current = random.uniform(self.curr_min, self.curr_max)
+        result = []
+        if "VOLT" in self.format_elements._values:
+            result.append(voltage)
+        if "CURR" in self.format_elements._values:
+            result.append(current)
+        if "RES" in self.format_elements._values:
+            result.append(float("nan"))
+        if "TIME" in self.format_elements._values:
+            result.append(float("nan"))
+        if "STAT" in self.format_elements._values:
+            result.append(0.0)
+        return result
+
+    def _format_readings(self, readings: list[list[float]]) -> str | BinaryResponse:
+        values = [value for reading in readings for value in reading]
+        if self.format_data == "REAL,32":
+            big_endian = self.format_byte_order == "NORM"
+            return BinaryResponse.pack_real32(values, big_endian=big_endian)
+        return ",".join(format(value, "E") for value in values)
+
 
 class SenseFunction:
     ALLOWED_VALUES = ("VOLT:DC", "CURR:DC", "RES")
@@ -1,6 +1,7 @@
+import math
 import random
 
-from comet.emulator import Context, IEC60488Emulator, message, run
+from comet.emulator import BinaryResponse, Context, IEC60488Emulator, message, run
 from comet.emulator.utils import Error, tsp_assign, tsp_print
 
 
@@ -41,6 +42,12 @@ class K2470Emulator(IEC60488Emulator):
         self.sense_nplc: float = 1.0
         self.system_breakdown_protection: str = "OFF"
         self.output_interlock_tripped = bool(options.get("interlock.tripped", True))
+        self.trigger_loop: tuple[int, str] | None = None
+        self.trigger_sweep: tuple[int, int, bool, bool, str] | None = None
+        self.trace_buffers: dict[str, list[float]] = {}
+        self.source_list_voltage: list[float] = []
+        self.format_data: str = "ASC"
+        self.format_byte_order: str = "NORM"
 
         self.volt_min = float(options.get("volt.min", 0))
         self.volt_max = float(options.get("volt.max", 10))
@@ -75,6 +82,12 @@ class K2470Emulator(IEC60488Emulator):
         self.sense_average_state.update({"VOLT": False, "CURR": False})
         self.sense_nplc = 1.0
         self.system_breakdown_protection = "OFF"
+        self.trigger_loop = None
+        self.trigger_sweep = None
+        self.trace_buffers.clear()
+        self.source_list_voltage.clear()
+        self.format_data = "ASC"
+        self.format_byte_order = "NORM"
 
     @message(r"\*CLS$")
     def set_cls(self) -> None:
@@ -239,7 +252,7 @@ class K2470Emulator(IEC60488Emulator):
     def get_source_current_vlimit_level_tripped(self) -> str:
         return format(False, "E")  # TODO
 
-    @message(r":?SENS:FUNC(?::ON)?\s+\"(CURR|RES|VOLT)\"$")
+    @message(r""":?SENS:FUNC(?::ON)?\s+["'](CURR|RES|VOLT)["']$""")
     def set_sense_function_on(self, function: str) -> None:
         self.sense_function_on = function
 
@@ -332,6 +345,24 @@ class K2470Emulator(IEC60488Emulator):
     def set_sense_nplc(self, nplc: str) -> None:
         self.sense_nplc = round(float(nplc), 2)
 
+    # Format
+
+    @message(r":?FORM(?::DATA)?\?$")
+    def get_format_data(self) -> str:
+        return self.format_data
+
+    @message(r":?FORM(?::DATA)?\s+(ASC(?:ii)?|SRE(?:al)?|SREAL)$")
+    def set_format_data(self, data: str) -> None:
+        self.format_data = data[:3]
+
+    @message(r":?FORM:BORD\?$")
+    def get_format_byte_order(self) -> str:
+        return self.format_byte_order
+
+    @message(r":?FORM:BORD\s+(NORM(?:al)?|SWAP(?:ped)?)$")
+    def set_format_byte_order(self, byte_order: str) -> None:
+        self.format_byte_order = byte_order[:4]
+
     # Measure
 
     @message(r":?READ\?$")
@@ -346,7 +377,34 @@ class K2470Emulator(IEC60488Emulator):
         return f"{sour:E},{read:E}"
 
     @message(r":?INIT(?::IMM)?$")
-    def set_init(self) -> None: ...
+    def set_init(self) -> None:
+        if self.trigger_loop is not None:
+            count, buffer = self.trigger_loop
+            readings = [self._read_current() for _ in range(count)]
+            self.trace_buffers.setdefault(buffer, []).extend(readings)
+        elif self.trigger_sweep is not None:
+            start, count, fail_abort, dual, buffer = self.trigger_sweep
+            readings = self.trace_buffers.setdefault(buffer, [])
+            limit = self.source_voltage_ilimit_level
+            levels = self.source_list_voltage[start - 1 :]
+            if dual:
+                levels = levels + levels[::-1]
+            for level in levels * count:
+                self.source_level["VOLT"] = level
+                current = self._read_current()
+                tripped = abs(current) >= limit
+                readings.append(math.copysign(limit, current) if tripped else current)
+                if tripped and fail_abort:
+                    break
+
+    @message(r""":?TRIG:LOAD\s+"SimpleLoop",\s*(\d+),\s*([^,]+),\s*"(\w+)"$""")
+    def set_trigger_load_simple_loop(self, count: str, delay: str, buffer: str) -> None:
+        try:
+            float(delay)
+            self.trigger_loop = int(count), buffer
+            self.trigger_sweep = None
+        except ValueError:
+            self.error_queue.append(Error(-102, "Syntax error"))
 
     @message(r":?MEAS:VOLT\?$")
     def get_measure_voltage(self) -> str:
@@ -358,12 +416,66 @@ class K2470Emulator(IEC60488Emulator):
         curr = self._read_current()
         return format(curr, "E")
 
+    @message(r":?SOUR:LIST:VOLT\s+(.+)$")
+    def set_source_list_voltage(self, levels: str) -> None:
+        self.source_list_voltage.clear()
+        self._append_source_list_voltage(levels)
+
+    @message(r":?SOUR:LIST:VOLT:APP\s+(.+)$")
+    def set_source_list_voltage_append(self, levels: str) -> None:
+        self._append_source_list_voltage(levels)
+
+    @message(r":?SOUR:LIST:VOLT:POIN\?$")
+    def get_source_list_voltage_points(self) -> str:
+        return format(len(self.source_list_voltage), "d")
+
+    @message(
+        r""":?SOUR:SWE:VOLT:LIST\s+(\d+),\s*([^,]+),\s*(\d+),\s*(ON|OFF)"""
+        r"""(?:,\s*(ON|OFF))?(?:,\s*"(\w+)")?$"""
+    )
+    def set_source_sweep_voltage_list(
+        self,
+        start: str,
+        delay: str,
+        count: str,
+        fail_abort: str,
+        dual: str | None,
+        buffer: str | None,
+    ) -> None:
+        try:
+            float(delay)
+            self.trigger_sweep = (
+                int(start),
+                int(count),
+                fail_abort == "ON",
+                dual == "ON",
+                buffer or "defbuffer1",
+            )
+            self.trigger_loop = None
+        except ValueError:
+            self.error_queue.append(Error(-102, "Syntax error"))
+
+    @message(r":?TRAC[E]?:ACT\?(?:\s+\"([a-zA-Z0-9_]+)\")?$")
+    def get_trace_actual(self, buffer: str | None) -> str:
+        return format(len(self.trace_buffers.get(buffer or "defbuffer1", [])), "d")
+
     @message(r":?TRAC[E]?:CLE\s+\"([a-zA-Z0-9_]+)\"$")
-    def set_trace_clear(self, _buffer: str) -> None: ...
+    def set_trace_clear(self, buffer: str) -> None:
+        self.trace_buffers.pop(buffer, None)
 
     @message(r":?TRAC[E]?:TRIG\s+\"([a-zA-Z0-9_]+)\"$")
     def set_trace_trigger(self, _buffer: str) -> None: ...
 
+    @message(r":?TRAC[E]?:DATA\?\s+(\d+),\s*(\d+),\s*\"([a-zA-Z0-9_]+)\",\s*READ$")
+    def get_trace_data_readings(
+        self, start: str, end: str, buffer: str
+    ) -> str | BinaryResponse:
+        readings = self.trace_buffers.get(buffer, [])[int(start) - 1 : int(end)]
+        if self.format_data == "SRE":
+            big_endian = self.format_byte_order == "NORM"
+            return BinaryResponse.pack_real32(readings, big_endian=big_endian)
+        return ",".join(format(reading, "E") for reading in readings)
+
     @message(r":?TRAC[E]?:DATA\?\s+1,\s+1,\s+\"([a-zA-Z0-9_]+)\",\s+SOUR,\s+READ$")
     def get_trace_data(self, _buffer: str) -> str:
         sour = self._read_voltage()
@@ -418,6 +530,12 @@ class K2470Emulator(IEC60488Emulator):
     def _read_voltage(self) -> float:
         return random.uniform(self.volt_min, self.volt_max)
 
+    def _append_source_list_voltage(self, levels: str) -> None:
+        try:
+            self.source_list_voltage.extend(float(level) for level in levels.split(","))
+        except ValueError:
+            self.error_queue.append(Error(-102, "Syntax error"))
+
     def _read_current(self) -> float:
         return random.uniform(self.curr_min, self.curr_max)
 
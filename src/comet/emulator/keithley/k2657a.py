@@ -1,8 +1,18 @@
 import random
+import re
 
 from comet.emulator import Context, IEC60488Emulator, message, run
+from comet.emulator.response import Response
 from comet.emulator.utils import Error, tsp_assign, tsp_print
 
+SCRIPT_CALL_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)(?:\.run)?\(\)$")
+SCRIPT_TABLE_PATTERN = re.compile(
+    r"^(?:local\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\{(.*)$"
+)
+SCRIPT_FOR_PATTERN = re.compile(
+    r"^for\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*1\s*,\s*#([A-Za-z_][A-Za-z0-9_]*)\s+do$"
+)
+
 
 class K2657AEmulator(IEC60488Emulator):
     IDENTITY: str = "Keithley Inc., Model 2657A, 43768438, v1.0 (Emulator)"
@@ -26,10 +36,78 @@ class K2657AEmulator(IEC60488Emulator):
         self.smua_measure_filter_type: int = 1
         self.smua_measure_nplc: float = 1.0
         self.source_protectv: float = 0.0
+        self.smua_measure_count: int = 1
+        self.smua_measure_interval: float = 0.0
+        self.smua_nvbuffer1: list[float] = []
+        self.scripts: dict[str, list[str]] = {}
+        self.loading_script: str | None = None
 
         self.curr_min = float(options.get("curr.min", 1e-6))
         self.curr_max = float(options.get("curr.max", 1e-7))
 
+    def __call__(self, message: str) -> Response | list[Response] | None:
+        if self.loading_script is not None:
+            if message.strip() == "endscript":
+                self.loading_script = None
+            else:
+                self.scripts[self.loading_script].append(message)
+            return None
+        match = SCRIPT_CALL_PATTERN.match(message.strip())
+        if match and match.group(1) in self.scripts:
+            return self.run_script(match.group(1))
+        return super().__call__(message)
+
+    def run_script(self, name: str) -> list[Response] | None:
+        """Run script lines as messages, collecting responses.
+
+        Besides plain statements table constructors of values and numeric
+        `for` loops iterating over such a table are supported:
+
+            local levels = {1, 2,
+            3}
+            for i = 1, #levels do
+            smua.source.levelv = levels[i]
+            end
+        """
+        responses: list[Response] = []
+        tables: dict[str, list[str]] = {}
+        lines = [line.strip() for line in self.scripts[name]]
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            index += 1
+            match = SCRIPT_TABLE_PATTERN.match(line)
+            if match:
+                table, source = match.groups()
+                while "}" not in source and index < len(lines):
+                    source = f"{source} {lines[index]}"
+                    index += 1
+                values = source.split("}", 1)[0].split(",")
+                tables[table] = [value.strip() for value in values if value.strip()]
+                continue
+            match = SCRIPT_FOR_PATTERN.match(line)
+            if match:
+                variable, table = match.groups()
+                body: list[str] = []
+                while index < len(lines) and lines[index] != "end":
+                    body.append(lines[index])
+                    index += 1
+                index += 1  # skip end
+                for value in tables.get(table, []):
+                    for statement in body:
+                        statement = statement.replace(f"{table}[{variable}]", value)
+                        self._run_script_line(statement, responses)
+                continue
+            self._run_script_line(line, responses)
+        return responses or None
+
+    def _run_script_line(self, line: str, responses: list[Response]) -> None:
+        response = self(line)
+        if isinstance(response, list):
+            responses.extend(response)
+        elif response is not None:
+            responses.append(response)
+
     @message(r"reset\(\)$")
     def set_reset(self):
         self.error_queue.clear()
@@ -46,6 +124,9 @@ class K2657AEmulator(IEC60488Emulator):
         self.smua_measure_filter_type = 1
         self.smua_measure_nplc = 1.0
         self.source_protectv = 0.0
+        self.smua_measure_count = 1
+        self.smua_measure_interval = 0.0
+        self.smua_nvbuffer1.clear()
 
     @message(r"status.reset\(\)$")
     def set_status_reset(self) -> None:
@@ -231,6 +312,69 @@ class K2657AEmulator(IEC60488Emulator):
             self.smua_source_level.get("v", 0) + random.uniform(-0.25, +0.25), "E"
         )
 
+    @message(r"smua\.measure\.i\(smua\.nvbuffer1\)$")
+    def set_measure_i_nvbuffer1(self) -> None:
+        for _ in range(self.smua_measure_count):
+            self.smua_nvbuffer1.append(random.uniform(self.curr_min, self.curr_max))
+
+    @message(tsp_print(r"smua\.measure\.count"))
+    def get_measure_count(self) -> str:
+        return format(self.smua_measure_count, "E")
+
+    @message(tsp_assign(r"smua\.measure\.count"))
+    def set_measure_count(self, count: str) -> None:
+        try:
+            self.smua_measure_count = int(float(count))
+        except ValueError:
+            self.error_queue.append(Error(121, "malformed command"))
+
+    @message(tsp_print(r"smua\.measure\.interval"))
+    def get_measure_interval(self) -> str:
+        return format(self.smua_measure_interval, "E")
+
+    @message(tsp_assign(r"smua\.measure\.interval"))
+    def set_measure_interval(self, interval: str) -> None:
+        try:
+            self.smua_measure_interval = float(interval)
+        except ValueError:
+            self.error_queue.append(Error(122, "malformed command"))
+
+    # Buffer
+
+    @message(r"smua\.nvbuffer1\.clear\(\)$")
+    def set_nvbuffer1_clear(self) -> None:
+        self.smua_nvbuffer1.clear()
+
+    @message(tsp_print(r"smua\.nvbuffer1\.n"))
+    def get_nvbuffer1_n(self) -> str:
+        return format(len(self.smua_nvbuffer1), "E")
+
+    @message(
+        r"printbuffer\((\d+),\s*(\d+|smua\.nvbuffer1\.n),\s*smua\.nvbuffer1\.readings\)$"
+    )
+    def get_printbuffer_nvbuffer1(self, start: str, end: str) -> str:
+        stop = len(self.smua_nvbuffer1) if end == "smua.nvbuffer1.n" else int(end)
+        readings = self.smua_nvbuffer1[int(start) - 1 : stop]
+        return ", ".join(format(reading, "e") for reading in readings)
+
+    # Scripts
+
+    @message(r"loadscript\s+([A-Za-z_][A-Za-z0-9_]*)$")
+    def set_loadscript(self, name: str) -> None:
+        self.scripts[name] = []
+        self.loading_script = name
+
+    @message(r'script\.delete\("([A-Za-z_][A-Za-z0-9_]*)"\)$')
+    def set_script_delete(self, name: str) -> None:
+        self.scripts.pop(name, None)
+
+    @message(r"delay\((.+)\)$")
+    def set_delay(self, seconds: str) -> None:
+        try:
+            float(seconds)
+        except ValueError:
+            self.error_queue.append(Error(123, "malformed command"))
+
     # Average
 
     @message(tsp_print(r"smua\.measure\.filter\.enable"))
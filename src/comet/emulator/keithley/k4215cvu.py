@@ -18,6 +18,8 @@ class Correction:
 class K4215CVUEmulator(IEC60488Emulator):
     IDENTITY: str = "KEITHLEY INSTRUMENTS,KI4200A,1489223,V1.14 (Emulator)"
 
+    message_separator: str | None = None  # headers require leading colon
+
     MODEL_MAP: ClassVar[dict[str, int]] = {
         "ZTHETA": 0,
         "RPLUSJX": 1,
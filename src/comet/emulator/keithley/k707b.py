@@ -58,9 +58,7 @@ class K707BEmulator(IEC60488Emulator):
         if "allslots" in channels_:
             self.closed_channels.clear()
         else:
-            for channel in channels:
-                if channel in self.closed_channels:
-                    self.closed_channels.remove(channel)
+            self.closed_channels.difference_update(channels_)
 
     @message(r".*")
     def unknown_message(self) -> None:
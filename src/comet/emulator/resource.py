@@ -8,10 +8,37 @@
 
 from __future__ import annotations
 
+import struct
 import time
-from typing import Self
+from collections import deque
+from typing import Any, Self
+
+import numpy as np
+from pyvisa.util import (
+    ASCII_CONVERTER,
+    BINARY_DATATYPES,
+    from_ascii_block,
+    from_binary_block,
+    parse_ieee_block_header,
+)
 
 from .emulator import Context, Emulator, emulator_cls_factory
+from .response import BinaryResponse, RawResponse, Response
+
+
+def binary_dtype(datatype: str, is_big_endian: bool = False) -> np.dtype:
+    """Return NumPy dtype of a struct format character using standard sizes
+    like PyVISA (e.g. `l` is 4 bytes on all platforms).
+
+    >>> binary_dtype("l", is_big_endian=True)
+    dtype('>i4')
+    """
+    byte_order = ">" if is_big_endian else "<"
+    dtype = np.dtype(byte_order + datatype)
+    size = struct.calcsize(byte_order + datatype)
+    if dtype.itemsize != size:
+        dtype = np.dtype(f"{byte_order}{dtype.kind}{size:d}")
+    return dtype
 
 
 def open_emulator(model_urn: str, options: dict | None = None) -> EmulatorResource:
@@ -31,13 +58,25 @@ class EmulatorResource:
 
     def __init__(self, emulator: Emulator) -> None:
         self.emulator: Emulator = emulator
-        self.buffer: list = []
+        self.buffer: deque[Response] = deque()
 
     def __enter__(self) -> Self:
         return self
 
     def __exit__(self, *args) -> None: ...
 
+    def clear(self) -> None:
+        """Clear read buffer (VISA device clear)."""
+        self.buffer.clear()
+
+    def _pop(self) -> Response:
+        try:
+            return self.buffer.popleft()
+        except IndexError:
+            raise EmptyBufferError("Read buffer is empty.") from None
+
+    # Write
+
     def write(
         self,
         message: str,
@@ -48,11 +87,20 @@ class EmulatorResource:
         response = self.emulator(message)
         if response:
             if isinstance(response, (list, tuple)):
-                for res in response:
-                    self.buffer.append(response)
+                self.buffer.extend(response)
             else:
                 self.buffer.append(response)
-        return len(message + termination)
+        return len(message) + len(termination)
+
+    def write_raw(self, message: bytes) -> int:
+        encoding = self.encoding
+        termination = self.termination.encode(encoding)
+        if termination and message.endswith(termination):
+            message = message[: -len(termination)]
+        self.write(message.decode(encoding), termination="")
+        return len(message)
+
+    # Read
 
     def read(
         self,
@@ -60,12 +108,94 @@ class EmulatorResource:
         encoding: str | None = None,
     ) -> str:
         encoding = self.encoding if encoding is None else encoding
-        if not self.buffer:
-            raise EmptyBufferError("Read buffer is empty.")
-        return bytes(self.buffer.pop(0)).decode(encoding)
+        return bytes(self._pop()).decode(encoding)
+
+    def read_raw(self, size: int | None = None) -> bytes:
+        """Read next response including termination.
+
+        Argument `size` is ignored, in PyVISA it sets the chunk size of reads
+        which still return the whole response.
+        """
+        return bytes(self._pop()) + self.termination.encode(self.encoding)
+
+    def read_bytes(self, count: int) -> bytes:
+        data = bytes(self._pop())
+        if len(data) > count:
+            self.buffer.appendleft(RawResponse(data[count:]))
+        return data[:count]
+
+    def read_ascii_values(
+        self,
+        converter: ASCII_CONVERTER = "f",
+        separator: str = ",",
+        container: Any = list,
+    ) -> Any:
+        return from_ascii_block(self.read(), converter, separator, container)
+
+    def read_binary_values(
+        self,
+        datatype: BINARY_DATATYPES = "f",
+        is_big_endian: bool = False,
+        container: Any = list,
+    ) -> Any:
+        """Read binary block, with container `numpy.ndarray` returns a
+        writable array over a receive buffer holding the block's data."""
+        response = self._pop()
+        if isinstance(response, BinaryResponse):
+            block = response.data
+            offset, data_length = 0, len(block)
+        else:
+            block = bytes(response)
+            offset, data_length = parse_ieee_block_header(block)
+            if data_length < 0:  # indefinite length block `#0`
+                data_length = len(block) - offset
+        if container is np.ndarray:
+            dtype = binary_dtype(datatype, is_big_endian)
+            count = data_length // dtype.itemsize
+            # Receiving the data is the only copy, the array is a view of it
+            buffer = bytearray(
+                memoryview(block)[offset : offset + count * dtype.itemsize]
+            )
+            return np.frombuffer(buffer, dtype=dtype)
+        if datatype in "sp":
+            return from_binary_block(
+                block, offset, data_length, datatype, is_big_endian, container
+            )
+        byte_order = ">" if is_big_endian else "<"
+        count = data_length // struct.calcsize(byte_order + datatype)
+        values = struct.unpack_from(f"{byte_order}{count:d}{datatype}", block, offset)
+        return container(values)
+
+    # Query
 
     def query(self, message: str, delay: float | None = None) -> str:
         self.write(message)
         if delay is not None:
             time.sleep(delay)
         return self.read()
+
+    def query_ascii_values(
+        self,
+        message: str,
+        converter: ASCII_CONVERTER = "f",
+        separator: str = ",",
+        container: Any = list,
+        delay: float | None = None,
+    ) -> Any:
+        self.write(message)
+        if delay is not None:
+            time.sleep(delay)
+        return self.read_ascii_values(converter, separator, container)
+
+    def query_binary_values(
+        self,
+        message: str,
+        datatype: BINARY_DATATYPES = "f",
+        is_big_endian: bool = False,
+        container: Any = list,
+        delay: float | None = None,
+    ) -> Any:
+        self.write(message)
+        if delay is not None:
+            time.sleep(delay)
+        return self.read_binary_values(datatype, is_big_endian, container)
@@ -10,6 +10,8 @@ __all__ = ["NGE100Emulator"]
 class NGE100Emulator(Emulator):
     IDENTITY: str = "Rohde&Schwarz,NGE103B,5601.3800k03/101863,1.54"
 
+    message_separator: str | None = ";"
+
     def __init__(self, context: Context) -> None:
         super().__init__(context)
 
@@ -41,6 +43,14 @@ class NGE100Emulator(Emulator):
     def identify(self) -> str:
         return self.IDENTITY
 
+    @message(r"\*OPC\?$")
+    def get_operation_complete(self) -> str:
+        return "1"
+
+    @message(r"SYST(?:em)?:ERR(?:or)?(?::NEXT)?\?$")
+    def get_system_error(self) -> str:
+        return "0, 'No error'"
+
     @message(r"INST(?:rument)?\s+(\d)$")
     def set_channel(self, channel: int) -> None:
         self.selected_channel = int(channel) - 1
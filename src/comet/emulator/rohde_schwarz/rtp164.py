@@ -1,5 +1,7 @@
 """Rohde Schwarz RTP164 oscilloscope emulator"""
 
+import numpy as np
+
 from comet.emulator import BinaryResponse, Context, IEC60488Emulator, message, run
 from comet.emulator.utils import SCPIError, generate_waveform, scpi_parse_bool
 
@@ -19,6 +21,21 @@ class RTP164Emulator(IEC60488Emulator):
         self.num_samples: int = 1000
         self.duration: float = 1e-3
         self.channel_state: dict[int, bool] = {}
+        self.acquisition_count: int = 1
+        self.export_options: dict[str, bool] = {}
+        self.waveforms: dict[int, np.ndarray] = {}
+
+    def acquire_waveforms(self) -> None:
+        """Acquire waveforms of all channels for a single trigger."""
+        self.waveforms = {}
+        for channel in range(1, 5):
+            _, y = generate_waveform(
+                self.num_samples,
+                duration=self.duration,
+                spike_amplitude=2.0 / channel,
+                noise_std=0.01,
+            )
+            self.waveforms[channel] = y
 
     @message(r"\*IDN\?$")
     def identify(self) -> str:
@@ -59,7 +76,16 @@ class RTP164Emulator(IEC60488Emulator):
         self.format_data = format_length
 
     @message(r":?SING(?:LE)?$")
-    def set_single(self) -> None: ...
+    def set_single(self) -> None:
+        self.acquire_waveforms()
+
+    @message(r":?ACQ(?:uire)?:COUN(?:t)?\s+(\d+)$")
+    def set_acquisition_count(self, count) -> None:
+        self.acquisition_count = int(count)
+
+    @message(r":?EXP(?:ort)?:WAV(?:eform)?:(MULT|RAW|INCX)\s+(OFF|ON|0|1)$")
+    def set_export_option(self, option, enabled) -> None:
+        self.export_options[option] = scpi_parse_bool(enabled)
 
     @message(r":?CHAN([1-4]):STAT\?$")
     def get_channel_state(self, channel) -> str:
@@ -75,9 +101,9 @@ class RTP164Emulator(IEC60488Emulator):
 
     @message(r":?CHAN([1-4])(?::WAV([1-3]))?:DATA(?::VAL)?\?$")
     def get_channel_waveform_data(self, channel, waveform) -> BinaryResponse:
-        _, y = generate_waveform(
-            self.num_samples, duration=self.duration, noise_std=0.01
-        )  # TODO
+        if not self.waveforms:
+            self.acquire_waveforms()
+        y = self.waveforms[int(channel)]
         big_endian = self.format_border == "MSBF"
         return BinaryResponse.pack_real32(y, big_endian=big_endian)
 
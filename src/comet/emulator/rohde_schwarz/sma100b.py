@@ -9,6 +9,8 @@ __all__ = ["SMA100BEmulator"]
 class SMA100BEmulator(Emulator):
     IDENTITY: str = "Rohde&Schwarz,SMA100B,1419.8888K02/120399,5.00.122.24 SP1"
 
+    message_separator: str | None = ";"
+
     def __init__(self, context: Context) -> None:
         super().__init__(context)
 
@@ -23,6 +25,10 @@ class SMA100BEmulator(Emulator):
     def identify(self) -> str:
         return self.IDENTITY
 
+    @message(r"\*OPC\?$")
+    def get_operation_complete(self) -> str:
+        return "1"
+
     @message(r"\*RST$")
     def set_reset(self) -> None:
         self.average_count = 100
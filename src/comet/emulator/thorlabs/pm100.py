@@ -11,6 +11,8 @@ __all__ = ["PM100Emulator"]
 class PM100Emulator(Emulator):
     IDENTITY: str = "Thorlabs,PM100USB,P2004525,1.4.0"
 
+    message_separator: str | None = ";"
+
     def __init__(self, context: Context) -> None:
         super().__init__(context)
 
@@ -0,0 +1,162 @@
+"""Travel optimised ordering of motion controller positions."""
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .driver.generic.motion_controller import MotionController
+
+__all__ = ["path_travel_time", "plan_path", "scan_path", "travel_times"]
+
+MAX_PASSES: int = 100
+
+
+def travel_times(
+    points: ArrayLike, velocities: Iterable[float] | None = None
+) -> np.ndarray:
+    """Return matrix of travel times between all points.
+
+    Axes move simultaneously, the travel time between two points is given by
+    the slowest axis. Without velocities all axes move with unit velocity.
+
+    >>> travel_times(np.array([[0.0, 0.0], [3.0, 4.0]]), velocities=[1.0, 2.0])
+    array([[0., 3.],
+           [3., 0.]])
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if velocities is None:
+        velocities = np.ones(points.shape[1])
+    velocities = np.asarray(list(velocities), dtype=np.float64)
+    if velocities.shape != (points.shape[1],) or np.any(velocities <= 0):
+        raise ValueError(f"Invalid axis velocities: {velocities.tolist()!r}")
+    times = np.zeros((len(points), len(points)))
+    for axis, velocity in enumerate(velocities):
+        values = points[:, axis]
+        np.maximum(
+            times, np.abs(values[:, None] - values[None, :]) / velocity, out=times
+        )
+    return times
+
+
+def path_travel_time(
+    positions: ArrayLike,
+    order: Iterable[int] | None = None,
+    velocities: Iterable[float] | None = None,
+    start: Iterable[float] | None = None,
+) -> float:
+    """Return total travel time visiting positions in order, starting from
+    optional start position."""
+    points = np.asarray(positions, dtype=np.float64)
+    if order is not None:
+        points = points[np.fromiter(order, dtype=np.intp)]
+    if start is not None:
+        points = np.vstack([np.asarray(list(start), dtype=np.float64), points])
+    if len(points) < 2:
+        return 0.0
+    if velocities is None:
+        velocities = np.ones(points.shape[1])
+    velocities = np.asarray(list(velocities), dtype=np.float64)
+    steps = np.abs(np.diff(points, axis=0)) / velocities
+    return float(steps.max(axis=1).sum())
+
+
+def _nearest_neighbour(times: np.ndarray, first: int) -> np.ndarray:
+    count = len(times)
+    path = np.empty(count, dtype=np.intp)
+    visited = np.zeros(count, dtype=bool)
+    current = first
+    for index in range(count):
+        path[index] = current
+        visited[current] = True
+        if index + 1 < count:
+            row = np.where(visited, np.inf, times[current])
+            current = int(np.argmin(row))
+    return path
+
+
+def _two_opt(times: np.ndarray, path: np.ndarray, fixed_start: bool) -> np.ndarray:
+    """Improve open path by reversing segments until no reversal shortens
+    the total travel time."""
+    path = path.copy()
+    count = len(path)
+    for _ in range(MAX_PASSES):
+        improved = False
+        for i in range(1 if fixed_start else 0, count - 1):
+            b = path[i]
+            c = path[i + 1 :]
+            d = path[i + 2 :]
+            # Reversing path[i:j + 1] replaces edges (a, b) and (c, d) by
+            # (a, c) and (b, d), the last segment has no edge (c, d).
+            delta = np.zeros(len(c))
+            delta[:-1] = times[b, d] - times[c[:-1], d]
+            if i:
+                a = path[i - 1]
+                delta += times[a, c] - times[a, b]
+            else:
+                delta[-1] = np.inf  # reversing the whole path changes nothing
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-12:
+                path[i : i + j + 2] = path[i : i + j + 2][::-1]
+                improved = True
+        if not improved:
+            break
+    return path
+
+
+def plan_path(
+    positions: ArrayLike,
+    velocities: Iterable[float] | None = None,
+    start: Iterable[float] | None = None,
+    optimize: bool = True,
+) -> list[int]:
+    """Return order of positions minimising total travel time.
+
+    The path is constructed by nearest neighbour search beginning at the
+    start position (or the first position) and improved by 2-opt segment
+    reversals if `optimize` is set.
+
+    >>> plan_path([[0, 0], [10, 0], [1, 0]])
+    [0, 2, 1]
+    """
+    points = np.asarray(positions, dtype=np.float64)
+    if not len(points):
+        return []
+    if start is not None:
+        points = np.vstack([np.asarray(list(start), dtype=np.float64), points])
+    times = travel_times(points, velocities)
+    path = _nearest_neighbour(times, 0)
+    if optimize:
+        path = _two_opt(times, path, fixed_start=start is not None)
+    if start is not None:
+        path = path[1:] - 1
+    return path.tolist()
+
+
+def scan_path(
+    mc: MotionController,
+    positions: ArrayLike,
+    velocities: Iterable[float] | None = None,
+    timeout: float | None = None,
+) -> Iterator[int]:
+    """Move stage through positions in planned order beginning at the
+    current stage position, yields index of every position reached.
+
+    With `velocities` in position units per second, the expected duration of
+    every move is used for polling the motion controller.
+
+    >>> for index in scan_path(mc, positions, velocities=[10.0, 10.0, 1.0]):
+    ...     measure(index)
+    """
+    points = np.asarray(positions, dtype=np.float64).tolist()
+    if velocities is not None:
+        velocities = list(velocities)
+    current = list(mc.position)
+    for index in plan_path(points, velocities, start=current):
+        expected = 0.0
+        if velocities is not None:
+            expected = path_travel_time([current, points[index]], None, velocities)
+        mc.move_absolute(points[index])
+        mc.wait_until_idle(timeout, expected)
+        current = points[index]
+        yield index
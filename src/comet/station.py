@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager, ExitStack
 from pathlib import Path
 from typing import Any, Self, TextIO
@@ -13,6 +15,8 @@ from pyvisa.resources.resource import Resource
 from schema import And, Optional, Schema, SchemaError, Use
 
 from comet.driver import Driver, driver_factory
+from comet.driver.sync import WriteSync, WriteSyncMixin
+from comet.emulator.resource import EmulatorResource, open_emulator
 
 __all__ = ["Station"]
 
@@ -28,13 +32,28 @@ INSTRUMENT_SCHEMA: Schema = Schema(
         Optional("termination"): And(str, lambda s: len(s) > 0),
         Optional("timeout"): And(Use(float), lambda t: t > 0),  # type: ignore
         Optional("visa_library"): str,
+        Optional("write_sync"): WriteSync.is_valid_policy,
     }
 )
 
 DEFAULT_CONFIG_FILES: list[str] = ["station.yaml", "station.yml", "station.json"]
 
+EMULATOR_RESOURCE_SCHEME: str = "emulator://"
 
-def default_resource_factory(config: Config) -> Resource:
+
+def emulator_resource_factory(config: Config) -> EmulatorResource:
+    """Connect an instrument's model URN to an in-process emulator, bypassing
+    sockets and PyVISA."""
+    if "model" not in config:
+        raise ValueError(
+            f"Emulator resource {config['resource_name']!r} requires a model URN."
+        )
+    return open_emulator(config["model"])
+
+
+def default_resource_factory(config: Config) -> Resource | EmulatorResource:
+    if config["resource_name"].startswith(EMULATOR_RESOURCE_SCHEME):
+        return emulator_resource_factory(config)
     visa_library = config.get("visa_library", "@py")
     rm = pyvisa.ResourceManager(visa_library)
     resource_name = config["resource_name"]
@@ -57,19 +76,77 @@ def find_filenames(default_filenames: list[str]) -> list[str]:
     ]
 
 
+def create_driver(driver_cls: type[Driver], resource: Any, config: Config) -> Any:
+    """Create driver for resource and apply driver specific configuration."""
+    driver = driver_cls(resource)
+    if "write_sync" in config and isinstance(driver, WriteSyncMixin):
+        driver.write_sync.policy = config["write_sync"]
+    return driver
+
+
+def open_instrument(
+    config: Config, resource_factory: ResourceFactory, driver_cls: type[Driver]
+) -> tuple[ExitStack, Any]:
+    """Open resource and create driver, returns the resource's exit stack and
+    the driver instance."""
+    with ExitStack() as stack:
+        resource = stack.enter_context(resource_factory(config))
+        driver = create_driver(driver_cls, resource, config)
+        return stack.pop_all(), driver
+
+
+def close_instruments(stacks: list[ExitStack], max_workers: int) -> None:
+    """Close instrument exit stacks concurrently, re-raises the first error
+    after all stacks are closed."""
+    if not stacks:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(stack.close) for stack in stacks]
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+
+
 class Station(Mapping):
-    def __init__(self, *, resource_factory: ResourceFactory | None = None) -> None:
-        """Create an empty Station instance."""
+    def __init__(
+        self,
+        *,
+        resource_factory: ResourceFactory | None = None,
+        max_workers: int | None = None,
+        lazy: bool = False,
+    ) -> None:
+        """Create an empty Station instance.
+
+        Args:
+            resource_factory: Optional custom factory function.
+            max_workers: Open and close instruments concurrently using up to
+                `max_workers` threads, default is to open them one by one.
+            lazy: Open instruments on first access instead of when entering
+                the station context.
+        """
         self.instruments_config: Config = {}
         self._instruments: dict[str, Any] = {}
+        self._lazy_configs: dict[str, Config] = {}
+        self._lazy_locks: dict[str, threading.Lock] = {}
+        self._stack_lock = threading.Lock()
         self._stack: ExitStack | None = None
         self.resource_factory: ResourceFactory = (
             resource_factory or default_resource_factory
         )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+        self.max_workers: int | None = max_workers
+        self.lazy: bool = lazy
 
     @classmethod
     def from_config(
-        cls, config: Config, *, resource_factory: ResourceFactory | None = None
+        cls,
+        config: Config,
+        *,
+        resource_factory: ResourceFactory | None = None,
+        max_workers: int | None = None,
+        lazy: bool = False,
     ) -> Station:
         """
         Create a Station instance from a config dictionary.
@@ -83,6 +160,8 @@ class Station(Mapping):
                     }
                 }
             resource_factory: Optional custom factory function.
+            max_workers: Optional number of threads to open instruments.
+            lazy: Open instruments on first access.
         Returns:
             Configured Station instance (not yet entered).
         """
@@ -98,7 +177,9 @@ class Station(Mapping):
                     f"Invalid configuration for instrument {name!r}: {exc}"
                 )
 
-        station = cls(resource_factory=resource_factory)
+        station = cls(
+            resource_factory=resource_factory, max_workers=max_workers, lazy=lazy
+        )
         station.instruments_config = validated_configs
         return station
 
@@ -108,6 +189,8 @@ class Station(Mapping):
         config_file: str | Path | TextIO | None = None,
         *,
         resource_factory: Callable[[dict[str, Any]], Any] | None = None,
+        max_workers: int | None = None,
+        lazy: bool = False,
     ) -> Station:
         """
         Create a Station instance from a config file.
@@ -115,6 +198,8 @@ class Station(Mapping):
         Args:
             config_file: Optional config file name or file like object.
             resource_factory: Optional custom factory function.
+            max_workers: Optional number of threads to open instruments.
+            lazy: Open instruments on first access.
         Returns:
             Configured Station instance (not yet entered).
         """
@@ -157,7 +242,12 @@ class Station(Mapping):
         if not isinstance(config, dict):
             raise TypeError(f"Unsupported config file type: {config_file!r}")
 
-        return cls.from_config(config, resource_factory=resource_factory)
+        return cls.from_config(
+            config,
+            resource_factory=resource_factory,
+            max_workers=max_workers,
+            lazy=lazy,
+        )
 
     def add_instrument(self, name: str, /, **kwargs) -> None:
         if name in self.instruments_config:
@@ -182,13 +272,14 @@ class Station(Mapping):
             raise RuntimeError(
                 f"{type(self).__name__!r} context is not active, enter context first."
             )
-        return self._stack.enter_context(cm)
+        with self._stack_lock:
+            return self._stack.enter_context(cm)
 
     def __setattr__(self, name, value):
         """Prevent modifications to instrument attributes once they are set."""
-        if "_instruments" in self.__dict__ and name in self.__dict__.get(
-            "_instruments", {}
-        ):
+        instruments = self.__dict__.get("_instruments", {})
+        lazy_configs = self.__dict__.get("_lazy_configs", {})
+        if name in instruments or name in lazy_configs:
             raise AttributeError(
                 f"Cannot modify read-only instrument attribute {name!r}"
             )
@@ -199,34 +290,114 @@ class Station(Mapping):
         try:
             return instruments[name]
         except KeyError:
-            raise AttributeError(
-                f"{type(self).__name__!r} has no attribute {name!r}"
-            ) from None
+            pass
+        if name in self.__dict__.get("_lazy_configs", {}):
+            return self._open_lazy_instrument(name)
+        raise AttributeError(f"{type(self).__name__!r} has no attribute {name!r}")
 
     def __getitem__(self, name):
-        return self._instruments[name]
+        try:
+            return self._instruments[name]
+        except KeyError:
+            if name not in self._lazy_configs:
+                raise
+        return self._open_lazy_instrument(name)
 
     def __contains__(self, name):
-        return name in self._instruments
+        return name in self._instruments or name in self._lazy_configs
 
     def __iter__(self):
+        if self._lazy_configs:
+            return iter(self._lazy_configs)
         return iter(self._instruments)
 
     def __len__(self):
+        if self._lazy_configs:
+            return len(self._lazy_configs)
         return len(self._instruments)
 
-    def __enter__(self) -> Self:
-        self._stack = ExitStack()
-
-        for name, config in self.instruments_config.items():
-            resource = self._stack.enter_context(self.resource_factory(config))
+    def _open_lazy_instrument(self, name: str) -> Any:
+        """Open instrument on first access, attaching its resource to the
+        station's lifecycle. Concurrent accesses open an instrument only once."""
+        with self._lazy_locks[name]:
+            if name in self._instruments:
+                return self._instruments[name]
+            config = self._lazy_configs[name]
             driver_cls = (
                 driver_factory(config["model"]) if "model" in config else Driver
             )
-            self._instruments[name] = driver_cls(resource)
+            stack, driver = open_instrument(config, self.resource_factory, driver_cls)
+            try:
+                self.enter_context(stack)
+            except BaseException:
+                stack.close()
+                raise
+            self._instruments[name] = driver
+            return driver
+
+    def __enter__(self) -> Self:
+        self._stack = ExitStack()
+
+        try:
+            if self.lazy:
+                self._lazy_configs.update(self.instruments_config)
+                self._lazy_locks.update(
+                    {name: threading.Lock() for name in self._lazy_configs}
+                )
+            elif self.max_workers is None:
+                for name, config in self.instruments_config.items():
+                    resource = self._stack.enter_context(self.resource_factory(config))
+                    driver_cls = (
+                        driver_factory(config["model"]) if "model" in config else Driver
+                    )
+                    self._instruments[name] = create_driver(
+                        driver_cls, resource, config
+                    )
+            else:
+                self._open_instruments(self.max_workers)
+        except BaseException:
+            # Unwind already opened instruments
+            self.__exit__(None, None, None)
+            raise
 
         return self
 
+    def _open_instruments(self, max_workers: int) -> None:
+        """Open all instruments concurrently in a bounded thread pool.
+
+        Instruments are registered in configuration order and closed
+        concurrently when the station's exit stack unwinds. If opening any
+        instrument fails, all successfully opened instruments are closed.
+        """
+        assert self._stack is not None
+        driver_classes = {
+            name: driver_factory(config["model"]) if "model" in config else Driver
+            for name, config in self.instruments_config.items()
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    open_instrument,
+                    config,
+                    self.resource_factory,
+                    driver_classes[name],
+                )
+                for name, config in self.instruments_config.items()
+            }
+        stacks: list[ExitStack] = []
+        self._stack.callback(close_instruments, stacks, max_workers)
+        error: BaseException | None = None
+        for name, future in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                error = error or exc
+                continue
+            stack, driver = future.result()
+            stacks.append(stack)
+            self._instruments[name] = driver
+        if error is not None:
+            raise error
+
     def __exit__(
         self,
         exc_type: object,
@@ -238,3 +409,5 @@ class Station(Mapping):
 
         self._stack = None
         self._instruments.clear()
+        self._lazy_configs.clear()
+        self._lazy_locks.clear()
@@ -1,5 +1,7 @@
 import struct
 
+import numpy as np
+
 __all__ = [
     "pack_binary_values",
     "unpack_binary_values",
@@ -68,7 +70,15 @@ class MockResource:
         return len(message)
 
     def query_binary_values(
-        self, message: str, *, datatype: str = "f", is_big_endian: bool = False
-    ) -> list[float]:
+        self,
+        message: str,
+        *,
+        datatype: str = "f",
+        is_big_endian: bool = False,
+        container=list,
+    ):
         self.write(message)
-        return unpack_binary_values(self.buffer.pop(0), is_big_endian=is_big_endian)
+        values = unpack_binary_values(self.buffer.pop(0), is_big_endian=is_big_endian)
+        if container is np.ndarray:
+            return np.asarray(values)
+        return container(values)
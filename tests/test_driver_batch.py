@@ -0,0 +1,124 @@
+import pytest
+
+from comet.driver.batch import join_scpi_messages, join_tsp_messages
+from comet.driver.keithley import K2470, K2657A
+from comet.driver.rohde_schwarz import NGE100
+from comet.emulator.resource import open_emulator
+
+
+def test_join_scpi_messages():
+    assert join_scpi_messages([]) == []
+    assert join_scpi_messages(["*RST"]) == ["*RST"]
+    assert join_scpi_messages(["OUTP ON", ":SOUR:FUNC VOLT", "*CLS", "OUTP OFF"]) == [
+        "OUTP ON;:SOUR:FUNC VOLT;*CLS;:OUTP OFF"
+    ]
+
+
+def test_join_tsp_messages():
+    assert join_tsp_messages([]) == []
+    assert join_tsp_messages(["*RST", "a = 1", "b = 2", "*CLS", "c = 3"]) == [
+        "*RST",
+        "a = 1; b = 2",
+        "*CLS",
+        "c = 3",
+    ]
+
+
+def test_batch(resource):
+    driver = K2470(resource)
+    resource.buffer = ["1", '0,"no error"']
+    with driver.batch() as batch:
+        driver.function = driver.FUNCTION_VOLTAGE
+        driver.voltage_range = 20.0
+        driver.current_compliance = 1e-6
+        driver.output = driver.OUTPUT_ON
+    assert batch.errors == []
+    assert driver.resource is resource
+    assert resource.buffer == [
+        (
+            ":SOUR:FUNC:MODE VOLT;:SENS:FUNC 'CURR';:SOUR:VOLT:RANG 2.000000E+01;"
+            ":SOUR:VOLT:ILIM:LEV 1.000E-06;:OUTP:STAT ON"
+        ),
+        "*OPC?",
+        ":SYST:ERR:NEXT?",
+    ]
+
+
+def test_batch_errors(resource):
+    driver = K2470(resource)
+    resource.buffer = ["1", '-113,"Undefined header"', '0,"no error"']
+    with driver.batch() as batch:
+        driver.write(":SPAM")
+    assert [(error.code, error.message) for error in batch.errors] == [
+        (-113, "Undefined header")
+    ]
+
+
+def test_batch_query(resource):
+    driver = K2470(resource)
+    resource.buffer = ["VOLT", "1", '0,"no error"']
+    with driver.batch():
+        driver.output = driver.OUTPUT_ON
+        driver.reset()
+        assert driver.function == driver.FUNCTION_VOLTAGE
+        with driver.batch():
+            driver.clear()
+    assert resource.buffer == [
+        ":OUTP:STAT ON;*RST",
+        ":SOUR:FUNC:MODE?",
+        "*CLS",
+        "*OPC?",
+        ":SYST:ERR:NEXT?",
+    ]
+
+
+def test_batch_exception(resource):
+    driver = K2470(resource)
+    with pytest.raises(RuntimeError), driver.batch():
+        driver.reset()
+        raise RuntimeError()
+    assert driver.resource is resource
+    assert resource.buffer == []
+
+
+def test_batch_tsp(resource):
+    driver = K2657A(resource)
+    resource.buffer = ["1", "0.00000e+00\tNo Error\t0\t0"]
+    with driver.batch():
+        driver.reset()
+        driver.function = driver.FUNCTION_VOLTAGE
+        driver.voltage_level = 5.0
+    assert resource.buffer == [
+        "*RST",
+        "smua.source.func = 1; smua.source.levelv = 5.000000E+00",
+        "*OPC?",
+        "print(errorqueue.next())",
+    ]
+
+
+def test_batch_channels(resource):
+    driver = NGE100(resource)
+    resource.buffer = ["1", "0, 'No error'"]
+    with driver.batch():
+        for channel in driver:
+            channel.enabled = True
+    assert resource.buffer == [
+        "INSTrument 1;:OUTPut 1;:INSTrument 2;:OUTPut 1;:INSTrument 3;:OUTPut 1",
+        "*OPC?",
+        "SYSTem:ERRor?",
+    ]
+
+
+@pytest.mark.parametrize(
+    "driver_cls, model",
+    [(K2470, "keithley:2470"), (K2657A, "keithley:2657a")],
+)
+def test_batch_emulator(driver_cls, model):
+    driver = driver_cls(open_emulator(f"urn:comet:model:{model}"))
+    with driver.batch() as batch:
+        driver.function = driver.FUNCTION_CURRENT
+        driver.current_range = 1e-3
+    assert batch.errors == []
+    driver.invalidate()
+    assert driver.function == driver.FUNCTION_CURRENT
+    assert driver.current_range == 1e-3
@@ -0,0 +1,100 @@
+import pytest
+
+from comet.driver.cache import StateCache
+from comet.driver.keithley import K2400, K2700
+
+
+def test_state_cache():
+    cache = StateCache()
+    assert not cache.trusted
+    assert not cache.is_current("spam", 42)
+    cache.update("spam", 42)
+    cache.update("eggs", 1.0)
+    assert "spam" in cache
+    assert cache.get("spam") == 42
+    assert cache.is_current("spam", 42)
+    assert not cache.is_current("spam", 43)
+    cache.invalidate("spam")
+    assert "spam" not in cache
+    assert "eggs" in cache
+    cache.invalidate()
+    assert cache.values == {}
+
+
+def test_state_cache_disabled():
+    cache = StateCache(enabled=False)
+    cache.update("spam", 42)
+    assert not cache.is_current("spam", 42)
+
+
+def test_cached_setter(resource):
+    driver = K2400(resource)
+    resource.buffer = ["1", "1"]
+    driver.voltage_range = 20.0
+    driver.voltage_range = 20.0
+    driver.voltage_range = 200.0
+    assert resource.buffer == [
+        ":SOUR:VOLT:RANG 2.000000E+01",
+        "*OPC?",
+        ":SOUR:VOLT:RANG 2.000000E+02",
+        "*OPC?",
+    ]
+
+
+def test_cached_getter(resource):
+    driver = K2400(resource)
+    resource.buffer = ["FRON", "FRON"]
+    assert driver.route_terminal == "front"
+    driver.route_terminal = "front"  # known from getter
+    assert driver.route_terminal == "front"
+    assert resource.buffer == [":ROUT:TERM?", ":ROUT:TERM?"]
+    resource.buffer.clear()
+    driver.state_cache.trusted = True
+    assert driver.route_terminal == "front"
+    assert resource.buffer == []
+
+
+@pytest.mark.parametrize("method", ["reset", "clear", "invalidate"])
+def test_invalidate(resource, method):
+    driver = K2400(resource)
+    driver.write_sync.policy = "never"
+    driver.beeper = False
+    getattr(driver, method)()
+    resource.buffer.clear()
+    driver.beeper = False
+    assert resource.buffer == [":SYST:BEEP:STAT 0"]
+
+
+def test_cached_setter_error(resource, monkeypatch):
+    def write(message):
+        raise OSError()
+
+    driver = K2400(resource)
+    driver.write_sync.policy = "never"
+    driver.function = driver.FUNCTION_VOLTAGE
+    monkeypatch.setattr(resource, "write", write)
+    with pytest.raises(OSError):
+        driver.function = driver.FUNCTION_CURRENT
+    assert "function" not in driver.state_cache
+
+
+def test_batch_exception(resource):
+    driver = K2400(resource)
+    driver.write_sync.policy = "never"
+    with pytest.raises(RuntimeError), driver.batch():
+        driver.beeper = True
+        raise RuntimeError()
+    assert "beeper" not in driver.state_cache
+
+
+def test_ensure_sense_function(resource):
+    driver = K2700(resource)
+    resource.buffer = ["+1.0", "+2.0"]
+    driver.measure_voltage()
+    driver.measure_voltage()
+    assert resource.buffer == [
+        ":SENS:FUNC 'VOLT:DC'",
+        ":FORM:ELEM READ",
+        ":READ?",
+        ":READ?",
+    ]
@@ -1,4 +1,9 @@
-from comet.driver.generic import InstrumentError
+import numpy as np
+import pytest
+
+from comet.driver.generic import ChannelSet, InstrumentError, motion_controller
+from comet.driver.itk import CorvusTT
+from comet.driver.keithley import K237
 
 MESSAGE = "Nobody expects the Spanish Inquisition!"
 
@@ -8,3 +13,94 @@ def test_instrument_error():
     assert err.code == 42
     assert err.message == MESSAGE
     assert repr(err) == f"InstrumentError(42, '{MESSAGE}')"
+
+
+def test_channel_set():
+    channels = ("A1", "A2", "B1", "B2")
+    closed = ChannelSet.from_channels(channels, ["B2", "A1"])
+    target = ChannelSet.from_channels(channels, ["A1", "A2"])
+    assert list(closed) == ["A1", "B2"]
+    assert len(closed) == 2
+    assert "B2" in closed
+    assert "B1" not in closed
+    assert "C1" not in closed
+    assert list(closed - target) == ["B2"]
+    assert list(target - closed) == ["A2"]
+    assert list(closed | target) == ["A1", "A2", "B2"]
+    assert list(closed & target) == ["A1"]
+    assert closed == ChannelSet.from_channels(channels, ["A1", "B2", "A1"])
+    assert not ChannelSet(channels)
+    assert repr(closed) == "ChannelSet(['A1', 'B2'])"
+    with pytest.raises(ValueError):
+        ChannelSet.from_channels(channels, ["C1"])
+    with pytest.raises(ValueError):
+        _ = closed | ChannelSet.from_channels(("A1",), ["A1"])
+
+
+def test_measure_current_many(resource, monkeypatch):
+    readings = iter([1e-9, 2e-9, 3e-9])
+    smu = K237(resource)
+    monkeypatch.setattr(smu, "measure_current", lambda: next(readings))
+    result = smu.measure_current_many(3, interval=0.001)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [1e-9, 2e-9, 3e-9]
+    with pytest.raises(ValueError):
+        smu.measure_current_many(0)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(motion_controller, "time", clock)
+    return clock
+
+
+def test_wait_until_idle(clock):
+    states = iter([True, True, True, True, False])
+    assert motion_controller.wait_until_idle(lambda: next(states), expected=1.0) == 5
+    assert clock.sleeps == pytest.approx([0.5, 0.25, 0.125, 0.0625])
+
+    states = iter([True] * 5 + [False])
+    assert motion_controller.wait_until_idle(lambda: next(states)) == 6
+    assert clock.sleeps[-5:] == pytest.approx([0.01, 0.015, 0.0225, 0.03375, 0.050625])
+
+    clock.sleeps.clear()
+    clock.now = 0.0
+    states = iter([True] * 100)
+    with pytest.raises(TimeoutError):
+        motion_controller.wait_until_idle(
+            lambda: next(states), timeout=1.0, max_interval=0.2
+        )
+    assert max(clock.sleeps) == pytest.approx(0.2)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_move_absolute_and_wait(clock, resource):
+    driver = CorvusTT(resource)
+    resource.buffer = ["0.000 0.000 0.000", "1", "1", "0"]
+    assert driver.move_absolute_and_wait([3.0, 4.0, 0.0], velocity=10.0) == 3
+    assert resource.buffer == [
+        "pos",
+        "3.000 4.000 0.000 move",
+        "status",
+        "status",
+        "status",
+    ]
+    assert clock.sleeps == pytest.approx([0.25, 0.125])
+
+    resource.buffer = ["1", "0"]
+    assert driver[1].wait_until_idle(timeout=1.0) == 2
+    assert resource.buffer == ["status", "status"]
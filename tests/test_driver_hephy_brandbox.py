@@ -60,3 +60,13 @@ def test_channels(driver, resource):
     resource.buffer = ["OK"]
     assert driver.open_all_channels() is None
     assert resource.buffer == [":OPEN A1,A2,B1,B2,C1,C2"]
+
+
+def test_apply_channels(driver, resource):
+    resource.buffer = ["A1,B2", "OK", "OK"]
+    assert driver.apply_channels(["B2", "C1"]) is None
+    assert resource.buffer == [":CLOS:STAT?", ":OPEN A1", ":CLOS C1"]
+
+    resource.buffer = ["B2,C1"]
+    assert driver.apply_channels(["C1", "B2"]) is None
+    assert resource.buffer == [":CLOS:STAT?"]
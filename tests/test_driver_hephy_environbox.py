@@ -1,7 +1,13 @@
+import time
+
+import numpy as np
 import pytest
 
-from comet.driver.hephy import EnvironBox
-from comet.driver.hephy.environbox import parse_pc_data
+from comet.driver.hephy import EnvironBox, EnvironBoxSampler
+from comet.driver.hephy.environbox import PCData, parse_pc_data, parse_pc_snapshot
+from comet.emulator import open_emulator
+
+PC_DATA = "2,1.23,2.34,11.1,1,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,68,1,0,0,0,0,0,1,3.45,0.21,0.23,0.34,0,1,1,0"
 
 
 @pytest.fixture
@@ -225,3 +231,121 @@ def test_parse_pc_data():
     assert data["pid_prop_mode"] == 1
     assert data["pt100_1_enabled"]
     assert not data["pt100_2_enabled"]
+
+
+def test_parse_pc_snapshot():
+    data = parse_pc_snapshot(PC_DATA)
+    assert isinstance(data, PCData)
+    assert data.sensor_count == 2
+    assert data.box_humidity == 1.23
+    assert data.pid_status is True
+    assert data.pid_control_mode == 2
+    assert data.power_probecard_light is True
+    assert data.power_microscope_light is True
+    assert data.power_box_light is False
+    assert data.test_led is True
+    assert data.pt100_2 == 0.34
+    assert data._asdict() == parse_pc_data(PC_DATA)
+
+
+def test_pc_data_snapshot(driver, resource, monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("comet.driver.hephy.environbox.time.monotonic", lambda: now)
+    driver.pc_data_max_age = 1.0
+    resource.buffer = [PC_DATA]
+    assert driver.get_box_humidity() == 1.23
+    assert driver.get_box_temperature() == 2.34
+    assert driver.get_pid_control() == driver.PID_CONTROL_ON
+    assert driver.get_pid_control_mode() == driver.PID_CONTROL_MODE_DEW
+    assert driver.get_microscope_light() == driver.MICROSCOPE_LIGHT_ON
+    assert driver.get_probecard_light() == driver.PROBECARD_LIGHT_ON
+    assert driver.get_box_light() == driver.BOX_LIGHT_ON
+    assert driver.get_box_door_state() == driver.BOX_DOOR_CLOSED
+    assert driver.get_test_led() == driver.TEST_LED_ON
+    assert driver.get_chuck_temperature() == 0.23
+    assert driver.get_chuck_block_temperature() == 0.34
+    assert driver.get_box_lux() == 0.21
+    assert resource.buffer == ["GET:PC_DATA ?"]
+
+    now = 101.5  # expired
+    resource.buffer = [PC_DATA]
+    assert driver.get_box_humidity() == 1.23
+    assert resource.buffer == ["GET:PC_DATA ?"]
+
+    resource.buffer = ["OK", PC_DATA]
+    driver.set_probecard_light(driver.PROBECARD_LIGHT_OFF)
+    assert driver.get_probecard_light() == driver.PROBECARD_LIGHT_ON
+    assert resource.buffer == ["SET:PROBCARD_LIGHT OFF", "GET:PC_DATA ?"]
+
+    resource.buffer = [PC_DATA]
+    assert driver.get_pc_data(max_age=0).box_dewpoint == 11.1
+    assert resource.buffer == ["GET:PC_DATA ?"]
+
+
+def test_pc_data_snapshot_emulator():
+    driver = EnvironBox(open_emulator("urn:comet:model:hephy:environbox"))
+    driver.pc_data_max_age = 60.0
+    assert driver.get_microscope_light() == driver.MICROSCOPE_LIGHT_OFF
+    driver.set_microscope_light(driver.MICROSCOPE_LIGHT_ON)
+    assert driver.get_microscope_light() == driver.MICROSCOPE_LIGHT_ON
+    assert driver.get_pc_data() is driver.get_pc_data()
+
+
+def test_sampler_ring_buffer(driver, resource):
+    sampler = EnvironBoxSampler(driver, size=3)
+    assert sampler.latest().shape == (0, 7)
+    for index in range(4):
+        humidity = 10.0 + index
+        resource.buffer = [PC_DATA.replace("1.23", format(humidity), 1)]
+        sampler.sample()
+    assert sampler.count == 4
+    assert sampler.pc_data is not None
+    assert sampler.pc_data.box_humidity == 13.0
+    samples = sampler.latest()
+    assert samples.shape == (3, 7)
+    assert samples[:, sampler.column("box_humidity")].tolist() == [11.0, 12.0, 13.0]
+    assert samples[:, sampler.column("pt100_2")].tolist() == [0.34, 0.34, 0.34]
+    assert np.all(np.diff(samples[:, sampler.column("timestamp")]) >= 0)
+    assert np.shares_memory(samples, sampler._buffer)
+    assert not samples.flags.writeable
+    assert sampler.latest(2)[:, 1].tolist() == [12.0, 13.0]
+    for index in range(12):
+        if index == 3:  # valid for `size` samples
+            assert samples[:, 1].tolist() == [11.0, 12.0, 13.0]
+        humidity = 14.0 + index
+        resource.buffer = [PC_DATA.replace("1.23", format(humidity), 1)]
+        sampler.sample()
+        window = sampler.latest()[:, 1].tolist()
+        assert window == [humidity - 2, humidity - 1, humidity]
+    with pytest.raises(ValueError):
+        EnvironBoxSampler(driver, period=0)
+
+
+def test_sampler_emulator():
+    driver = EnvironBox(open_emulator("urn:comet:model:hephy:environbox"))
+    with EnvironBoxSampler(driver, period=0.001, size=8) as sampler:
+        assert sampler.is_alive()
+        timeout = time.monotonic() + 5.0
+        while sampler.count < 10 and time.monotonic() < timeout:
+            time.sleep(0.001)
+    assert not sampler.is_alive()
+    assert sampler.error is None
+    assert sampler.count >= 10
+    samples = sampler.latest()
+    assert samples.shape == (8, len(EnvironBoxSampler.COLUMNS))
+    assert not np.isnan(samples[:, sampler.column("box_humidity")]).any()
+
+
+def test_sampler_shares_lock(driver, resource):
+    sampler = EnvironBoxSampler(driver, period=60.0)
+    resource.buffer = ["OK"]
+    with driver.lock:
+        sampler.start()
+        time.sleep(0.05)
+        assert sampler.count == 0
+        driver.set_box_light(True)
+        assert resource.buffer == ["SET:BOX_LIGHT ON"]
+        resource.buffer = [PC_DATA]
+    sampler.stop()
+    assert sampler.error is None
+    assert sampler.count == 1
@@ -1,6 +1,7 @@
 import pytest
 
 from comet.driver.itk import CorvusTT
+from comet.emulator import open_emulator
 
 
 @pytest.fixture
@@ -23,11 +24,15 @@ def test_corvus(driver, resource):
 
     resource.buffer = ["3", "3", "3"]
     assert driver.is_calibrated
-    assert resource.buffer == ["1 getcaldone", "2 getcaldone", "3 getcaldone"]
+    assert resource.buffer == ["1 getcaldone 2 getcaldone 3 getcaldone"]
 
-    resource.buffer = ["3", "1"]
+    resource.buffer = ["3", "1", "3"]
     assert not driver.is_calibrated
-    assert resource.buffer == ["1 getcaldone", "2 getcaldone"]
+    assert resource.buffer == ["1 getcaldone 2 getcaldone 3 getcaldone"]
+
+    resource.buffer = ["3", "1", "0"]
+    assert driver.calibration_states == [3, 1, 0]
+    assert resource.buffer == ["1 getcaldone 2 getcaldone 3 getcaldone"]
 
     resource.buffer = []
     assert driver.move_absolute([0, 4.2]) is None
@@ -71,6 +76,11 @@ def test_corvus(driver, resource):
 
 
 def test_corvus_axes(driver, resource):
+    assert driver[1] is driver[1]
+    assert driver[1] is not driver[2]
+    with pytest.raises(IndexError):
+        driver[4]
+
     resource.buffer = []
     assert driver[1].calibrate() is None
     assert resource.buffer == ["1 ncal"]
@@ -98,3 +108,14 @@ def test_corvus_axes(driver, resource):
     resource.buffer = ["2"]
     assert not driver[1].is_moving
     assert resource.buffer == ["status"]
+
+
+def test_corvus_emulator():
+    with open_emulator("urn:comet:model:itk:corvustt") as resource:
+        driver = CorvusTT(resource)
+        assert driver.calibration_states == [3, 3, 3]
+        assert driver.is_calibrated
+        resource.write("reset 1 ncal 1 nrm 2 ncal")
+        assert driver.calibration_states == [3, 1, 0]
+        assert not driver.is_calibrated
+        assert not resource.buffer
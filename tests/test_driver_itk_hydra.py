@@ -1,6 +1,7 @@
 import pytest
 
 from comet.driver.itk import Hydra
+from comet.emulator import open_emulator
 
 
 @pytest.fixture
@@ -15,11 +16,11 @@ def test_hydra(driver, resource):
 
     resource.buffer = []
     assert driver.calibrate() is None
-    assert resource.buffer == ["1 ncal", "2 ncal"]
+    assert resource.buffer == ["1 ncal 2 ncal"]
 
     resource.buffer = []
     assert driver.range_measure() is None
-    assert resource.buffer == ["1 nrm", "2 nrm"]
+    assert resource.buffer == ["1 nrm 2 nrm"]
 
     resource.buffer = []
     assert driver.move_absolute([0, 4.2]) is None
@@ -31,7 +32,7 @@ def test_hydra(driver, resource):
 
     resource.buffer = []
     assert driver.abort() is None
-    assert resource.buffer == ["1 nabort", "2 nabort"]
+    assert resource.buffer == ["1 nabort 2 nabort"]
 
     resource.buffer = []
     assert driver.force_abort() is None
@@ -49,20 +50,29 @@ def test_hydra(driver, resource):
     assert not driver.is_moving
     assert resource.buffer == ["st"]
 
+    resource.buffer = ["24", "9"]
+    assert driver.axis_states == [24, 9]
+    assert resource.buffer == ["1 nst 2 nst"]
+
     resource.buffer = ["1", "0"]
     assert driver.joystick_enabled
-    assert resource.buffer == ["1 getmanctrl", "2 getmanctrl"]
+    assert resource.buffer == ["1 getmanctrl 2 getmanctrl"]
 
     resource.buffer = ["0", "0"]
     assert not driver.joystick_enabled
-    assert resource.buffer == ["1 getmanctrl", "2 getmanctrl"]
+    assert resource.buffer == ["1 getmanctrl 2 getmanctrl"]
 
     resource.buffer = []
     driver.joystick_enabled = True
-    assert resource.buffer == ["15 1 setmanctrl", "15 2 setmanctrl"]
+    assert resource.buffer == ["15 1 setmanctrl 15 2 setmanctrl"]
 
 
 def test_hydra_axes(driver, resource):
+    assert driver[1] is driver[1]
+    assert driver[1] is not driver[2]
+    with pytest.raises(IndexError):
+        driver[3]
+
     resource.buffer = []
     assert driver[1].calibrate() is None
     assert resource.buffer == ["1 ncal"]
@@ -86,3 +96,14 @@ def test_hydra_axes(driver, resource):
     resource.buffer = ["2"]
     assert not driver[1].is_moving
     assert resource.buffer == ["1 nst"]
+
+
+def test_hydra_emulator():
+    with open_emulator("urn:comet:model:itk:hydra") as resource:
+        driver = Hydra(resource)
+        assert driver.axis_states == [24, 24]
+        assert not driver.joystick_enabled
+        driver.joystick_enabled = True
+        assert driver.joystick_enabled
+        driver.abort()
+        assert not resource.buffer
@@ -2,6 +2,8 @@ import pytest
 
 from comet.driver.keithley import K2400
 
+from .helpers import pack_binary_values
+
 
 @pytest.fixture
 def driver(resource):
@@ -101,3 +103,165 @@ def test_measure_current(driver, resource):
     resource.buffer = ["1", "+4.200000E-06"]
     assert driver.measure_current() == 4.2e-06
     assert resource.buffer == [":FORM:ELEM CURR", "*OPC?", ":READ?"]
+
+
+def test_measure_format_elements(driver, resource):
+    resource.buffer = ["1", "+4.200000E-03", "+4.300000E-03", "1", "+4.200000E-06"]
+    assert driver.measure_voltage() == 4.2e-03
+    assert driver.measure_voltage() == 4.3e-03
+    assert driver.measure_current() == 4.2e-06
+    assert resource.buffer == [
+        ":FORM:ELEM VOLT",
+        "*OPC?",
+        ":READ?",
+        ":READ?",
+        ":FORM:ELEM CURR",
+        "*OPC?",
+        ":READ?",
+    ]
+
+
+def test_measure_voltage_current(driver, resource):
+    resource.buffer = ["1", "+4.200000E-03,+4.200000E-06"]
+    assert driver.measure_voltage_current() == (4.2e-03, 4.2e-06)
+    assert resource.buffer == [":FORM:ELEM VOLT,CURR", "*OPC?", ":READ?"]
+
+
+def test_measure_current_many(driver, resource):
+    resource.buffer = [
+        "1",
+        "+1.000000E+00",
+        "+5.000000E-01",
+        "1",
+        "+4.200000E-06,+4.300000E-06",
+        "1",
+    ]
+    readings = driver.measure_current_many(2)
+    assert readings.tolist() == [4.2e-06, 4.3e-06]
+    assert resource.buffer == [
+        ":FORM:ELEM CURR",
+        "*OPC?",
+        ":SENS:CURR:NPLC?",
+        ":TRIG:DEL?",
+        ":TRAC:CLE",
+        ":TRAC:POIN 2",
+        ":TRAC:FEED SENS",
+        ":TRAC:FEED:CONT NEXT",
+        ":TRIG:COUN 2",
+        ":TRIG:DEL 0.000000E+00",
+        ":INIT",
+        "*OPC?",
+        ":TRAC:DATA?",
+        ":TRAC:FEED:CONT NEV",
+        ":TRIG:COUN 1",
+        ":TRIG:DEL 5.000000E-01",
+        "*OPC?",
+    ]
+    with pytest.raises(ValueError):
+        driver.measure_current_many(2501)
+
+
+def test_measure_current_many_timeout(driver, resource):
+    timeouts = []
+    query = resource.query
+
+    def record_query(message):
+        if message == "*OPC?":
+            timeouts.append(resource.timeout)
+        return query(message)
+
+    driver.write_sync.policy = "never"
+    resource.timeout = 2000
+    resource.query = record_query
+    resource.buffer = ["+1.000000E+00", "+0.000000E+00", "1", "+4.200000E-06"]
+    driver.measure_current_many(1000, interval=0.01)
+    assert timeouts == [pytest.approx(2000 + 1000 * (0.01 + 0.04) * 1e3)]
+    assert resource.timeout == 2000
+
+
+def test_measure_current_many_software_fallback(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["+4.200000E-06"]
+    readings = driver.measure_current_many(1, interval=1000.0)
+    assert readings.tolist() == [4.2e-06]
+    assert ":INIT" not in resource.buffer
+
+
+def test_sweep_voltage(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["+1.000000E+00", "+1.000000E-06,+2.000000E-06"]
+    readings = driver.sweep_voltage([1.0, 2.0], delay=0.1)
+    assert readings.tolist() == [1e-06, 2e-06]
+    assert resource.buffer == [
+        ":SOUR:FUNC:MODE VOLT",
+        ":SENS:FUNC 'CURR'",
+        ":FORM:ELEM CURR",
+        ":SENS:CURR:NPLC?",
+        ":SOUR:VOLT:MODE LIST",
+        ":SOUR:LIST:VOLT 1.000000E+00,2.000000E+00",
+        ":SOUR:DEL 1.000000E-01",
+        ":SOUR:SWE:CAB EARL",
+        ":TRIG:COUN 2",
+        ":READ?",
+        ":SOUR:VOLT:MODE FIX",
+        ":SOUR:SWE:CAB NEV",
+        ":TRIG:COUN 1",
+    ]
+
+
+def test_sweep_voltage_timeout(driver, resource):
+    timeouts = []
+    query = resource.query
+
+    def record_query(message):
+        if message == ":READ?":
+            timeouts.append(resource.timeout)
+        return query(message)
+
+    driver.write_sync.policy = "never"
+    resource.timeout = 2000
+    resource.query = record_query
+    resource.buffer = ["+1.000000E+00", "+1.000000E-06,+2.000000E-06"]
+    driver.sweep_voltage([1.0, 2.0], delay=1.0)
+    assert timeouts == [pytest.approx(2000 + 2 * (1.0 + 0.04) * 1e3)]
+    assert resource.timeout == 2000
+
+
+def test_sweep_voltage_append(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["+1.000000E+00", ",".join(["+1.000000E-06"] * 150)]
+    readings = driver.sweep_voltage(range(150), compliance_abort=False)
+    assert len(readings) == 150
+    assert resource.buffer[5].startswith(":SOUR:LIST:VOLT 0.000000E+00,")
+    assert resource.buffer[6].startswith(":SOUR:LIST:VOLT:APP 1.000000E+02,")
+    assert ":SOUR:SWE:CAB NEV" in resource.buffer
+    with pytest.raises(ValueError):
+        driver.sweep_voltage([])
+
+
+def test_measure_current_many_real32(driver, resource):
+    driver.write_sync.policy = "never"
+    driver.data_format = driver.DATA_FORMAT_REAL32
+    resource.buffer = [
+        "+1.000000E+00",
+        "+0.000000E+00",
+        "1",
+        pack_binary_values([4.25e-06, 4.5e-06], is_big_endian=True),
+    ]
+    readings = driver.measure_current_many(2)
+    assert readings.tolist() == pytest.approx([4.25e-06, 4.5e-06])
+    assert resource.buffer[-6:] == [
+        ":FORM:DATA REAL,32",
+        ":FORM:BORD NORM",
+        ":TRAC:DATA?",
+        ":TRAC:FEED:CONT NEV",
+        ":TRIG:COUN 1",
+        ":TRIG:DEL 0.000000E+00",
+    ]
+    resource.buffer = ["+4.200000E-06"]
+    assert driver.measure_current() == 4.2e-06
+    assert resource.buffer == [":FORM:DATA ASC", ":READ?"]
+    driver.clear()
+    resource.buffer = ["+4.200000E-06"]
+    assert driver.measure_current() == 4.2e-06
+    assert resource.buffer == [":FORM:ELEM CURR", ":FORM:DATA ASC", ":READ?"]
@@ -1,6 +1,10 @@
+import numpy as np
 import pytest
 
 from comet.driver.keithley import K2470
+from comet.emulator import open_emulator
+
+from .helpers import pack_binary_values
 
 
 @pytest.fixture
@@ -101,3 +105,95 @@ def test_measure_current(driver, resource):
     resource.buffer = ["+4.200000E-06"]
     assert driver.measure_current() == 4.2e-06
     assert resource.buffer == [":MEAS:CURR?"]
+
+
+def test_measure_voltage_invalidates_function(driver, resource):
+    driver.write_sync.policy = "never"
+    driver.function = driver.FUNCTION_VOLTAGE
+    resource.buffer = ["+1.000000E+00"]
+    driver.measure_voltage()
+    resource.buffer = []
+    driver.function = driver.FUNCTION_VOLTAGE
+    assert resource.buffer == [":SOUR:FUNC:MODE VOLT", ":SENS:FUNC 'CURR'"]
+
+
+def test_measure_current_many(driver, resource):
+    resource.buffer = ["+1.000000E+00", "1", "+4.200000E-06,+4.300000E-06"]
+    readings = driver.measure_current_many(2, interval=0.5)
+    assert readings.tolist() == [4.2e-06, 4.3e-06]
+    assert resource.buffer == [
+        ":SENS:CURR:NPLC?",
+        ":SENS:FUNC 'CURR'",
+        ':TRAC:CLE "defbuffer1"',
+        ':TRIG:LOAD "SimpleLoop", 2, 5.000000E-01, "defbuffer1"',
+        ":INIT",
+        "*OPC?",
+        ':TRAC:DATA? 1, 2, "defbuffer1", READ',
+    ]
+
+
+def test_measure_current_many_invalidates_function(driver, resource):
+    driver.write_sync.policy = "never"
+    driver.function = driver.FUNCTION_CURRENT
+    resource.buffer = ["+1.000000E+00", "1", "+4.200000E-06"]
+    driver.measure_current_many(1)
+    resource.buffer = []
+    driver.function = driver.FUNCTION_CURRENT
+    assert resource.buffer == [":SOUR:FUNC:MODE CURR", ":SENS:FUNC 'VOLT'"]
+
+
+def test_sweep_voltage(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["+1.000000E+00", "1", "1", "+1.000000E-06"]
+    readings = driver.sweep_voltage([1.0, 2.0], delay=0.1)
+    assert readings.tolist() == [1e-06]
+    assert resource.buffer == [
+        ":SOUR:FUNC:MODE VOLT",
+        ":SENS:FUNC 'CURR'",
+        ":SENS:CURR:NPLC?",
+        ':TRAC:CLE "defbuffer1"',
+        ":SOUR:LIST:VOLT 1.000000E+00,2.000000E+00",
+        ':SOUR:SWE:VOLT:LIST 1, 1.000000E-01, 1, ON, OFF, "defbuffer1"',
+        ":INIT",
+        "*OPC?",
+        ':TRAC:ACT? "defbuffer1"',
+        ':TRAC:DATA? 1, 1, "defbuffer1", READ',
+    ]
+
+
+def test_measure_current_many_real32(driver, resource):
+    driver.write_sync.policy = "never"
+    driver.data_format = driver.DATA_FORMAT_REAL32
+    driver.byte_order = driver.BYTE_ORDER_LITTLE
+    resource.buffer = [
+        "+1.000000E+00",
+        "1",
+        pack_binary_values([4.25e-06, 4.5e-06], is_big_endian=False),
+    ]
+    readings = driver.measure_current_many(2)
+    assert readings.tolist() == pytest.approx([4.25e-06, 4.5e-06])
+    assert resource.buffer[-3:] == [
+        ":FORM:DATA SREAL",
+        ":FORM:BORD SWAP",
+        ':TRAC:DATA? 1, 2, "defbuffer1", READ',
+    ]
+    resource.buffer = [
+        "+1.000000E+00",
+        "1",
+        pack_binary_values([4.75e-06], is_big_endian=False),
+    ]
+    driver.measure_current_many(1)
+    assert resource.buffer[-1] == ':TRAC:DATA? 1, 1, "defbuffer1", READ'
+    assert ":FORM:DATA SREAL" not in resource.buffer
+
+
+@pytest.mark.parametrize("byte_order", [K2470.BYTE_ORDER_BIG, K2470.BYTE_ORDER_LITTLE])
+def test_sweep_voltage_real32_emulator(byte_order):
+    driver = K2470(open_emulator("urn:comet:model:keithley:2470"))
+    driver.data_format = driver.DATA_FORMAT_REAL32
+    driver.byte_order = byte_order
+    readings = driver.sweep_voltage([1.0, 2.0, 3.0], compliance_abort=False)
+    assert readings.dtype == np.float64
+    assert len(readings) == 3
+    driver.data_format = driver.DATA_FORMAT_ASCII
+    assert len(driver.measure_current_many(2)) == 2
@@ -1,6 +1,7 @@
 import pytest
 
 from comet.driver.keithley import K2657A
+from comet.emulator import open_emulator
 
 
 @pytest.fixture
@@ -73,3 +74,101 @@ def test_measure_current(driver, resource):
     resource.buffer = ["+4.200000E-06"]
     assert driver.measure_current() == 4.2e-06
     assert resource.buffer == ["print(smua.measure.i())"]
+
+
+def test_measure_current_many(driver, resource):
+    resource.buffer = ["1.00000e+00", "1", "4.20000e-06, 4.30000e-06", "1"]
+    readings = driver.measure_current_many(2)
+    assert readings.tolist() == [4.2e-06, 4.3e-06]
+    assert resource.buffer == [
+        "print(smua.measure.nplc)",
+        "smua.nvbuffer1.clear()",
+        "smua.measure.count = 2",
+        "smua.measure.interval = 0.000000E+00",
+        "smua.measure.i(smua.nvbuffer1)",
+        "*OPC?",
+        "printbuffer(1, smua.nvbuffer1.n, smua.nvbuffer1.readings)",
+        "smua.measure.count = 1",
+        "*OPC?",
+    ]
+
+
+def test_load_script(driver, resource):
+    resource.buffer = ["1", "1", "1"]
+    driver.load_script("spam", "a = 1\n\nb = 2\n")
+    driver.run_script("spam")
+    driver.delete_script("spam")
+    assert resource.buffer == [
+        "loadscript spam",
+        "a = 1",
+        "b = 2",
+        "endscript",
+        "*OPC?",
+        "spam()",
+        "*OPC?",
+        'script.delete("spam")',
+        "*OPC?",
+    ]
+    with pytest.raises(ValueError):
+        driver.load_script("spam eggs", "")
+    with pytest.raises(RuntimeError), driver.batch():
+        driver.load_script("spam", "")
+
+
+def test_read_buffer(driver, resource):
+    resource.buffer = ["4.20000e-06, 4.30000e-06", ""]
+    assert driver.read_buffer().tolist() == [4.2e-06, 4.3e-06]
+    assert driver.read_buffer("smua.nvbuffer2").tolist() == []
+    assert resource.buffer == [
+        "printbuffer(1, smua.nvbuffer1.n, smua.nvbuffer1.readings)",
+        "printbuffer(1, smua.nvbuffer2.n, smua.nvbuffer2.readings)",
+    ]
+
+
+def test_ramp_measure_current(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["1.00000e+00", "4.20000e-06, 4.30000e-06"]
+    readings = driver.ramp_measure_current([1.0, 2.0], delay=0.5)
+    assert readings.tolist() == [4.2e-06, 4.3e-06]
+    assert resource.buffer == [
+        "smua.source.func = 1",
+        "print(smua.measure.nplc)",
+        "loadscript comet_ramp",
+        "smua.nvbuffer1.clear()",
+        "smua.measure.count = 1",
+        "local levels = {",
+        "1.000000E+00,2.000000E+00,",
+        "}",
+        "for i = 1, #levels do",
+        "smua.source.levelv = levels[i]",
+        "delay(5.000000E-01)",
+        "smua.measure.i(smua.nvbuffer1)",
+        "end",
+        "endscript",
+        "comet_ramp()",
+        "printbuffer(1, smua.nvbuffer1.n, smua.nvbuffer1.readings)",
+    ]
+
+
+def test_ramp_measure_current_timeout(driver, resource):
+    timeouts = []
+    query = resource.query
+
+    def record_query(message):
+        if message == "*OPC?":
+            timeouts.append(resource.timeout)
+        return query(message)
+
+    resource.timeout = 2000
+    resource.query = record_query
+    resource.buffer = ["1", "1.00000e+00", "1", "1", "4.20000e-06"]
+    driver.ramp_measure_current([1.0] * 1000, delay=0.1)
+    assert timeouts == [2000, 2000, pytest.approx(2000 + 1000 * 0.14 * 1e3)]
+    assert resource.timeout == 2000
+
+
+def test_ramp_measure_current_emulator():
+    driver = K2657A(open_emulator("urn:comet:model:keithley:2657a"))
+    readings = driver.ramp_measure_current([index * 0.1 for index in range(250)])
+    assert len(readings) == 250
+    assert float(driver.tsp_print("smua.source.levelv")) == pytest.approx(24.9)
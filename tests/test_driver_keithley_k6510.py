@@ -37,6 +37,16 @@ def test_route_terminal(driver, resource):
     assert resource.buffer == [":ROUT:TERM?"]
 
 
+def test_route_terminal_not_cached(driver, resource):
+    driver.state_cache.trusted = True
+    for _ in range(2):
+        with pytest.warns(UserWarning):
+            driver.route_terminal = "rear"
+    resource.buffer = ["FRON"]
+    assert driver.route_terminal == "front"
+    assert resource.buffer == [":ROUT:TERM?"]
+
+
 def test_measure_voltage(driver, resource):
     resource.buffer = ["+4.200000E-03"]
     assert driver.measure_voltage() == 4.2e-03
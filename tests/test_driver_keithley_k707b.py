@@ -1,6 +1,7 @@
 import pytest
 
 from comet.driver.keithley import K707B
+from comet.emulator import open_emulator
 
 
 @pytest.fixture
@@ -55,3 +56,56 @@ def test_channels(driver, resource):
     resource.buffer = ["1"]
     assert driver.open_all_channels() is None
     assert resource.buffer == ['channel.open("allslots")', "*OPC?"]
+
+
+def test_apply_channels(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["1A01;1B02"]
+    assert driver.apply_channels(["1B02", "1C03"]) is None
+    assert resource.buffer == [
+        'print(channel.getclose("allslots"))',
+        'channel.open("1A01"); channel.close("1C03")',
+    ]
+
+    resource.buffer = []
+    driver.state_cache.trusted = True
+    assert list(driver.closed_channel_set) == ["1B02", "1C03"]
+    assert driver.apply_channels(["1C03", "1A10"]) is None
+    assert driver.apply_channels(["1C03", "1A10"]) is None
+    assert resource.buffer == ['channel.open("1B02"); channel.close("1A10")']
+
+    resource.buffer = []
+    driver.open_all_channels()
+    driver.apply_channels(["1A02"])
+    assert resource.buffer == ['channel.open("allslots")', 'channel.close("1A02")']
+
+    assert len(driver.CHANNELS) == 6 * 8 * 12
+    assert "6H12" in driver.CHANNELS
+
+
+def test_channels_not_listed(resource):
+    class Matrix(K707B):
+        CHANNELS = ("1A01", "1A02")
+
+    driver = Matrix(resource)
+    driver.write_sync.policy = "never"
+    driver.open_all_channels()
+    driver.close_channels(["1H01"])
+    assert driver.state_cache.get("closed_channel_set") is None
+    assert resource.buffer == ['channel.open("allslots")', 'channel.close("1H01")']
+
+    resource.buffer = ["1A01;1H01"]
+    driver.apply_channels(["1A02", "1H01"])
+    assert resource.buffer == [
+        'print(channel.getclose("allslots"))',
+        'channel.open("1A01"); channel.close("1A02")',
+    ]
+
+
+def test_apply_channels_emulator():
+    driver = K707B(open_emulator("urn:comet:model:keithley:707b"))
+    driver.close_channels(["1A01", "1A02"])
+    driver.apply_channels(["1A02", "1B01"])
+    assert driver.closed_channels == ["1A02", "1B01"]
+    driver.apply_channels([])
+    assert driver.closed_channels == []
@@ -94,3 +94,88 @@ def test_table_control_axes(driver, resource):
     resource.buffer = ["0"]
     assert not driver[1].is_moving
     assert resource.buffer == ["MOVE?"]
+
+
+def test_table_control_position_cache(driver, resource):
+    assert driver[3] is driver[3]
+
+    resource.buffer = []
+    driver.move_absolute((1.0, 2.0, 3.0))
+    assert resource.buffer == ["MOVE:ABS 1.000000,2.000000,3.000000"]
+
+    resource.buffer = []
+    driver[3].move_absolute(0.5)
+    driver[3].move_absolute(3.0)
+    assert resource.buffer == [
+        "MOVE:ABS 1.000000,2.000000,0.500000",
+        "MOVE:ABS 1.000000,2.000000,3.000000",
+    ]
+
+    resource.buffer = []
+    driver[1].move_relative(1.5)
+    driver[2].move_absolute(4.0)
+    assert resource.buffer == [
+        "MOVE:REL 1.500000,0.000000,0.000000",
+        "MOVE:ABS 2.500000,4.000000,3.000000",
+    ]
+    assert driver.target_position == (2.5, 4.0, 3.0)
+
+    resource.buffer = ["2.000000,4.000000,3.000000"]
+    assert driver.position == (2.0, 4.0, 3.0)
+    assert driver.target_position == (2.5, 4.0, 3.0)
+
+    resource.buffer = ["2.000000,4.000000,3.000000"]
+    driver.abort()
+    driver[3].move_absolute(0.0)
+    assert resource.buffer == [
+        "MOVE:ABORT",
+        "POS?",
+        "MOVE:ABS 2.000000,4.000000,0.000000",
+    ]
+
+    resource.buffer = ["2.000000,4.000000,0.000000"]
+    driver.joystick_enabled = True
+    driver[3].move_absolute(1.0)
+    assert resource.buffer == ["POS?", "MOVE:ABS 2.000000,4.000000,1.000000"]
+
+    with pytest.raises(IndexError):
+        driver.move_axes({4: 1.0})
+
+
+def test_table_control_error_invalidates_target(driver, resource):
+    resource.buffer = []
+    driver.move_absolute((1.0, 2.0, 300.0))
+    resource.buffer = ['0,"no error"']
+    assert driver.next_error() is None
+    assert driver.target_position == (1.0, 2.0, 300.0)
+
+    resource.buffer = ['42,"target out of range"']
+    assert driver.next_error() is not None
+    resource.buffer = ["1.000000,2.000000,100.000000"]
+    driver[1].move_absolute(1.5)
+    assert resource.buffer == ["POS?", "MOVE:ABS 1.500000,2.000000,100.000000"]
+
+
+def test_table_control_queue_moves(driver, resource):
+    resource.buffer = ["1.000000,2.000000,3.000000"]
+    with driver.queue_moves():
+        driver[1].move_absolute(10.0)
+        driver[3].move_absolute(0.5)
+        driver[3].move_relative(0.25)
+        driver[2].move_relative(-1.0)
+    assert resource.buffer == ["POS?", "MOVE:ABS 10.000000,1.000000,0.750000"]
+
+    resource.buffer = []
+    with driver.queue_moves():
+        pass
+    assert resource.buffer == []
+
+    resource.buffer = []
+    with pytest.raises(RuntimeError), driver.queue_moves():
+        driver[1].move_absolute(0.0)
+        raise RuntimeError
+    assert resource.buffer == []
+
+    resource.buffer = []
+    driver.move_axes({1: 5.0, 2: 6.0})
+    assert resource.buffer == ["MOVE:ABS 5.000000,6.000000,0.750000"]
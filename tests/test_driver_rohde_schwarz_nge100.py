@@ -1,6 +1,7 @@
 import pytest
 
 from comet.driver.rohde_schwarz.nge100 import NGE100
+from comet.emulator import open_emulator
 
 
 @pytest.fixture
@@ -117,3 +118,65 @@ def test_measure_power(driver, resource):
     resource.buffer = ["10.0"]
     assert driver[0].measure_power() == 10.0
     assert resource.buffer == ["INSTrument 1", "MEASure:SCALar:POWer?"]
+
+
+def test_select_channel(driver, resource):
+    driver.write_sync.policy = "never"
+    resource.buffer = ["1.0", "2.0", "3.0"]
+    channel = driver[1]
+    assert channel.measure_voltage() == 1.0
+    assert channel.measure_current() == 2.0
+    channel.enabled = True
+    assert driver[0].measure_power() == 3.0
+    assert resource.buffer == [
+        "INSTrument 2",
+        "MEASure:SCALar:VOLTage:DC?",
+        "MEASure:SCALar:CURRent:DC?",
+        "OUTPut 1",
+        "INSTrument 1",
+        "MEASure:SCALar:POWer?",
+    ]
+    assert driver.selected_channel == 0
+
+    resource.buffer = []
+    driver.reset()
+    assert driver.selected_channel is None
+    driver[0].enabled = False
+    assert resource.buffer == ["*RST", "INSTrument 1", "OUTPut 0"]
+
+
+def test_select_channel_batch_error(driver, resource):
+    with pytest.raises(RuntimeError), driver.batch():
+        driver[2].enabled = True
+        raise RuntimeError()
+    assert driver.selected_channel is None
+    assert resource.buffer == []
+
+
+def test_measure_all(driver, resource):
+    resource.buffer = ["1.0;0.1;0.1;2.0;0.2;0.4;3.0;0.3;0.9"]
+    assert driver.measure_all() == [(1.0, 0.1, 0.1), (2.0, 0.2, 0.4), (3.0, 0.3, 0.9)]
+    assert resource.buffer == [
+        (
+            "INSTrument 1;:MEASure:SCALar:VOLTage:DC?;:MEASure:SCALar:CURRent:DC?;"
+            ":MEASure:SCALar:POWer?;:INSTrument 2;:MEASure:SCALar:VOLTage:DC?;"
+            ":MEASure:SCALar:CURRent:DC?;:MEASure:SCALar:POWer?;:INSTrument 3;"
+            ":MEASure:SCALar:VOLTage:DC?;:MEASure:SCALar:CURRent:DC?;"
+            ":MEASure:SCALar:POWer?"
+        )
+    ]
+    assert driver.selected_channel == 2
+
+
+def test_measure_all_emulator():
+    driver = NGE100(open_emulator("urn:comet:model:rohde_schwarz:nge100"))
+    driver[0].voltage_level = 5.0
+    driver[0].current_limit = 1.0
+    driver[1].voltage_level = 2.0
+    driver[1].current_limit = 1.0
+    readings = driver.measure_all()
+    assert len(readings) == 3
+    assert readings[0] == (1.0, 1.0, 1.0)
+    assert readings[1] == (2.0, 0.002, 0.004)
+    assert driver.query("INSTrument?") == "3"
+    assert driver[2].measure_current() == 0.0
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from comet.driver.rohde_schwarz.rtp164 import RTP164
+from comet.emulator import open_emulator
 
 from .helpers import pack_binary_values
 
@@ -79,3 +81,119 @@ def test_channel_acquire_waveform(driver, resource):
     resource.buffer = ["1", pack_binary_values(values)]
     assert driver[1].acquire_waveform() == values
     assert resource.buffer == ["SING", "*OPC?", ":CHAN2:DATA?"]
+
+
+def test_time_axis(driver, resource):
+    resource.buffer = ["-0.1,0.1,3,1"]
+    assert driver.time_axis().tolist() == [-0.1, 0.0, 0.1]
+    assert resource.buffer == [":CHAN1:DATA:HEAD?"]
+
+    resource.buffer = []
+    assert driver.time_axis().tolist() == [-0.1, 0.0, 0.1]
+    assert not driver.time_axis().flags.writeable
+    assert resource.buffer == []
+
+    driver.invalidate()
+    resource.buffer = ["-0.2,0.2,3,1"]
+    assert driver.time_axis().tolist() == [-0.2, 0.0, 0.2]
+    assert resource.buffer == [":CHAN1:DATA:HEAD?"]
+
+
+def test_acquire(driver, resource):
+    resource.buffer = [
+        "1",
+        "-0.1,0.1,3,1",
+        pack_binary_values([2.0, 1.0, 1.5]),
+        pack_binary_values([0.5, -1.0, 0.0]),
+    ]
+    waveforms = driver.acquire(channels=[0, 3])
+    assert waveforms.dtype == np.float32
+    assert waveforms.tolist() == [[2.0, 1.0, 1.5], [0.5, -1.0, 0.0]]
+    assert resource.buffer == [
+        "SING",
+        "*OPC?",
+        ":CHAN1:DATA:HEAD?",
+        ":CHAN1:DATA?",
+        ":CHAN4:DATA?",
+    ]
+
+    resource.buffer = []
+    assert driver.time_axis().tolist() == [-0.1, 0.0, 0.1]
+    assert resource.buffer == []
+
+    resource.buffer = [
+        "0",
+        "1",
+        "0",
+        "0",
+        "1",
+        "-0.1,0.1,2,1",
+        pack_binary_values([1.0, 2.0]),
+    ]
+    waveforms = driver.acquire()
+    assert waveforms.tolist() == [[1.0, 2.0]]
+    assert resource.buffer == [
+        ":CHAN1:STAT?",
+        ":CHAN2:STAT?",
+        ":CHAN3:STAT?",
+        ":CHAN4:STAT?",
+        "SING",
+        "*OPC?",
+        ":CHAN2:DATA:HEAD?",
+        ":CHAN2:DATA?",
+    ]
+
+    with pytest.raises(IndexError):
+        driver.acquire(channels=[4])
+
+    resource.buffer = ["0", "0", "0", "0"]
+    with pytest.raises(ValueError):
+        driver.acquire()
+
+
+def test_acquire_time_axis(driver, resource):
+    resource.buffer = ["1", "-0.1,0.1,3,1", pack_binary_values([2.0, 1.0, 1.5])]
+    driver.acquire(channels=[0])
+    assert driver.time_axis().tolist() == [-0.1, 0.0, 0.1]
+
+    # same record length, changed sample interval
+    resource.buffer = ["1", "-0.2,0.2,3,1", pack_binary_values([2.0, 1.0, 1.5])]
+    driver.acquire(channels=[0])
+    assert driver.time_axis().tolist() == [-0.2, 0.0, 0.2]
+
+    # same record length and sample interval, changed position
+    resource.buffer = ["1", "0.0,0.4,3,1", pack_binary_values([2.0, 1.0, 1.5])]
+    driver.acquire(channels=[0])
+    assert driver.time_axis().tolist() == [0.0, 0.2, 0.4]
+    assert not driver.time_axis().flags.writeable
+    assert resource.buffer == [
+        "SING",
+        "*OPC?",
+        ":CHAN1:DATA:HEAD?",
+        ":CHAN1:DATA?",
+    ]
+
+
+def test_acquire_length_mismatch(driver, resource):
+    resource.buffer = [
+        "1",
+        "-0.1,0.1,3,1",
+        pack_binary_values([2.0, 1.0, 1.5]),
+        pack_binary_values([0.5, -1.0]),
+    ]
+    with pytest.raises(ValueError):
+        driver.acquire(channels=[0, 1])
+
+
+def test_acquire_emulator():
+    with open_emulator("urn:comet:model:rohde_schwarz:rtp164") as resource:
+        driver = RTP164(resource)
+        driver.configure()
+        assert driver.next_error() is None
+        driver[1].enabled = True
+        driver[2].enabled = True
+        waveforms = driver.acquire()
+        assert waveforms.shape == (2, 1000)
+        assert waveforms.dtype == np.float32
+        assert len(driver.time_axis()) == 1000
+        assert driver.acquire(channels=[0, 1, 2, 3]).shape == (4, 1000)
@@ -0,0 +1,105 @@
+import pytest
+
+from comet.driver.keithley import K2400
+from comet.driver.rohde_schwarz import NGE100
+from comet.driver.sync import WriteSync
+
+
+@pytest.fixture
+def driver(resource):
+    return K2400(resource)
+
+
+def test_write_sync_policy():
+    assert WriteSync().policy == "always"
+    assert WriteSync("never").policy == "never"
+    assert WriteSync("batch").policy == "batch"
+    assert WriteSync(4).policy == 4
+    for policy in ("spam", 0, -1, True, None):
+        with pytest.raises(ValueError):
+            WriteSync(policy)  # type: ignore
+
+
+def test_write_sync_always(driver, resource):
+    resource.buffer = ["1", "1"]
+    driver.reset()
+    driver.clear()
+    assert resource.buffer == ["*RST", "*OPC?", "*CLS", "*OPC?"]
+
+
+def test_write_sync_never(driver, resource):
+    driver.write_sync.policy = "never"
+    driver.reset()
+    driver.clear()
+    with driver.deferred_sync():
+        driver.reset()
+    assert resource.buffer == ["*RST", "*CLS", "*RST"]
+
+
+def test_write_sync_every(driver, resource):
+    driver.write_sync.policy = 2
+    resource.buffer = ["1", "1", "1"]
+    for _ in range(5):
+        driver.clear()
+    driver.sync()
+    assert resource.buffer == [
+        "*CLS",
+        "*CLS",
+        "*OPC?",
+        "*CLS",
+        "*CLS",
+        "*OPC?",
+        "*CLS",
+        "*OPC?",
+    ]
+
+
+def test_write_sync_batch(driver, resource):
+    driver.write_sync.policy = "batch"
+    resource.buffer = ["1"]
+    driver.reset()
+    with driver.deferred_sync():
+        driver.clear()
+        with driver.deferred_sync():
+            driver.clear()
+    driver.clear()
+    assert resource.buffer == ["*RST", "*CLS", "*CLS", "*OPC?", "*CLS"]
+
+
+def test_deferred_sync(driver, resource):
+    resource.buffer = ["1"]
+    with driver.deferred_sync():
+        driver.reset()
+        driver.clear()
+    assert resource.buffer == ["*RST", "*CLS", "*OPC?"]
+
+    resource.buffer = []
+    with pytest.raises(RuntimeError), driver.deferred_sync():
+        driver.reset()
+        raise RuntimeError()
+    assert resource.buffer == ["*RST"]
+
+
+def test_write_sync_shared_by_channels(resource):
+    driver = NGE100(resource)
+    driver.write_sync.policy = "never"
+    driver[0].enabled = True
+    assert resource.buffer == ["INSTrument 1", "OUTPut 1"]
+
+
+def test_sync_extends_timeout(driver, resource):
+    timeouts = []
+
+    def query(message):
+        timeouts.append(resource.timeout)
+        return "1"
+
+    resource.timeout = 2000
+    resource.query = query
+    driver.sync(12.5)
+    driver.sync()
+    assert timeouts == [14500, 2000]
+    assert resource.timeout == 2000
+    resource.timeout = float("inf")
+    driver.sync(12.5)
+    assert timeouts[-1] == float("inf")
@@ -1,8 +1,26 @@
+import gc
+import re
 import warnings
+import weakref
 
 import pytest
 
-from comet.emulator.emulator import emulator_cls_factory, get_routes
+from comet.emulator.emulator import (
+    CombinedRouteTable,
+    Context,
+    PrefixRouteTable,
+    Route,
+    RouteTable,
+    emulator_cls_factory,
+    get_route_table,
+    get_routes,
+    iter_emulator_classes,
+    literal_prefixes,
+    message,
+    route_tables,
+    set_default_route_engine,
+    split_message,
+)
 from comet.emulator.keithley.k2410 import K2410Emulator
 
 
@@ -25,3 +43,152 @@ def test_get_routes():
     assert r"\*IDN\?$" in route_patterns
     assert r"\*CLS$" in route_patterns
     assert r"\*CLS$" in route_patterns
+
+
+def test_get_route_table():
+    table = get_route_table(K2410Emulator)
+    assert table is get_route_table(K2410Emulator)
+    assert list(table.routes) == get_routes(K2410Emulator)
+    match = table.match(":SOUR:VOLT:LEV 4.2")
+    assert match is not None
+    route, args = match
+    assert route.method.__name__ == "set_source_level"
+    assert args == ("VOLT", "4.2")
+
+
+def test_route_table_invalidation():
+    class CustomEmulator(K2410Emulator):
+        pass
+
+    table = get_route_table(CustomEmulator)
+    CustomEmulator.get_spam = message(r"SPAM\?$")(lambda self: "eggs")
+    try:
+        assert get_route_table(CustomEmulator) is not table
+        assert CustomEmulator(Context())("SPAM?") == "eggs"
+    finally:
+        del CustomEmulator.get_spam
+    assert CustomEmulator(Context())("SPAM?") is None
+
+
+def test_route_table_released():
+    class CustomEmulator(K2410Emulator):
+        pass
+
+    get_route_table(CustomEmulator)
+    assert CustomEmulator in route_tables
+    ref = weakref.ref(CustomEmulator)
+    del CustomEmulator
+    gc.collect()
+    assert ref() is None
+
+
+def sample_messages(routes):
+    messages = ["", "*IDN?", ":SYST:ERR?", "SYST:ERR?", "GET:PC_DATA ?", "spam"]
+    for route in routes:
+        for prefix in literal_prefixes(route.pattern):
+            for suffix in ("", "?", " 1", " ON", ":LEV?", " 4.2E+00", "X"):
+                messages.append(prefix + suffix)
+    return messages
+
+
+@pytest.mark.parametrize(
+    "pattern, prefixes",
+    [
+        (r"\*IDN\?$", ["*IDN?"]),
+        (r":?SYST:BEEP\?$", ["SYST:BEEP?", ":SYST:BEEP?"]),
+        (r"(?::?SENS)?:FUNC\?$", [":FUNC?", "SENS:FUNC?", ":SENS:FUNC?"]),
+        (
+            r":?SOUR:(VOLT|CURR):RANG\?$",
+            [
+                "SOUR:VOLT:RANG?",
+                "SOUR:CURR:RANG?",
+                ":SOUR:VOLT:RANG?",
+                ":SOUR:CURR:RANG?",
+            ],
+        ),
+        (r"GET:PID_KP (.+)$", ["GET:PID_KP "]),
+        (r"a+b", ["a"]),
+        (r"(?i)idn", [""]),
+        (r".*", [""]),
+        (r"ab{0,1}c", ["ac", "abc"]),
+        (r"[ab]c", ["ac", "bc"]),
+        (r"[a-c]d", [""]),
+        (r"(?P<x>ab|cd)e", ["abe", "cde"]),
+        (r"(?=a)b", [""]),
+        (r"x\[\d", ["x["]),
+    ],
+)
+def test_literal_prefixes(pattern, prefixes):
+    assert literal_prefixes(re.compile(pattern)) == prefixes
+
+
+def test_prefix_route_table():
+    for cls in iter_emulator_classes():
+        routes = get_routes(cls)
+        linear_table = RouteTable(routes)
+        prefix_table = PrefixRouteTable(routes)
+        for message_ in sample_messages(routes):
+            assert prefix_table.match(message_) == linear_table.match(message_)
+
+
+@pytest.mark.parametrize("cls", list(iter_emulator_classes()))
+def test_combined_route_table(cls):
+    routes = get_routes(cls)
+    linear_table = RouteTable(routes)
+    combined_table = CombinedRouteTable(routes)
+    assert combined_table.pattern is not None
+    for message_ in sample_messages(routes):
+        assert combined_table.match(message_) == linear_table.match(message_)
+
+
+def test_combined_route_table_fallback():
+    routes = [Route(r"(a)\1$", lambda self: None), Route(r".*", lambda self: None)]
+    table = CombinedRouteTable(routes)
+    assert table.pattern is None
+    assert table.match("aa") == (routes[0], ("a",))
+    assert table.match("ab") == (routes[1], ())
+
+
+def test_route_engine():
+    class CustomEmulator(K2410Emulator):
+        route_engine = "combined"
+
+    assert isinstance(get_route_table(CustomEmulator), CombinedRouteTable)
+    assert CustomEmulator(Context())("*IDN?") == K2410Emulator.IDENTITY
+    CustomEmulator.route_engine = "linear"
+    assert type(get_route_table(CustomEmulator)) is RouteTable
+    assert CustomEmulator(Context())("*IDN?") == K2410Emulator.IDENTITY
+
+
+def test_set_default_route_engine():
+    assert isinstance(get_route_table(K2410Emulator), PrefixRouteTable)
+    set_default_route_engine("combined")
+    try:
+        assert isinstance(get_route_table(K2410Emulator), CombinedRouteTable)
+        assert K2410Emulator(Context())("*IDN?") == K2410Emulator.IDENTITY
+    finally:
+        set_default_route_engine("prefix")
+    with pytest.raises(ValueError):
+        set_default_route_engine("spam")
+
+
+@pytest.mark.parametrize(
+    "message, messages",
+    [
+        ("", []),
+        ("*RST", ["*RST"]),
+        ("*RST;:OUTP ON", ["*RST", ":OUTP ON"]),
+        (":SYST:BEEP 0; ;*CLS;", [":SYST:BEEP 0", "*CLS"]),
+        (":DISP:TEXT 'A;B';*CLS", [":DISP:TEXT 'A;B'", "*CLS"]),
+        ('print("A;B"); a = 1', ['print("A;B")', "a = 1"]),
+    ],
+)
+def test_split_message(message, messages):
+    assert split_message(message, ";") == messages
+
+
+def test_compound_message():
+    emulator = K2410Emulator(Context())
+    assert emulator(":SOUR:FUNC:MODE CURR;:SYST:BEEP:STAT 0") is None
+    assert emulator(":SOUR:FUNC:MODE?;:SYST:BEEP:STAT?") == "CURR;0"
+    assert emulator("*IDN?") == K2410Emulator.IDENTITY
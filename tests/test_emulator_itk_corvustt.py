@@ -95,3 +95,10 @@ def test_calibrate_range_measure(emulator):
         assert emulator(f"{axis} getcaldone") == "1"
         assert emulator(f"{axis} nrm") is None
         assert emulator(f"{axis} getcaldone") == "3"
+
+
+def test_command_line(emulator):
+    assert emulator("1 getcaldone 2 getcaldone 3 getcaldone") == ["3", "3", "3"]
+    assert emulator("reset 2 ncal 2 nrm 3 ncal") is None
+    assert emulator("1 getcaldone 2 getcaldone 3 getcaldone") == ["0", "3", "1"]
+    assert emulator("1.5 2 3 move pos") == "1.500000 2.000000 3.000000"
@@ -57,3 +57,16 @@ def test_calibration(emulator):
     assert emulator("2 ncal") is None
     assert emulator("1 nrangemeasure") is None
     assert emulator("2 nrm") is None
+
+
+def test_manual_control(emulator):
+    assert emulator("1 getmanctrl") == "0"
+    assert emulator("15 2 setmanctrl") is None
+    assert emulator("2 getmanctrl") == "15"
+    assert emulator("1 nabort") is None
+
+
+def test_command_line(emulator):
+    assert emulator("10 20 m 1 np 2 np") == ["10.0", "20.0"]
+    assert emulator("15 1 setmanctrl 1 getmanctrl 2 getmanctrl") == ["15", "0"]
+    assert emulator("1 ncal 2 ncal") is None
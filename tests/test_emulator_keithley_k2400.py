@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from comet.emulator import Context
+from comet.emulator import BinaryResponse, Context
 from comet.emulator.keithley.k2400 import K2400Emulator
 
 
@@ -131,3 +132,67 @@ def test_sense_function(emulator):
         assert emulator(f"{command}?") == "'CURR:DC'"
         assert emulator(f"{command} 'CURR'") is None
         assert emulator(f"{command}?") == "'CURR:DC'"  # TODO
+
+
+def test_trace_buffer(emulator):
+    assert emulator(":FORM:ELEM CURR") is None
+    assert emulator(":TRAC:CLE") is None
+    assert emulator(":TRAC:POIN 4") is None
+    assert emulator(":TRAC:POIN?") == "4"
+    assert emulator(":TRAC:FEED SENS") is None
+    assert emulator(":TRAC:FEED:CONT NEXT") is None
+    assert emulator(":TRIG:COUN 4") is None
+    assert emulator(":TRIG:COUN?") == "4"
+    assert emulator(":TRIG:DEL 0.1") is None
+    assert float(emulator(":TRIG:DEL?")) == 0.1
+    assert emulator(":INIT") is None
+    assert len(str(emulator(":TRAC:DATA?")).split(",")) == 4
+    assert emulator(":TRAC:FEED:CONT?") == "NEV"
+    assert len(str(emulator(":READ?")).split(",")) == 4
+
+
+def test_source_list_sweep(emulator):
+    assert emulator(":FORM:ELEM VOLT,CURR") is None
+    assert emulator(":SOUR:VOLT:MODE LIST") is None
+    assert emulator(":SOUR:VOLT:MODE?") == "LIST"
+    assert emulator(":SOUR:LIST:VOLT 1,2") is None
+    assert emulator(":SOUR:LIST:VOLT:APP 3") is None
+    assert emulator(":SOUR:LIST:VOLT:POIN?") == "3"
+    assert emulator(":SOUR:DEL 0.1") is None
+    assert float(emulator(":SOUR:DEL?")) == 0.1
+    assert emulator(":SOUR:SWE:CAB EARL") is None
+    assert emulator(":SOUR:SWE:CAB?") == "EARL"
+    assert emulator(":TRIG:COUN 3") is None
+    values = [float(value) for value in str(emulator(":READ?")).split(",")]
+    assert values[0::2] == [1.0, 2.0, 3.0]
+
+
+def test_source_list_sweep_compliance_abort():
+    emulator = K2400Emulator(Context(options={"curr.min": 1e-3, "curr.max": 1e-3}))
+    emulator(":FORM:ELEM CURR")
+    emulator(":SOUR:VOLT:MODE LIST")
+    emulator(":SOUR:LIST:VOLT 1,2,3")
+    emulator(":TRIG:COUN 3")
+    emulator(":SOUR:SWE:CAB EARL")
+    assert emulator(":READ?") == "1.050000E-05"
+    emulator(":SOUR:SWE:CAB NEV")
+    assert len(str(emulator(":READ?")).split(",")) == 3
+
+
+def test_format_data(emulator):
+    assert emulator(":FORM:DATA?") == "ASC"
+    assert emulator(":FORM:BORD?") == "NORM"
+    assert emulator(":FORM:ELEM CURR") is None
+    assert emulator(":FORM:DATA REAL,32") is None
+    assert emulator(":FORM:DATA?") == "REAL,32"
+    assert emulator(":TRIG:COUN 3") is None
+    response = emulator(":READ?")
+    assert isinstance(response, BinaryResponse)
+    assert bytes(response).startswith(b"#212")
+    assert np.frombuffer(response.data, dtype=">f4").shape == (3,)
+    assert emulator(":FORM:BORD SWAP") is None
+    assert emulator(":FORM:BORD?") == "SWAP"
+    values = np.frombuffer(emulator(":READ?").data, dtype="<f4")
+    assert all(1e-7 <= value <= 1e-6 for value in values)
+    assert emulator(":FORM:DATA ASC") is None
+    assert len(str(emulator(":READ?")).split(",")) == 3
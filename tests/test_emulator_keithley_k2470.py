@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from comet.emulator import Context
+from comet.emulator import BinaryResponse, Context
 from comet.emulator.keithley.k2470 import K2470Emulator
 
 
@@ -188,3 +189,59 @@ def test_trace_data(emulator):
     result = emulator(':TRAC:DATA? 1, 1, "defbuffer1", SOUR, READ')
     sour, read = str(result).split(",")
     assert float(sour), float(read)
+
+
+def test_trigger_simple_loop(emulator):
+    assert emulator(':TRAC:CLE "defbuffer1"') is None
+    assert emulator(':TRIG:LOAD "SimpleLoop", 4, 0.1, "defbuffer1"') is None
+    assert emulator(":INIT") is None
+    data = str(emulator(':TRAC:DATA? 1, 4, "defbuffer1", READ'))
+    assert len(data.split(",")) == 4
+    assert emulator(':TRAC:CLE "defbuffer1"') is None
+    assert emulator(':TRAC:DATA? 1, 4, "defbuffer1", READ') == ""
+
+
+def test_source_list_sweep(emulator):
+    assert emulator(':TRAC:CLE "defbuffer1"') is None
+    assert emulator(":SOUR:LIST:VOLT 1,2") is None
+    assert emulator(":SOUR:LIST:VOLT:APP 3") is None
+    assert emulator(":SOUR:LIST:VOLT:POIN?") == "3"
+    assert emulator(':SOUR:SWE:VOLT:LIST 1, 0.1, 1, ON, OFF, "defbuffer1"') is None
+    assert emulator(":INIT") is None
+    assert emulator(':TRAC:ACT? "defbuffer1"') == "3"
+    assert float(emulator(":SOUR:VOLT?")) == 3.0
+
+
+def test_source_list_sweep_fail_abort():
+    emulator = K2470Emulator(Context(options={"curr.min": 1e-3, "curr.max": 1e-3}))
+    emulator(":SOUR:LIST:VOLT 1,2,3")
+    emulator(":SOUR:SWE:VOLT:LIST 1, 0, 1, ON")
+    emulator(":INIT")
+    assert emulator(':TRAC:ACT? "defbuffer1"') == "1"
+    emulator(':TRAC:CLE "defbuffer1"')
+    emulator(":SOUR:SWE:VOLT:LIST 1, 0, 1, OFF")
+    emulator(":INIT")
+    assert emulator(":TRAC:ACT?") == "3"
+
+
+def test_source_list_sweep_dual(emulator):
+    emulator(":SOUR:LIST:VOLT 1,2,3")
+    emulator(':SOUR:SWE:VOLT:LIST 1, 0, 1, OFF, ON, "defbuffer1"')
+    emulator(":INIT")
+    assert emulator(":TRAC:ACT?") == "6"
+    assert float(emulator(":SOUR:VOLT?")) == 1.0
+
+
+def test_format_data(emulator):
+    assert emulator(":FORM:DATA?") == "ASC"
+    assert emulator(':TRIG:LOAD "SimpleLoop", 4, 0, "defbuffer1"') is None
+    assert emulator(":INIT") is None
+    assert emulator(":FORM:DATA SREAL") is None
+    assert emulator(":FORM:DATA?") == "SRE"
+    assert emulator(":FORM:BORD SWAP") is None
+    response = emulator(':TRAC:DATA? 1, 4, "defbuffer1", READ')
+    assert isinstance(response, BinaryResponse)
+    assert np.frombuffer(response.data, dtype="<f4").shape == (4,)
+    assert emulator("*RST") is None
+    assert emulator(":FORM:DATA?") == "ASC"
+    assert emulator(":FORM:BORD?") == "NORM"
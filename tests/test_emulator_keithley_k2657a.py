@@ -103,3 +103,53 @@ def test_source_protectv(emulator):
     assert float(emulator("print(smua.source.protectv)")) == 300
     assert emulator("smua.source.protectv = 0") is None
     assert float(emulator("print(smua.source.protectv)")) == 0
+
+
+def test_nvbuffer1(emulator):
+    assert emulator("smua.nvbuffer1.clear()") is None
+    assert emulator("smua.measure.count = 4") is None
+    assert float(emulator("print(smua.measure.count)")) == 4
+    assert emulator("smua.measure.interval = 0.1") is None
+    assert float(emulator("print(smua.measure.interval)")) == 0.1
+    assert emulator("smua.measure.i(smua.nvbuffer1)") is None
+    assert float(emulator("print(smua.nvbuffer1.n)")) == 4
+    data = str(emulator("printbuffer(1, 4, smua.nvbuffer1.readings)"))
+    assert len(data.split(",")) == 4
+
+
+def test_scripts(emulator):
+    assert emulator("loadscript spam") is None
+    assert emulator("smua.nvbuffer1.clear()") is None
+    assert emulator("smua.source.levelv = 1; smua.measure.i(smua.nvbuffer1)") is None
+    assert emulator("smua.source.levelv = 2; delay(0.1)") is None
+    assert emulator("smua.measure.i(smua.nvbuffer1)") is None
+    assert emulator("print(smua.nvbuffer1.n)") is None
+    assert emulator("endscript") is None
+    assert float(emulator("print(smua.nvbuffer1.n)")) == 0
+    response = emulator("spam()")
+    assert len(response) == 1
+    assert float(response[0]) == 2
+    assert float(emulator("print(smua.source.levelv)")) == 2
+    data = str(emulator("printbuffer(1, smua.nvbuffer1.n, smua.nvbuffer1.readings)"))
+    assert len(data.split(",")) == 2
+    assert emulator("spam.run()") is not None
+    assert emulator('script.delete("spam")') is None
+    assert emulator("spam()") is None
+    assert emulator("print(errorqueue.count)") == "1"
+
+
+def test_script_for_loop(emulator):
+    assert emulator("loadscript ramp") is None
+    assert emulator("smua.nvbuffer1.clear()") is None
+    assert emulator("local levels = {") is None
+    assert emulator("1.0,2.0,") is None
+    assert emulator("3.0}") is None
+    assert emulator("for i = 1, #levels do") is None
+    assert emulator("smua.source.levelv = levels[i]") is None
+    assert emulator("smua.measure.i(smua.nvbuffer1)") is None
+    assert emulator("end") is None
+    assert emulator("endscript") is None
+    assert emulator("ramp()") is None
+    assert float(emulator("print(smua.nvbuffer1.n)")) == 3
+    assert float(emulator("print(smua.source.levelv)")) == 3
+    assert emulator("print(errorqueue.count)") == "0"
@@ -47,3 +47,9 @@ def test_channels(emulator):
     assert emulator("print(errorqueue.count)") == "0"
     assert emulator('print(channel.getclose("allslots"))') == "nil"
     assert emulator("print(errorqueue.count)") == "0"
+
+
+def test_channels_open(emulator):
+    assert emulator('channel.close("1A01,1A07,1B02")') is None
+    assert emulator('channel.open("1A07"); channel.close("1C03")') is None
+    assert emulator('print(channel.getclose("allslots"))') == "1A01;1B02;1C03"
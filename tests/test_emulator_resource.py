@@ -1,4 +1,17 @@
-from comet.emulator import open_emulator
+import struct
+
+import numpy as np
+import pytest
+
+from comet.emulator import (
+    BinaryResponse,
+    Context,
+    Emulator,
+    RawResponse,
+    message,
+    open_emulator,
+)
+from comet.emulator.resource import EmptyBufferError, EmulatorResource
 
 
 def test_resource():
@@ -13,3 +26,90 @@ def test_resource_latin1():
     with open_emulator("urn:comet:model:nkt_photonics:pilas") as res:
         res.encoding = "latin-1"
         assert res.query("lht?") == "laser head temp.:\t     25.0 °C"
+
+
+def test_resource_binary_values():
+    with open_emulator("urn:comet:model:rohde_schwarz:rtp164") as res:
+        values = res.query_binary_values(":CHAN1:DATA?")
+        assert len(values) == 1000
+        assert all(isinstance(value, float) for value in values)
+
+
+def test_resource_raw():
+    with open_emulator("urn:comet:model:cts:itc") as res:
+        assert res.write_raw(b"P") == 1
+        assert res.read_bytes(2) == b"P0"
+        assert res.read_bytes(2) == b"00"
+        res.write_raw(b"P")
+        res.clear()
+        res.write_raw(b"P")
+        assert res.read_bytes(4) == b"P000"
+
+
+class MultiResponseEmulator(Emulator):
+    @message(r"MULTI\?$")
+    def get_multi(self):
+        return ["1.0,2.0", "3.0"]
+
+    @message(r"BLOCK\?$")
+    def get_block(self):
+        return BinaryResponse.pack_real32([1.0, 2.0, 3.0], big_endian=False)
+
+    @message(r"RAW\?$")
+    def get_raw(self):
+        return RawResponse(bytes(BinaryResponse.pack_real32([4.0, 5.0, 6.0])))
+
+    @message(r"LONG\?$")
+    def get_long(self):
+        return RawResponse(b"#18" + struct.pack("<2l", -1, 2))
+
+    @message(r"INDEFINITE\?$")
+    def get_indefinite(self):
+        return RawResponse(b"#0" + struct.pack("<3f", 1.0, 2.0, 3.0))
+
+
+def test_resource_multi_response():
+    res = EmulatorResource(MultiResponseEmulator(Context()))
+    res.write("MULTI?")
+    assert res.read() == "1.0,2.0"
+    assert res.read() == "3.0"
+    with pytest.raises(EmptyBufferError):
+        res.read()
+
+
+def test_resource_ascii_values():
+    res = EmulatorResource(MultiResponseEmulator(Context()))
+    assert res.query_ascii_values("MULTI?") == [1.0, 2.0]
+    assert res.read_ascii_values() == [3.0]
+    res.write("MULTI?")
+    assert res.read_raw() == b"1.0,2.0\n"
+
+
+def test_resource_binary_values_ndarray():
+    res = EmulatorResource(MultiResponseEmulator(Context()))
+    values = res.query_binary_values("BLOCK?", container=np.ndarray)
+    assert isinstance(values, np.ndarray)
+    assert values.dtype == np.dtype("<f4")
+    assert values.tolist() == [1.0, 2.0, 3.0]
+    assert res.query_binary_values("BLOCK?") == [1.0, 2.0, 3.0]
+    values = res.query_binary_values("RAW?", is_big_endian=True, container=np.ndarray)
+    assert values.tolist() == [4.0, 5.0, 6.0]
+    values[0] = 0.0  # writable like PyVISA results
+    assert not values.flags.owndata  # view of the receive buffer
+
+
+def test_resource_binary_values_standard_size():
+    res = EmulatorResource(MultiResponseEmulator(Context()))
+    assert res.query_binary_values("LONG?", datatype="l") == [-1, 2]
+    values = res.query_binary_values("LONG?", datatype="l", container=np.ndarray)
+    assert values.dtype == np.dtype("<i4")
+    assert values.tolist() == [-1, 2]
+    values = res.query_binary_values("LONG?", datatype="L", container=np.ndarray)
+    assert values.tolist() == [2**32 - 1, 2]
+
+
+def test_resource_binary_values_indefinite_length():
+    res = EmulatorResource(MultiResponseEmulator(Context()))
+    assert res.query_binary_values("INDEFINITE?") == [1.0, 2.0, 3.0]
+    values = res.query_binary_values("INDEFINITE?", container=np.ndarray)
+    assert values.tolist() == [1.0, 2.0, 3.0]
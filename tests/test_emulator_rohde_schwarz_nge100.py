@@ -13,6 +13,19 @@ def test_identify(emulator):
     assert emulator("*IDN?") == "Rohde&Schwarz,NGE103B,5601.3800k03/101863,1.54"
 
 
+def test_operation_complete(emulator):
+    assert emulator("*OPC?") == "1"
+
+
+def test_system_error(emulator):
+    assert emulator("SYSTem:ERRor?") == "0, 'No error'"
+
+
+def test_compound_message(emulator):
+    emulator("INSTrument 2;:OUTPut 1")
+    assert emulator("INSTrument?;:OUTPut?") == "2;1"
+
+
 def test_channel_selection(emulator):
 
     for channel in range(3):
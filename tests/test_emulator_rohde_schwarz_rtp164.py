@@ -28,3 +28,20 @@ def test_channe_waveform_data_value(emulator):
     assert bytes(emulator(":CHAN2:DATA:VAL?"))[:6] == b"#44000"
     assert bytes(emulator(":CHAN1:WAV1:DATA?"))[:6] == b"#44000"
     assert bytes(emulator(":CHAN2:WAV1:DATA:VAL?"))[:6] == b"#44000"
+
+
+def test_single_acquisition(emulator):
+    assert emulator("SING") is None
+    first = bytes(emulator(":CHAN1:DATA?"))
+    assert bytes(emulator(":CHAN1:DATA?")) == first
+    assert bytes(emulator(":CHAN2:DATA?")) != first
+    assert emulator("SING") is None
+    assert bytes(emulator(":CHAN1:DATA?")) != first
+
+
+def test_configure(emulator):
+    assert emulator("ACQ:COUN 1") is None
+    assert emulator("EXP:WAV:MULT OFF") is None
+    assert emulator("EXP:WAV:RAW OFF") is None
+    assert emulator("EXP:WAV:INCX OFF") is None
+    assert emulator("SYST:ERR?") == '0,"No error"'
@@ -15,6 +15,7 @@ def test_basic(emulator):
     )
     assert emulator("*RST") is None
     assert emulator("*CLS") is None
+    assert emulator("*OPC?") == "1"
 
     assert emulator(":SYST:ERR:NEXT?") == '0, "no error"'
 
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from comet.driver.itk import CorvusTT
+from comet.pathplan import path_travel_time, plan_path, scan_path, travel_times
+
+
+def test_travel_times():
+    points = np.array([[0.0, 0.0], [3.0, 4.0], [6.0, 0.0]])
+    assert travel_times(points).tolist() == [
+        [0.0, 4.0, 6.0],
+        [4.0, 0.0, 4.0],
+        [6.0, 4.0, 0.0],
+    ]
+    assert travel_times(points, velocities=[3.0, 1.0])[0].tolist() == [0.0, 4.0, 2.0]
+    with pytest.raises(ValueError):
+        travel_times(points, velocities=[1.0])
+    with pytest.raises(ValueError):
+        travel_times(points, velocities=[1.0, 0.0])
+
+
+def test_path_travel_time():
+    positions = [[0.0, 0.0], [3.0, 4.0], [6.0, 0.0]]
+    assert path_travel_time(positions) == 8.0
+    assert path_travel_time(positions, order=[0, 2, 1]) == 10.0
+    assert path_travel_time(positions, start=[6.0, 0.0]) == 14.0
+    assert path_travel_time([[1.0, 1.0]]) == 0.0
+
+
+def test_plan_path():
+    assert plan_path([]) == []
+    assert plan_path([[0, 0], [10, 0], [1, 0]]) == [0, 2, 1]
+    assert plan_path([[0, 0], [10, 0], [1, 0]], start=[12, 0]) == [1, 2, 0]
+
+
+def test_plan_path_improves():
+    rng = np.random.default_rng(42)
+    positions = rng.uniform(0, 100, (200, 2))
+    order = plan_path(positions)
+    nearest = plan_path(positions, optimize=False)
+    assert sorted(order) == list(range(200))
+    assert path_travel_time(positions, order) <= path_travel_time(positions, nearest)
+    assert path_travel_time(positions, order) < path_travel_time(positions) / 4
+
+
+def test_scan_path(resource):
+    mc = CorvusTT(resource)
+    positions = [[10.0, 0.0, 0.0], [1.0, 0.0, 0.0]]
+    resource.buffer = ["0.000 0.000 0.000", "0", "0"]
+    assert list(scan_path(mc, positions)) == [1, 0]
+    assert resource.buffer == [
+        "pos",
+        "1.000 0.000 0.000 move",
+        "status",
+        "10.000 0.000 0.000 move",
+        "status",
+    ]
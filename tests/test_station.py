@@ -1,9 +1,17 @@
+import threading
+import time
+from contextlib import contextmanager
 from io import StringIO
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from comet.station import Station, default_resource_factory
+from comet.emulator.resource import EmulatorResource
+from comet.station import (
+    Station,
+    default_resource_factory,
+    emulator_resource_factory,
+)
 
 
 @pytest.fixture
@@ -147,3 +155,197 @@ def test_add_and_update_instrument(mock_resource_factory):
     assert "smu" in station.instruments_config
     station.update_instrument("smu", termination="\n", timeout=3.0)
     assert station.instruments_config["smu"]["timeout"] == 3.0
+
+
+def test_station_concurrent_context():
+    events = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(3, timeout=5.0)
+
+    @contextmanager
+    def factory(config):
+        barrier.wait()  # all resources are opened concurrently
+        resource = MagicMock()
+        resource.query.return_value = config["resource_name"]
+        yield resource
+        with lock:
+            events.append(config["resource_name"])
+
+    config = {
+        "instruments": {
+            f"smu{i}": {
+                "resource_name": f"GPIB::{i}::INSTR",
+                "model": "urn:comet:model:keithley:2410",
+            }
+            for i in range(3)
+        }
+    }
+    station = Station.from_config(config, resource_factory=factory, max_workers=3)
+    with station:
+        assert list(station) == ["smu0", "smu1", "smu2"]
+        assert station.smu1.identify() == "GPIB::1::INSTR"
+    assert sorted(events) == ["GPIB::0::INSTR", "GPIB::1::INSTR", "GPIB::2::INSTR"]
+    assert len(station) == 0
+
+
+def test_station_concurrent_context_failure():
+    closed = []
+
+    @contextmanager
+    def factory(config):
+        if config["resource_name"] == "GPIB::1::INSTR":
+            raise OSError("no such resource")
+        yield MagicMock()
+        closed.append(config["resource_name"])
+
+    config = {
+        "instruments": {
+            f"smu{i}": {"resource_name": f"GPIB::{i}::INSTR"} for i in range(3)
+        }
+    }
+    station = Station.from_config(config, resource_factory=factory, max_workers=2)
+    with pytest.raises(OSError, match="no such resource"):
+        station.__enter__()
+    assert sorted(closed) == ["GPIB::0::INSTR", "GPIB::2::INSTR"]
+    assert len(station) == 0
+
+
+def test_station_context_failure():
+    closed = []
+
+    @contextmanager
+    def factory(config):
+        if config["resource_name"] == "GPIB::1::INSTR":
+            raise OSError("no such resource")
+        yield MagicMock()
+        closed.append(config["resource_name"])
+
+    config = {
+        "instruments": {
+            f"smu{i}": {"resource_name": f"GPIB::{i}::INSTR"} for i in range(3)
+        }
+    }
+    station = Station.from_config(config, resource_factory=factory)
+    with pytest.raises(OSError, match="no such resource"):
+        station.__enter__()
+    assert closed == ["GPIB::0::INSTR"]
+
+
+@patch("pyvisa.ResourceManager")
+def test_station_keeps_resource_manager_open(mock_rm_cls):
+    mock_rm = MagicMock()
+    mock_rm_cls.return_value = mock_rm
+
+    config = {
+        "instruments": {
+            "smu": {"resource_name": "GPIB::16::INSTR"},
+            "dmm": {"resource_name": "GPIB::18::INSTR"},
+        }
+    }
+    with Station.from_config(config):
+        assert mock_rm.open_resource.call_count == 2
+    # PyVISA shares resource managers per VISA library process wide, closing
+    # it would invalidate resource managers opened by application code.
+    mock_rm.close.assert_not_called()
+
+
+def test_station_lazy_context():
+    opened = []
+    lock = threading.Lock()
+
+    @contextmanager
+    def factory(config):
+        with lock:
+            opened.append(config["resource_name"])
+        time.sleep(0.01)
+        resource = MagicMock()
+        resource.query.return_value = config["resource_name"]
+        yield resource
+        with lock:
+            opened.remove(config["resource_name"])
+
+    config = {
+        "instruments": {
+            "smu": {
+                "resource_name": "GPIB::16::INSTR",
+                "model": "urn:comet:model:keithley:2410",
+            },
+            "dmm": {"resource_name": "GPIB::18::INSTR"},
+        }
+    }
+    station = Station.from_config(config, resource_factory=factory, lazy=True)
+    with station:
+        assert opened == []
+        assert list(station) == ["smu", "dmm"]
+        assert "dmm" in station
+        assert len(station) == 2
+        with pytest.raises(AttributeError):
+            station.smu = 42
+
+        threads = [
+            threading.Thread(target=lambda: station.smu.identify()) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert opened == ["GPIB::16::INSTR"]
+        assert station["smu"] is station.smu
+        assert station.smu.identify() == "GPIB::16::INSTR"
+
+        with pytest.raises(KeyError):
+            _ = station["spam"]
+        with pytest.raises(AttributeError):
+            _ = station.spam
+    assert opened == []
+    assert len(station) == 0
+    with pytest.raises(AttributeError):
+        _ = station.smu
+
+
+def test_station_emulator_resource():
+    config = {
+        "instruments": {
+            "smu": {
+                "resource_name": "emulator://",
+                "model": "urn:comet:model:keithley:2410",
+            },
+            "scope": {
+                "resource_name": "emulator://",
+                "model": "urn:comet:model:rohde_schwarz:rtp164",
+            },
+        }
+    }
+    with Station.from_config(config) as station:
+        assert isinstance(station.smu.resource, EmulatorResource)
+        assert station.smu.identify().startswith("Keithley Inc., Model 2410")
+        station.smu.voltage_level = 4.2
+        assert station.smu.voltage_level == 4.2
+        assert len(station.scope[0].acquire_waveform()) == 1000
+
+
+def test_emulator_resource_factory_requires_model():
+    with pytest.raises(ValueError):
+        emulator_resource_factory({"resource_name": "emulator://"})
+
+
+def test_station_write_sync(mock_resource_factory):
+    config = {
+        "instruments": {
+            "smu": {
+                "resource_name": "GPIB::16::INSTR",
+                "model": "urn:comet:model:keithley:2410",
+                "write_sync": "never",
+            },
+            "dmm": {
+                "resource_name": "GPIB::18::INSTR",
+                "model": "urn:comet:model:keithley:2700",
+            },
+        }
+    }
+    with Station.from_config(config, resource_factory=mock_resource_factory) as station:
+        assert station.smu.write_sync.policy == "never"
+    with pytest.raises(ValueError):
+        Station.from_config(
+            {"instruments": {"smu": {"resource_name": "GPIB::16", "write_sync": 0}}}
+        )